@@ -1,5 +1,14 @@
 """Forward Kinematics functions for RASW."""
 
-from .forward_kinematics import calculate_fk
+from .forward_kinematics import calculate_fk, calculate_fk_batch
+from .jacobian import calculate_jacobian, condition_number, manipulability
+from .quantized import QuantizedFK
 
-__all__ = ["calculate_fk"] 
\ No newline at end of file
+__all__ = [
+    "QuantizedFK",
+    "calculate_fk",
+    "calculate_fk_batch",
+    "calculate_jacobian",
+    "condition_number",
+    "manipulability",
+]
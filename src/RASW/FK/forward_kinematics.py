@@ -22,13 +22,17 @@ def rotate_vector(vector: np.ndarray, angle: float) -> np.ndarray:
 
 
 def calculate_fk(
-    arm_lengths: List[float], joint_angles: List[float]
+    arm_lengths: List[float],
+    joint_angles: List[float],
+    base: Optional[Tuple[float, float, float]] = None,
 ) -> Tuple[List[Tuple[float, float]], Optional[str]]:
     """Calculate forward kinematics for a multi-joint planar robotic arm.
 
     Args:
         arm_lengths: List of arm segment lengths
         joint_angles: List of joint angles in degrees
+        base: Base pose (x, y, theta) with theta in degrees, the origin
+              facing along +x by default
 
     Returns:
         Tuple containing:
@@ -41,11 +45,13 @@ def calculate_fk(
     # Convert angles to radians
     angles_rad = [math.radians(angle) for angle in joint_angles]
 
-    # First joint position at origin
-    joint_positions = [(0.0, 0.0)]
+    base_x, base_y, base_theta = base if base is not None else (0.0, 0.0, 0.0)
 
-    # Initialize cumulative angle
-    cumulative_angle = 0.0
+    # First joint position at the base
+    joint_positions = [(float(base_x), float(base_y))]
+
+    # Initialize cumulative angle with the base heading
+    cumulative_angle = math.radians(base_theta)
 
     # Calculate positions for each joint
     for i in range(len(arm_lengths)):
@@ -64,3 +70,75 @@ def calculate_fk(
         joint_positions.append((float(new_joint[0]), float(new_joint[1])))
 
     return joint_positions, None
+
+
+def _cumulative_sin_cos(joint_angles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute cos/sin of the cumulative joint angles for a batch of poses.
+
+    Args:
+        joint_angles: Array of shape (..., J) with joint angles in degrees
+
+    Returns:
+        Tuple (cos, sin) of arrays with the same shape as joint_angles
+    """
+    cumulative = np.cumsum(np.radians(joint_angles), axis=-1)
+    return np.cos(cumulative), np.sin(cumulative)
+
+
+def _fk_from_sin_cos(
+    arm_lengths: np.ndarray, cos: np.ndarray, sin: np.ndarray
+) -> np.ndarray:
+    """Build joint positions from precomputed cumulative cos/sin values.
+
+    Args:
+        arm_lengths: Array of shape (J,) or broadcastable to cos
+        cos: Array of shape (..., J) with cosines of the cumulative angles
+        sin: Array of shape (..., J) with sines of the cumulative angles
+
+    Returns:
+        Array of shape (..., J + 1, 2) with the base at the origin
+    """
+    positions = np.zeros(cos.shape[:-1] + (cos.shape[-1] + 1, 2))
+    np.cumsum(arm_lengths * cos, axis=-1, out=positions[..., 1:, 0])
+    np.cumsum(arm_lengths * sin, axis=-1, out=positions[..., 1:, 1])
+    return positions
+
+
+def _apply_base(joint_angles: np.ndarray, base: Optional[np.ndarray]) -> np.ndarray:
+    """Add the base heading to the first joint angle of every pose."""
+    if base is None:
+        return joint_angles
+    joint_angles = joint_angles.copy()
+    joint_angles[..., 0] += np.asarray(base, dtype=float)[..., 2]
+    return joint_angles
+
+
+def calculate_fk_batch(
+    arm_lengths: List[float],
+    joint_angles: np.ndarray,
+    base: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, Optional[str]]:
+    """Calculate forward kinematics for a batch of arm configurations.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        joint_angles: Array of shape (N, J) with joint angles in degrees
+        base: Base pose (x, y, theta) with theta in degrees, shape (3,) or
+              (N, 3) for one base per row, the origin facing +x by default
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, J + 1, 2) with joint positions including the
+          base and the end effector
+        - Error message if any, None otherwise
+    """
+    arm_lengths = np.asarray(arm_lengths, dtype=float)
+    joint_angles = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+    if arm_lengths.shape[-1] != joint_angles.shape[-1]:
+        return np.empty((0, 0, 2)), "Number of arm lengths must match number of joint angles"
+
+    cos, sin = _cumulative_sin_cos(_apply_base(joint_angles, base))
+    positions = _fk_from_sin_cos(arm_lengths, cos, sin)
+    if base is not None:
+        positions += np.asarray(base, dtype=float)[..., None, :2]
+    return positions, None
@@ -0,0 +1,87 @@
+"""Analytic Jacobian and manipulability measures for planar robotic arms."""
+
+import numpy as np
+from typing import List, Tuple, Optional
+
+from .forward_kinematics import _cumulative_sin_cos
+
+
+def _jacobian_from_sin_cos(
+    arm_lengths: np.ndarray, cos: np.ndarray, sin: np.ndarray
+) -> np.ndarray:
+    """Build the planar Jacobian from precomputed cumulative cos/sin values.
+
+    Joint i moves every link from i onwards, so its column is the reversed
+    cumulative sum of the link vectors rotated by 90 degrees.
+
+    Args:
+        arm_lengths: Array of shape (J,) or broadcastable to cos
+        cos: Array of shape (..., J) with cosines of the cumulative angles
+        sin: Array of shape (..., J) with sines of the cumulative angles
+
+    Returns:
+        Array of shape (..., 2, J)
+    """
+    link_x = arm_lengths * cos
+    link_y = arm_lengths * sin
+    jacobian = np.empty(cos.shape[:-1] + (2, cos.shape[-1]))
+    jacobian[..., 0, :] = -np.cumsum(link_y[..., ::-1], axis=-1)[..., ::-1]
+    jacobian[..., 1, :] = np.cumsum(link_x[..., ::-1], axis=-1)[..., ::-1]
+    return jacobian
+
+
+def calculate_jacobian(
+    arm_lengths: List[float], joint_angles: np.ndarray
+) -> Tuple[np.ndarray, Optional[str]]:
+    """Calculate the end effector Jacobian for a batch of arm configurations.
+
+    The Jacobian maps joint velocities in radians per unit time to end
+    effector velocities in length units per unit time.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        joint_angles: Array of shape (N, J) with joint angles in degrees
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, 2, J) with one Jacobian per configuration
+        - Error message if any, None otherwise
+    """
+    arm_lengths = np.asarray(arm_lengths, dtype=float)
+    joint_angles = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+    if arm_lengths.shape[-1] != joint_angles.shape[-1]:
+        return np.empty((0, 2, 0)), "Number of arm lengths must match number of joint angles"
+
+    cos, sin = _cumulative_sin_cos(joint_angles)
+    return _jacobian_from_sin_cos(arm_lengths, cos, sin), None
+
+
+def manipulability(jacobian: np.ndarray) -> np.ndarray:
+    """Calculate Yoshikawa's manipulability measure sqrt(det(J J^T)).
+
+    Args:
+        jacobian: Array of shape (..., 2, J)
+
+    Returns:
+        Array of shape (...) that drops to zero at singular configurations
+    """
+    jjt = jacobian @ np.swapaxes(jacobian, -1, -2)
+    det = jjt[..., 0, 0] * jjt[..., 1, 1] - jjt[..., 0, 1] * jjt[..., 1, 0]
+    return np.sqrt(np.maximum(det, 0.0))
+
+
+def condition_number(jacobian: np.ndarray) -> np.ndarray:
+    """Calculate the condition number of the Jacobian.
+
+    The ratio of the largest to the smallest singular value grows without
+    bound as the arm approaches a singularity.
+
+    Args:
+        jacobian: Array of shape (..., 2, J)
+
+    Returns:
+        Array of shape (...), infinite at singular configurations
+    """
+    singular_values = np.linalg.svd(jacobian, compute_uv=False)
+    with np.errstate(divide="ignore"):
+        return singular_values[..., 0] / singular_values[..., -1]
@@ -0,0 +1,121 @@
+"""Lookup-table forward kinematics for servos with a fixed angular resolution."""
+
+import math
+import numpy as np
+from typing import List, Tuple, Optional
+
+from .forward_kinematics import _fk_from_sin_cos
+
+
+class QuantizedFK:
+    """Forward kinematics using precomputed sin/cos tables.
+
+    Hobby servos only accept angles on a fixed grid (whole degrees, tenths of
+    a degree, ...). Angles on that grid are stored as integer steps, so the
+    cumulative angle of each link is an integer sum that indexes straight into
+    the tables and no trigonometry is evaluated at run time.
+
+    Angles that are not on the grid are rounded to the nearest step first.
+    Use `error_bound` to get the worst case position error this introduces.
+
+    Args:
+        resolution: Servo step size in degrees, must divide 360 evenly
+    """
+
+    def __init__(self, resolution: float = 1.0):
+        if not resolution > 0:
+            raise ValueError("Resolution must be a positive divisor of 360 degrees")
+        steps = 360.0 / resolution
+        if abs(steps - round(steps)) > 1e-9:
+            raise ValueError("Resolution must be a positive divisor of 360 degrees")
+
+        self.resolution = resolution
+        self.steps = int(round(steps))
+        table_angles = np.arange(self.steps) * (2 * math.pi / self.steps)
+        self.cos_table = np.cos(table_angles)
+        self.sin_table = np.sin(table_angles)
+
+    def to_steps(self, joint_angles: np.ndarray) -> np.ndarray:
+        """Round joint angles in degrees to integer servo steps."""
+        return np.rint(np.asarray(joint_angles, dtype=float) / self.resolution).astype(
+            np.int64
+        )
+
+    def rotate_vector(self, vector: np.ndarray, angle_steps: int) -> np.ndarray:
+        """Rotate a 2D vector by a whole number of servo steps.
+
+        Args:
+            vector: A 2D numpy array representing the vector to rotate
+            angle_steps: Angle as an integer number of servo steps
+
+        Returns:
+            The rotated vector
+        """
+        index = angle_steps % self.steps
+        c, s = self.cos_table[index], self.sin_table[index]
+        return np.array([c * vector[0] - s * vector[1], s * vector[0] + c * vector[1]])
+
+    def calculate_fk_steps(
+        self, arm_lengths: List[float], joint_steps: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[str]]:
+        """Calculate forward kinematics from integer servo steps.
+
+        This is the pure lookup path: no rounding and no trigonometry.
+
+        Args:
+            arm_lengths: List of arm segment lengths
+            joint_steps: Integer array of shape (N, J) with joint angles in steps
+
+        Returns:
+            Tuple containing:
+            - Array of shape (N, J + 1, 2) with joint positions
+            - Error message if any, None otherwise
+        """
+        arm_lengths = np.asarray(arm_lengths, dtype=float)
+        joint_steps = np.atleast_2d(np.asarray(joint_steps, dtype=np.int64))
+        if arm_lengths.shape[-1] != joint_steps.shape[-1]:
+            return np.empty((0, 0, 2)), "Number of arm lengths must match number of joint angles"
+
+        index = np.cumsum(joint_steps, axis=-1) % self.steps
+        return _fk_from_sin_cos(arm_lengths, self.cos_table[index], self.sin_table[index]), None
+
+    def calculate_fk(
+        self, arm_lengths: List[float], joint_angles: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[str]]:
+        """Calculate forward kinematics from joint angles in degrees.
+
+        Angles are rounded to the nearest servo step before the lookup.
+
+        Args:
+            arm_lengths: List of arm segment lengths
+            joint_angles: Array of shape (N, J) with joint angles in degrees
+
+        Returns:
+            Tuple containing:
+            - Array of shape (N, J + 1, 2) with joint positions
+            - Error message if any, None otherwise
+        """
+        return self.calculate_fk_steps(arm_lengths, self.to_steps(joint_angles))
+
+    def error_bound(self, arm_lengths: List[float]) -> float:
+        """Worst case end effector error caused by rounding angles to steps.
+
+        Rounding moves each joint by at most half a step, so the cumulative
+        angle of link k moves by at most (k + 1) half steps. A link rotated by
+        a small angle moves its tip by at most length * angle, which gives
+
+            error <= sum_k L_k * (k + 1) * resolution / 2   (angles in radians)
+
+        Inputs that already lie on the grid are exact up to floating point
+        rounding of the tables (about 1e-16 relative).
+
+        Args:
+            arm_lengths: List of arm segment lengths
+
+        Returns:
+            Upper bound on the end effector position error in length units
+        """
+        half_step = math.radians(self.resolution) / 2
+        return float(
+            sum(length * (k + 1) * half_step for k, length in enumerate(arm_lengths))
+        )
@@ -1,16 +1,9 @@
 import math
 import numpy as np
 
-l1 = 160
-l2 = 160
-l3 = 160
-
 offset = math.radians(10)
 a1_weight = 1
 
-point_x = 200
-point_y = 150
-
 
 def safe_arccos(x):
     if x > 1.0:
@@ -28,7 +21,7 @@ def safe_arcsin(x):
     return np.arcsin(x)
 
 
-def arm_math(point_x, point_y, offset):
+def arm_math(point_x, point_y, offset, l1, l2, l3):
     total_arm_length = l1 + l2 + l3
     distance_to_point = np.sqrt(point_x**2 + point_y**2)
     if distance_to_point > total_arm_length:
@@ -62,4 +55,5 @@ def arm_math(point_x, point_y, offset):
     print("Third angle (rad):", angle3, "→", math.degrees(angle3), "degrees")
 
 
-arm_math(point_x, point_y, offset)
+if __name__ == "__main__":
+    arm_math(200, 150, offset, 160, 160, 160)
@@ -1,5 +1,35 @@
 """Inverse Kinematics functions for RASW."""
 
-from .inverse_kinematics import calculate_ik
+from .inverse_kinematics import (
+    IK_NO_SOLVER,
+    IK_STATUS_MESSAGES,
+    calculate_ik,
+    calculate_ik_batch,
+    calculate_ik_best_effort,
+    project_to_reachable,
+)
+from .lookup import IKLookupTable
+from .pose import calculate_pose_ik, calculate_pose_ik_batch, find_feasible_orientation
+from .registry import SolverSpec, list_solvers, register_solver, select_solver, solve_ik
+from .velocity import ResolvedRateController
+from .warm_start import WarmStartIndex
 
-__all__ = ["calculate_ik"] 
\ No newline at end of file
+__all__ = [
+    "IKLookupTable",
+    "IK_NO_SOLVER",
+    "IK_STATUS_MESSAGES",
+    "ResolvedRateController",
+    "SolverSpec",
+    "WarmStartIndex",
+    "calculate_ik",
+    "calculate_ik_batch",
+    "calculate_ik_best_effort",
+    "calculate_pose_ik",
+    "calculate_pose_ik_batch",
+    "find_feasible_orientation",
+    "list_solvers",
+    "project_to_reachable",
+    "register_solver",
+    "select_solver",
+    "solve_ik",
+]
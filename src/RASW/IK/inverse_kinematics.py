@@ -1,8 +1,11 @@
 """Inverse Kinematics calculations for robotic arms."""
 
 import math
+import numpy as np
 from typing import Tuple, List, Optional
 
+from RASW.FK.forward_kinematics import _cumulative_sin_cos, _fk_from_sin_cos
+
 
 def calculate_ik(
     target_x: float, target_y: float, arm_lengths: List[float]
@@ -25,11 +28,6 @@ def _safe_arccos(x: float) -> float:
     return math.acos(max(-1.0, min(1.0, x)))
 
 
-def _safe_arcsin(x: float) -> float:
-    """Safely calculate arcsin by clamping input to valid range."""
-    return math.asin(max(-1.0, min(1.0, x)))
-
-
 def _calculate_ik_2link(
     target_x: float, target_y: float, arm_lengths: List[float], D: float
 ) -> Tuple[Optional[List[float]], Optional[str]]:
@@ -42,9 +40,11 @@ def _calculate_ik_2link(
     elif D < abs(L1 - L2):
         return None, "Target is too close to reach"
 
-    # Compute elbow angle using law of cosines
+    # Compute elbow angle using law of cosines. The law of cosines gives the
+    # interior angle between the links; the joint angle is measured from the
+    # fully extended pose, so it is the supplement of the interior angle.
     cos_elbow_angle = (L1**2 + L2**2 - D**2) / (2 * L1 * L2)
-    elbow_angle = _safe_arccos(cos_elbow_angle)
+    elbow_angle = math.pi - _safe_arccos(cos_elbow_angle)
 
     # Compute shoulder angle
     target_angle = math.atan2(target_y, target_x)
@@ -97,11 +97,12 @@ def _calculate_ik_3link(
     b = target_y
     d = p2_y_point
 
-    # Calculate angle2
+    # Calculate angle2. atan2 gives the direction from joint 2 to the target
+    # in all four quadrants, arcsin((b - d) / h) only covers the right half.
     try:
         angle2 = -angle1 + (
             _safe_arccos((L3**2 - L2**2 - h**2) / (-2 * L2 * h))
-            + _safe_arcsin((b - d) / h)
+            + math.atan2(b - d, target_x - p2_x_point)
         )
     except ValueError:
         return None, "Mathematical error in angle calculation"
@@ -118,3 +119,305 @@ def _calculate_ik_3link(
     angle3_deg = math.degrees(angle3)
 
     return [angle1_deg, angle2_deg, angle3_deg], None
+
+
+# Status codes returned by the batch solvers, one per target
+IK_OK = 0
+IK_TOO_FEW_LINKS = 1
+IK_OUT_OF_REACH = 2
+IK_TOO_CLOSE = 3
+IK_CONFIGURATION_UNREACHABLE = 4
+IK_NOT_CONVERGED = 5
+IK_NO_SOLVER = 6
+
+# Maps each status code to the error message of the scalar solver
+IK_STATUS_MESSAGES = {
+    IK_OK: None,
+    IK_TOO_FEW_LINKS: "At least two arm segments are required",
+    IK_OUT_OF_REACH: "Target is out of reach",
+    IK_TOO_CLOSE: "Target is too close to reach",
+    IK_CONFIGURATION_UNREACHABLE: "Target cannot be reached with given joint configuration",
+    IK_NOT_CONVERGED: "Solver did not converge",
+    IK_NO_SOLVER: "No registered solver handles this arm topology",
+}
+
+
+def calculate_ik_batch(
+    targets: np.ndarray, arm_lengths: List[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate inverse kinematics for a batch of targets.
+
+    Uses the same solvers as `calculate_ik`, vectorized over the targets.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        arm_lengths: List of arm segment lengths
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, 2) or (N, 3) with joint angles in degrees, NaN
+          where no solution was found
+        - Array of shape (N,) with a status code per target, see
+          IK_STATUS_MESSAGES
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    arm_lengths = np.asarray(arm_lengths, dtype=float)
+    n = targets.shape[0]
+
+    if arm_lengths.shape[-1] < 2:
+        angles = np.full((n, arm_lengths.shape[-1]), np.nan)
+        return angles, np.full(n, IK_TOO_FEW_LINKS, dtype=np.int8)
+
+    x, y = targets[:, 0], targets[:, 1]
+    if arm_lengths.shape[-1] >= 3:
+        return _calculate_ik_3link_batch(
+            x, y, arm_lengths[..., 0], arm_lengths[..., 1], arm_lengths[..., 2]
+        )
+    return _calculate_ik_2link_batch(x, y, arm_lengths[..., 0], arm_lengths[..., 1])
+
+
+def _calculate_ik_2link_batch(
+    x: np.ndarray, y: np.ndarray, L1: np.ndarray, L2: np.ndarray, clamp: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of `_calculate_ik_2link`.
+
+    Link lengths may be scalars or arrays broadcastable to the targets. With
+    clamp, unreachable targets keep the angles of the clamped law of cosines
+    instead of NaN.
+    """
+    D = np.hypot(x, y)
+    status = np.zeros(x.shape, dtype=np.int8)
+    status[D < np.abs(L1 - L2)] = IK_TOO_CLOSE
+    status[D > (L1 + L2)] = IK_OUT_OF_REACH
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        elbow_angle = math.pi - np.arccos(
+            np.clip((L1**2 + L2**2 - D**2) / (2 * L1 * L2), -1.0, 1.0)
+        )
+        alpha = np.arccos(np.clip((L1**2 + D**2 - L2**2) / (2 * L1 * D), -1.0, 1.0))
+    shoulder_angle = np.arctan2(y, x) - alpha
+
+    angles = np.degrees(np.stack([shoulder_angle, elbow_angle], axis=-1))
+    if clamp:
+        # 0 / 0 at a zero distance leaves an angle free, any value works
+        np.nan_to_num(angles, copy=False)
+    else:
+        angles[status != IK_OK] = np.nan
+    return angles, status
+
+
+def _calculate_ik_3link_batch(
+    x: np.ndarray,
+    y: np.ndarray,
+    L1: np.ndarray,
+    L2: np.ndarray,
+    L3: np.ndarray,
+    clamp: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized version of `_calculate_ik_3link`.
+
+    Link lengths may be scalars or arrays broadcastable to the targets. With
+    clamp, unreachable targets keep the angles of the clamped law of cosines
+    instead of NaN.
+    """
+    offset = math.radians(10)
+    a1_weight = 1
+
+    distance_to_point = np.hypot(x, y)
+    angle1 = a1_weight * np.arctan2(y, x) + offset
+    p2_x_point = np.cos(angle1) * L1
+    p2_y_point = np.sin(angle1) * L1
+    h = np.hypot(x - p2_x_point, y - p2_y_point)
+
+    status = np.zeros(x.shape, dtype=np.int8)
+    status[(h > (L2 + L3)) | (h < np.abs(L2 - L3))] = IK_CONFIGURATION_UNREACHABLE
+    status[distance_to_point > (L1 + L2 + L3)] = IK_OUT_OF_REACH
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        angle2 = -angle1 + (
+            np.arccos(np.clip((L3**2 - L2**2 - h**2) / (-2 * L2 * h), -1.0, 1.0))
+            + np.arctan2(y - p2_y_point, x - p2_x_point)
+        )
+        angle3 = -math.pi + np.arccos(
+            np.clip((h**2 - L2**2 - L3**2) / (-2 * L2 * L3), -1.0, 1.0)
+        )
+
+    angles = np.degrees(np.stack([angle1, angle2, angle3], axis=-1))
+    if clamp:
+        # 0 / 0 at a zero distance leaves an angle free, any value works
+        np.nan_to_num(angles, copy=False)
+    else:
+        angles[status != IK_OK] = np.nan
+    return angles, status
+
+
+def _reachable_radii(arm_lengths: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Radii the solver for these arm lengths can reach, as two intervals.
+
+    Every solver only depends on the target's distance from the base, so the
+    reachable set is a union of rings. A 2-link arm, and the numeric solver
+    used for longer arms, reach the annulus max(0, 2 L_max - sum L) <= r <=
+    sum L. The 3-link heuristic puts joint 2 at L1 along the target
+    direction plus 10 degrees, so the distance h from joint 2 to the target
+    satisfies h^2 = (r - L1 cos 10)^2 + (L1 sin 10)^2 and must lie within
+    [|L2 - L3|, L2 + L3]. That holds for |r - L1 cos 10| in [a, b], an outer
+    ring and, when L1 cos 10 > a, an inner one.
+
+    Returns:
+        Tuple (outer_low, outer_high, inner_low, inner_high), the inner
+        interval empty (low > high) when it does not exist. outer_high is
+        NaN when no radius is reachable at all.
+    """
+    if arm_lengths.shape[-1] != 3:
+        total = arm_lengths.sum(axis=-1)
+        low, high = np.maximum(2 * arm_lengths.max(axis=-1) - total, 0.0), total
+        return low, high, np.ones_like(low), np.zeros_like(low)
+
+    L1, L2, L3 = arm_lengths[..., 0], arm_lengths[..., 1], arm_lengths[..., 2]
+    offset = math.radians(10)
+    center = L1 * math.cos(offset)
+    height2 = (L1 * math.sin(offset)) ** 2
+    with np.errstate(invalid="ignore"):
+        a = np.sqrt(np.maximum((L2 - L3) ** 2 - height2, 0.0))
+        b = np.sqrt((L2 + L3) ** 2 - height2)
+    return center + a, center + b, np.maximum(center - b, 0.0), center - a
+
+
+def project_to_reachable(
+    targets: np.ndarray, arm_lengths: List[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Move every target to the nearest point the IK solvers can reach.
+
+    That is the reach of `calculate_ik_batch` for 2 and 3 links and of the
+    whole arm for longer arms. Reachable targets are returned unchanged. Because the reachable set is
+    a union of rings around the base, the nearest point lies on the ray from
+    the base through the target; targets at the base itself are moved along
+    +x.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        arm_lengths: List of arm segment lengths, or an (N, J) array with
+                     lengths per target
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, 2) with the projected targets
+        - Array of shape (N,) with the distance each target moved
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    arm_lengths = np.asarray(arm_lengths, dtype=float)
+    radius = np.hypot(targets[:, 0], targets[:, 1])
+    outer_low, outer_high, inner_low, inner_high = _reachable_radii(arm_lengths)
+
+    # Nearest radius in each interval, then the closer of the two
+    outer = np.clip(radius, outer_low, outer_high)
+    inner = np.clip(radius, inner_low, np.maximum(inner_low, inner_high))
+    use_inner = (inner_low <= inner_high) & (np.abs(inner - radius) < np.abs(outer - radius))
+    projected_radius = np.where(use_inner, inner, outer)
+    # No reachable radius at all: h is smallest at r = L1 cos 10
+    projected_radius = np.where(
+        np.isnan(outer_high), arm_lengths[..., 0] * math.cos(math.radians(10)), projected_radius
+    )
+
+    direction = np.arctan2(targets[:, 1], targets[:, 0])
+    projected = projected_radius[:, None] * np.stack([np.cos(direction), np.sin(direction)], -1)
+    projected[radius == projected_radius] = targets[radius == projected_radius]
+    return projected, np.abs(projected_radius - radius)
+
+
+def calculate_ik_best_effort(
+    targets: np.ndarray, arm_lengths: List[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate inverse kinematics that never fails on unreachable targets.
+
+    Targets the solver rejects are moved to the nearest solvable point with
+    `project_to_reachable` and solved there, so callers need no retry or
+    clamp loop. Arms with more than three links are solved over all links
+    with `calculate_ik_numeric_batch`. The residual tells how far the
+    resulting end effector is from the requested target, 0 (up to solver
+    tolerance) for reachable targets.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        arm_lengths: List of arm segment lengths, or an (N, J) array with
+                     lengths per target
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, 2), (N, 3) or (N, J) for longer arms with joint
+          angles in degrees, NaN only when the arm has fewer than two links
+        - Array of shape (N,) with the distance between the end effector
+          and the requested target
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    arm_lengths = np.asarray(arm_lengths, dtype=float)
+    n = targets.shape[0]
+    if arm_lengths.shape[-1] < 2:
+        return np.full((n, arm_lengths.shape[-1]), np.nan), np.full(n, np.nan)
+
+    if arm_lengths.shape[-1] > 3:
+        angles = _best_effort_numeric(targets, arm_lengths)
+        cos, sin = _cumulative_sin_cos(angles)
+        reached = _fk_from_sin_cos(arm_lengths, cos, sin)[:, -1]
+        return angles, np.hypot(*(targets - reached).T)
+
+    angles, status = calculate_ik_batch(targets, arm_lengths)
+    # A target exactly at the base of an equal-link arm is reported solved
+    # with a NaN shoulder angle, so it is redone too
+    missed = np.flatnonzero((status != IK_OK) | np.isnan(angles).any(axis=-1))
+    if missed.size:
+        # Only unsolved targets are projected. They end up on the boundary
+        # of the reachable set, where rounding can put them a hair outside,
+        # so keep the clamped angles there
+        lengths = arm_lengths[missed] if arm_lengths.ndim > 1 else arm_lengths
+        projected, _ = project_to_reachable(targets[missed], lengths)
+        x, y = projected[:, 0], projected[:, 1]
+        links = [lengths[..., k] for k in range(angles.shape[-1])]
+        if len(links) == 3:
+            angles[missed], _ = _calculate_ik_3link_batch(x, y, *links, clamp=True)
+        else:
+            angles[missed], _ = _calculate_ik_2link_batch(x, y, *links, clamp=True)
+
+    residual = np.zeros(n)
+    if missed.size:
+        cos, sin = _cumulative_sin_cos(angles[missed])
+        reached = _fk_from_sin_cos(lengths, cos, sin)[:, -1]
+        residual[missed] = np.hypot(*(targets[missed] - reached).T)
+    return angles, residual
+
+
+def _boundary_pose(targets: np.ndarray, arm_lengths: np.ndarray, outer: np.ndarray) -> np.ndarray:
+    """Exact poses on the rim of the annulus an arm of any length reaches.
+
+    On the outer rim the arm is straight. On the inner rim the longest link
+    points at the target and every other link points back.
+    """
+    n, joint_count = targets.shape[0], arm_lengths.shape[-1]
+    heading = np.degrees(np.arctan2(targets[:, 1], targets[:, 0]))
+    longest = np.broadcast_to(np.argmax(arm_lengths, axis=-1), (n,))
+    absolute = np.where(
+        outer[:, None] | (np.arange(joint_count) == longest[:, None]), 0.0, 180.0
+    ) + heading[:, None]
+    return np.diff(absolute, axis=-1, prepend=0.0)
+
+
+def _best_effort_numeric(targets: np.ndarray, arm_lengths: np.ndarray) -> np.ndarray:
+    """Best-effort joint angles for arms with more than three links."""
+    from .numeric import calculate_ik_numeric_batch
+
+    projected, moved = project_to_reachable(targets, arm_lengths)
+    angles = np.empty((targets.shape[0], arm_lengths.shape[-1]))
+    inside = np.flatnonzero(moved == 0)
+    lengths = arm_lengths[inside] if arm_lengths.ndim > 1 else arm_lengths
+    angles[inside], status = calculate_ik_numeric_batch(targets[inside], lengths)
+
+    # Projected targets lie on the rim of the reach annulus, where the
+    # Jacobian is singular and the rim pose is exact. Reachable targets
+    # the solver could not finish are next to the rim too
+    rim = np.union1d(np.flatnonzero(moved > 0), inside[status != IK_OK])
+    if rim.size:
+        lengths = arm_lengths[rim] if arm_lengths.ndim > 1 else arm_lengths
+        low, high, _, _ = _reachable_radii(lengths)
+        radius = np.hypot(projected[rim, 0], projected[rim, 1])
+        angles[rim] = _boundary_pose(projected[rim], lengths, radius >= (low + high) / 2)
+    return angles
@@ -0,0 +1,331 @@
+"""Precomputed IK lookup table with a certified interpolation error.
+
+For an arm whose geometry never changes, IK can be tabulated once on a
+Cartesian grid over the workspace. At runtime the joint angles of the four
+grid nodes around a target are bilinearly interpolated, which costs a few
+multiply-adds instead of the closed-form solver's trig calls.
+
+Every cell stores an upper bound on the tool tip error of any interpolated
+solution inside it, computed at build time. The cell is sampled on a
+sub-grid of spacing s, and between sub-grid points the error e(p) =
+FK(q(p)) - p is bounded with a second-order expansion around the nearest
+sample c:
+
+    |e(p)| <= |e(c)| + |De(c)| d + M d^2 / 2,    d = s sqrt(2) / 2
+
+where De is exact (the FK Jacobian times the bilinear gradient, minus the
+identity) and M bounds the second derivative of FK along straight lines in
+the cell from the link lengths and the joint angle differences at the
+corners. Cells whose bound exceeds the table's tolerance, which includes
+cells next to singularities, workspace edges and branch seams of the
+solver, fall back to `calculate_ik_batch`.
+
+The table is stored as an .npy file of shape (ny, nx, J + 1) holding the
+node angles and, in the last channel, the bound of the cell whose lower-left
+corner is that node, plus a .json file with the grid geometry. Loading
+memory-maps the .npy, so only the pages touched by queries are read.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from RASW.FK.forward_kinematics import _cumulative_sin_cos
+from RASW.FK.jacobian import _jacobian_from_sin_cos
+from .inverse_kinematics import IK_OK, calculate_ik_batch
+
+# Interpolated points held in memory at once while certifying cells
+_CERTIFY_BATCH = 1 << 20
+
+
+def _metadata_path(path: Union[str, Path]) -> Path:
+    return Path(path).with_suffix(".json")
+
+
+class IKLookupTable:
+    """Bilinear IK lookup table for one fixed arm geometry.
+
+    Build tables with `build` and open saved ones with `load`.
+
+    Args:
+        table: Array of shape (ny, nx, J + 1), see the module docstring
+        arm_lengths: List of arm segment lengths the table was built for
+        origin: (x, y) position of node (0, 0)
+        resolution: Grid spacing
+        tolerance: Largest certified error served from the table, targets
+                   in cells with a larger bound use the exact solver
+    """
+
+    def __init__(
+        self,
+        table: np.ndarray,
+        arm_lengths: List[float],
+        origin: Tuple[float, float],
+        resolution: float,
+        tolerance: float = 1e-2,
+    ):
+        self.table = table
+        self.arm_lengths = np.asarray(arm_lengths, dtype=float)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.resolution = float(resolution)
+        self.tolerance = float(tolerance)
+
+    @property
+    def joint_count(self) -> int:
+        return self.table.shape[-1] - 1
+
+    @property
+    def cell_bounds(self) -> np.ndarray:
+        """Array of shape (ny - 1, nx - 1) with each cell's error bound."""
+        return self.table[:-1, :-1, -1]
+
+    @property
+    def certified_error(self) -> float:
+        """Largest tool tip error of any solution served from the table."""
+        bounds = self.cell_bounds
+        served = bounds[bounds <= self.tolerance]
+        return float(served.max()) if served.size else 0.0
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of grid cells served from the table."""
+        return float(np.mean(self.cell_bounds <= self.tolerance))
+
+    @classmethod
+    def build(
+        cls,
+        arm_lengths: List[float],
+        resolution: float,
+        path: Optional[Union[str, Path]] = None,
+        tolerance: float = 1e-2,
+        samples_per_cell: int = 4,
+    ) -> "IKLookupTable":
+        """Tabulate `calculate_ik_batch` over the workspace and certify each cell.
+
+        Args:
+            arm_lengths: List of arm segment lengths
+            resolution: Grid spacing, the table has about (2 reach / resolution)^2
+                        nodes
+            path: .npy file to build the table in, kept in memory when None
+            tolerance: Largest certified error served from the table
+            samples_per_cell: Sub-grid intervals per cell edge used to certify
+                              the error bound
+
+        Returns:
+            The built table, also saved to path when given
+        """
+        arm_lengths = np.asarray(arm_lengths, dtype=float)
+        reach = float(arm_lengths.sum())
+        nodes = int(np.ceil(2 * reach / resolution)) + 1
+        origin = (-reach, -reach)
+        joint_count = min(arm_lengths.shape[0], 3)
+        shape = (nodes, nodes, joint_count + 1)
+        if path is None:
+            table = np.empty(shape)
+        else:
+            table = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+
+        axis = origin[0] + resolution * np.arange(nodes)
+        rows_per_batch = max(1, _CERTIFY_BATCH // nodes)
+        for start in range(0, nodes, rows_per_batch):
+            stop = min(start + rows_per_batch, nodes)
+            grid_x, grid_y = np.meshgrid(axis, axis[start:stop])
+            targets = np.stack([grid_x.ravel(), grid_y.ravel()], axis=-1)
+            angles, _ = calculate_ik_batch(targets, arm_lengths)
+            table[start:stop, :, :joint_count] = angles.reshape(stop - start, nodes, joint_count)
+
+        table[..., -1] = np.inf
+        lengths = arm_lengths[:joint_count]
+        points = (samples_per_cell + 1) ** 2
+        rows_per_batch = max(1, _CERTIFY_BATCH // ((nodes - 1) * points))
+        for start in range(0, nodes - 1, rows_per_batch):
+            stop = min(start + rows_per_batch, nodes - 1)
+            table[start:stop, :-1, -1] = _certify_cells(
+                np.asarray(table[start : stop + 1, :, :joint_count]),
+                lengths,
+                (origin[0], origin[1] + start * resolution),
+                resolution,
+                samples_per_cell,
+            )
+
+        if path is not None:
+            table.flush()
+        lookup = cls(table, arm_lengths, origin, resolution, tolerance)
+        if path is not None:
+            lookup._write_metadata(path)
+        return lookup
+
+    def _write_metadata(self, path: Union[str, Path]) -> None:
+        metadata = {
+            "arm_lengths": self.arm_lengths.tolist(),
+            "origin": list(self.origin),
+            "resolution": self.resolution,
+            "tolerance": self.tolerance,
+        }
+        _metadata_path(path).write_text(json.dumps(metadata, indent=2))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the table to an .npy file and its geometry to a .json file."""
+        np.save(path, np.asarray(self.table))
+        self._write_metadata(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "IKLookupTable":
+        """Open a table written by `build` or `save`.
+
+        Args:
+            path: Path of the .npy file
+            mmap: Memory-map the table instead of reading it into memory
+        """
+        metadata = json.loads(_metadata_path(path).read_text())
+        table = np.load(path, mmap_mode="r" if mmap else None)
+        return cls(
+            table,
+            metadata["arm_lengths"],
+            tuple(metadata["origin"]),
+            metadata["resolution"],
+            metadata["tolerance"],
+        )
+
+    def matches(self, arm_lengths: List[float]) -> bool:
+        """Check that the table was built for this arm."""
+        arm_lengths = np.asarray(arm_lengths, dtype=float)
+        return arm_lengths.shape == self.arm_lengths.shape and np.allclose(
+            arm_lengths, self.arm_lengths
+        )
+
+    def solve(
+        self, targets: np.ndarray, arm_lengths: Optional[List[float]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Solve a batch of targets, interpolating where the table is certified.
+
+        Same interface as `calculate_ik_batch`. Targets outside certified
+        cells, or every target when arm_lengths is not the table's arm, are
+        passed to `calculate_ik_batch`.
+
+        Args:
+            targets: Array of shape (N, 2) with target (x, y) positions
+            arm_lengths: List of arm segment lengths, the table's by default
+
+        Returns:
+            Tuple containing:
+            - Array of shape (N, J) with joint angles in degrees, NaN where
+              no solution was found
+            - Array of shape (N,) with a status code per target, see
+              IK_STATUS_MESSAGES
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        if arm_lengths is not None and not self.matches(arm_lengths):
+            return calculate_ik_batch(targets, arm_lengths)
+
+        n = targets.shape[0]
+        ny, nx, channels = self.table.shape
+        gx = (targets[:, 0] - self.origin[0]) / self.resolution
+        gy = (targets[:, 1] - self.origin[1]) / self.resolution
+        inside = (gx >= 0) & (gx < nx - 1) & (gy >= 0) & (gy < ny - 1)
+        column = np.clip(np.floor(gx), 0, nx - 2)
+        row = np.clip(np.floor(gy), 0, ny - 2)
+        u = gx - column
+        v = gy - row
+
+        # One gather of all four corners from the flattened table, then a
+        # weighted sum with the bilinear weights
+        index = (row * nx + column).astype(np.intp)[:, None] + np.array([0, 1, nx, nx + 1])
+        corners = np.take(self.table.reshape(-1, channels), index, axis=0)
+        served = inside & (corners[:, 0, -1] <= self.tolerance)
+        weights = np.empty((n, 4))
+        np.multiply(1 - u, 1 - v, out=weights[:, 0])
+        np.multiply(u, 1 - v, out=weights[:, 1])
+        np.multiply(1 - u, v, out=weights[:, 2])
+        np.multiply(u, v, out=weights[:, 3])
+        angles = np.einsum("nk,nkc->nc", weights, corners[:, :, :-1])
+        status = np.full(n, IK_OK, dtype=np.int8)
+
+        misses = np.flatnonzero(~served)
+        if misses.size:
+            angles[misses], status[misses] = calculate_ik_batch(targets[misses], self.arm_lengths)
+        return angles, status
+
+    def register(self, name: str = "lookup-table", priority: int = -1) -> None:
+        """Register the table with the solver registry for its link count.
+
+        The default priority is ahead of every built-in position solver, so
+        `solve_ik` picks the table for arms of its link count. Arms of the
+        same link count but other lengths still get exact solutions, since
+        `solve` falls back for them.
+        """
+        from .registry import SolverSpec, register_solver
+
+        link_count = self.arm_lengths.shape[0]
+        register_solver(
+            SolverSpec(
+                name=name,
+                loader=lambda: self.solve,
+                min_links=link_count,
+                max_links=link_count,
+                priority=priority,
+            )
+        )
+
+
+def _certify_cells(
+    nodes: np.ndarray,
+    arm_lengths: np.ndarray,
+    origin: Tuple[float, float],
+    resolution: float,
+    samples_per_cell: int,
+) -> np.ndarray:
+    """Error bound of every cell between a (rows + 1, cols + 1, J) block of nodes."""
+    q00 = np.radians(nodes[:-1, :-1])
+    q10 = np.radians(nodes[:-1, 1:])
+    q01 = np.radians(nodes[1:, :-1])
+    q11 = np.radians(nodes[1:, 1:])
+    rows, cols = q00.shape[:2]
+
+    # Sub-grid of each cell, broadcast as (rows, cols, S, 1)
+    steps = np.linspace(0.0, 1.0, samples_per_cell + 1)
+    u, v = np.meshgrid(steps, steps)
+    u = u.ravel()[:, None]
+    v = v.ravel()[:, None]
+    q00, q10, q01, q11 = (corner[:, :, None, :] for corner in (q00, q10, q01, q11))
+    q = (1 - v) * ((1 - u) * q00 + u * q10) + v * ((1 - u) * q01 + u * q11)
+
+    cell_x = origin[0] + resolution * np.arange(cols)
+    cell_y = origin[1] + resolution * np.arange(rows)
+    target_x = cell_x[None, :, None] + resolution * u[:, 0]
+    target_y = cell_y[:, None, None] + resolution * v[:, 0]
+
+    cos, sin = _cumulative_sin_cos(np.degrees(q))
+    error = np.hypot(
+        (arm_lengths * cos).sum(-1) - target_x, (arm_lengths * sin).sum(-1) - target_y
+    )
+
+    # De = Jacobian @ (dq/dp) - I at every sample
+    dq_dx = ((1 - v) * (q10 - q00) + v * (q11 - q01)) / resolution
+    dq_dy = ((1 - u) * (q01 - q00) + u * (q11 - q10)) / resolution
+    jacobian = _jacobian_from_sin_cos(arm_lengths, cos, sin)
+    d_error = np.stack(
+        [(jacobian * dq_dx[..., None, :]).sum(-1), (jacobian * dq_dy[..., None, :]).sum(-1)],
+        axis=-1,
+    )
+    d_error[..., 0, 0] -= 1.0
+    d_error[..., 1, 1] -= 1.0
+    d_error_norm = np.sqrt((d_error**2).sum(axis=(-2, -1)))
+
+    # Second derivative of FK(q(p)) along any unit direction in the cell.
+    # Joint k moves the links from k outwards, so d2 FK / dq_a dq_b is at most
+    # the reach beyond max(a, b), and q'' is the bilinear cross term.
+    outward = np.cumsum(arm_lengths[::-1])[::-1]
+    index = np.arange(arm_lengths.shape[0])
+    hessian_bound = outward[np.maximum(index[:, None], index[None, :])]
+    gradient = np.maximum(
+        np.abs(dq_dx).max(axis=2), np.abs(dq_dy).max(axis=2)
+    ) * np.sqrt(2.0)
+    twist = np.abs(q11 - q10 - q01 + q00)[:, :, 0] / resolution**2
+    curvature = np.einsum("rca,ab,rcb->rc", gradient, hessian_bound, gradient)
+    curvature += (twist * outward).sum(-1)
+
+    spacing = resolution / samples_per_cell * np.sqrt(2.0) / 2
+    bound = (error + d_error_norm * spacing).max(axis=-1) + 0.5 * curvature * spacing**2
+    return np.where(np.isnan(bound), np.inf, bound)
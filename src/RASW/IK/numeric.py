@@ -0,0 +1,139 @@
+"""Iterative inverse kinematics for planar arms of any length."""
+
+import numpy as np
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from RASW.FK.forward_kinematics import _cumulative_sin_cos
+from RASW.FK.jacobian import _jacobian_from_sin_cos
+from .inverse_kinematics import (
+    IK_NOT_CONVERGED,
+    IK_OK,
+    IK_OUT_OF_REACH,
+    IK_TOO_CLOSE,
+    IK_TOO_FEW_LINKS,
+)
+
+if TYPE_CHECKING:
+    from .warm_start import WarmStartIndex
+
+
+def default_seed(targets: np.ndarray, joint_count: int) -> np.ndarray:
+    """Initial guess that points the arm at the target with a gentle bend.
+
+    A fully straight arm is singular, so every joint after the first is bent
+    by 20 degrees and the first joint compensates for the average bend.
+    """
+    seed = np.full((targets.shape[0], joint_count), 20.0)
+    seed[:, 0] = np.degrees(np.arctan2(targets[:, 1], targets[:, 0])) - 10.0 * (
+        joint_count - 1
+    )
+    return seed
+
+
+def calculate_ik_numeric_batch(
+    targets: np.ndarray,
+    arm_lengths: List[float],
+    initial_angles: Optional[np.ndarray] = None,
+    joint_limits: Optional[np.ndarray] = None,
+    max_iterations: int = 100,
+    tolerance: float = 1e-6,
+    damping: float = 1e-3,
+    warm_start: Optional["WarmStartIndex"] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve position IK with damped least squares for a batch of targets.
+
+    Each iteration evaluates FK and the Jacobian from one shared set of
+    cumulative sin/cos values and takes a damped pseudo-inverse step. Rows
+    that converge drop out of the active set.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        arm_lengths: List of arm segment lengths, or an (N, J) array with
+                     lengths per target
+        initial_angles: Array of shape (N, J) with starting joint angles in
+                        degrees, see `default_seed`
+        joint_limits: Array of shape (J, 2) with (min, max) joint angles in
+                      degrees, applied after every step
+        max_iterations: Iteration limit per target
+        tolerance: Position error at which a target counts as reached
+        damping: Damping factor relative to the total arm length
+        warm_start: Index of earlier solutions for this arm. When
+                    initial_angles is None the nearest remembered solution
+                    seeds each target, and new solutions are added to it.
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, J) with joint angles in degrees, NaN on failure
+        - Array of shape (N,) with a status code per target, see
+          IK_STATUS_MESSAGES
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    lengths = np.asarray(arm_lengths, dtype=float)
+    n, joint_count = targets.shape[0], lengths.shape[-1]
+    if joint_count < 2:
+        return np.full((n, joint_count), np.nan), np.full(n, IK_TOO_FEW_LINKS, dtype=np.int8)
+
+    reach = lengths.sum(axis=-1)
+    distance = np.hypot(targets[:, 0], targets[:, 1])
+    status = np.full(n, IK_NOT_CONVERGED, dtype=np.int8)
+    status[distance > reach] = IK_OUT_OF_REACH
+    status[distance < 2 * lengths.max(axis=-1) - reach] = IK_TOO_CLOSE
+
+    if warm_start is not None and not warm_start.matches(lengths):
+        raise ValueError("Warm start index was built for a different arm")
+    if initial_angles is None and warm_start is not None:
+        angles = warm_start.seed(targets)
+    elif initial_angles is None:
+        angles = default_seed(targets, joint_count)
+    else:
+        angles = np.array(initial_angles, dtype=float).reshape(n, joint_count)
+    if joint_limits is not None:
+        joint_limits = np.asarray(joint_limits, dtype=float)
+        np.clip(angles, joint_limits[:, 0], joint_limits[:, 1], out=angles)
+
+    per_row = lengths.ndim > 1
+    lam2 = np.broadcast_to((damping * reach) ** 2, (n,))
+    max_step = np.broadcast_to(0.25 * reach, (n,))
+    active = np.flatnonzero(status == IK_NOT_CONVERGED)
+    for _ in range(max_iterations + 1):
+        if active.size == 0:
+            break
+        q = angles[active]
+        row_lengths = lengths[active] if per_row else lengths
+        cos, sin = _cumulative_sin_cos(q)
+        end = np.stack([(row_lengths * cos).sum(-1), (row_lengths * sin).sum(-1)], axis=-1)
+        error = targets[active] - end
+        error_norm = np.hypot(error[:, 0], error[:, 1])
+
+        done = error_norm <= tolerance
+        status[active[done]] = IK_OK
+        keep = ~done
+        active, q, error, error_norm = active[keep], q[keep], error[keep], error_norm[keep]
+        cos, sin = cos[keep], sin[keep]
+        if per_row:
+            row_lengths = row_lengths[keep]
+        if active.size == 0:
+            break
+
+        # Limit the Cartesian step so far targets do not overshoot
+        scale = np.minimum(1.0, max_step[active] / error_norm)[:, None]
+        error = error * scale
+
+        jac = _jacobian_from_sin_cos(row_lengths, cos, sin)
+        a = np.einsum("nij,nkj->nik", jac, jac)
+        a[:, 0, 0] += lam2[active]
+        a[:, 1, 1] += lam2[active]
+        det = a[:, 0, 0] * a[:, 1, 1] - a[:, 0, 1] * a[:, 1, 0]
+        wx = (a[:, 1, 1] * error[:, 0] - a[:, 0, 1] * error[:, 1]) / det
+        wy = (a[:, 0, 0] * error[:, 1] - a[:, 1, 0] * error[:, 0]) / det
+        step = jac[:, 0, :] * wx[:, None] + jac[:, 1, :] * wy[:, None]
+
+        q = q + np.degrees(step)
+        if joint_limits is not None:
+            np.clip(q, joint_limits[:, 0], joint_limits[:, 1], out=q)
+        angles[active] = q
+
+    angles[status != IK_OK] = np.nan
+    if warm_start is not None:
+        warm_start.insert(targets, angles)
+    return angles, status
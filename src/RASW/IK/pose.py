@@ -0,0 +1,181 @@
+"""Closed-form inverse kinematics for a 3-link arm with a tool orientation."""
+
+import math
+import numpy as np
+from typing import List, Optional, Tuple, Union
+
+from .inverse_kinematics import (
+    IK_OK,
+    IK_OUT_OF_REACH,
+    IK_STATUS_MESSAGES,
+    IK_TOO_CLOSE,
+    IK_TOO_FEW_LINKS,
+)
+
+
+def _wrap_degrees(angles: np.ndarray) -> np.ndarray:
+    """Wrap angles in degrees to [-180, 180)."""
+    return (angles + 180.0) % 360.0 - 180.0
+
+
+def _pose_ik_kernel(
+    x: np.ndarray,
+    y: np.ndarray,
+    phi: np.ndarray,
+    L1: float,
+    L2: float,
+    L3: float,
+    elbow_up: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve pose IK for broadcastable target and orientation arrays.
+
+    The last link must point along phi, which fixes the wrist point at
+    L3 behind the target. The first two links then form a 2-link arm that
+    reaches the wrist, and the third joint takes up the remaining rotation.
+    """
+    phi_rad = np.radians(phi)
+    wrist_x = x - L3 * np.cos(phi_rad)
+    wrist_y = y - L3 * np.sin(phi_rad)
+    D = np.hypot(wrist_x, wrist_y)
+
+    status = np.zeros(D.shape, dtype=np.int8)
+    status[D < abs(L1 - L2)] = IK_TOO_CLOSE
+    status[D > (L1 + L2)] = IK_OUT_OF_REACH
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        elbow = math.pi - np.arccos(
+            np.clip((L1**2 + L2**2 - D**2) / (2 * L1 * L2), -1.0, 1.0)
+        )
+        alpha = np.arccos(np.clip((L1**2 + D**2 - L2**2) / (2 * L1 * D), -1.0, 1.0))
+    sign = 1.0 if elbow_up else -1.0
+    shoulder = np.arctan2(wrist_y, wrist_x) - sign * alpha
+    elbow = sign * elbow
+
+    angle1 = np.degrees(shoulder)
+    angle2 = np.degrees(elbow)
+    angle3 = _wrap_degrees(phi - angle1 - angle2)
+    angles = np.stack(np.broadcast_arrays(angle1, angle2, angle3), axis=-1)
+    angles[status != IK_OK] = np.nan
+    return angles, status
+
+
+def calculate_pose_ik(
+    target_x: float,
+    target_y: float,
+    phi: float,
+    arm_lengths: List[float],
+    elbow_up: bool = True,
+) -> Tuple[Optional[List[float]], Optional[str]]:
+    """Calculate IK for a 3-link arm so the tool reaches (x, y) at angle phi.
+
+    Args:
+        target_x: Target x position
+        target_y: Target y position
+        phi: Tool orientation in degrees, the sum of the joint angles
+        arm_lengths: List of three arm segment lengths
+        elbow_up: Choose the elbow-up branch (the one `calculate_ik` uses)
+
+    Returns:
+        Tuple containing:
+        - List of three joint angles in degrees, None on failure
+        - Error message if any, None otherwise
+    """
+    if len(arm_lengths) != 3:
+        return None, "Pose IK requires exactly three arm segments"
+
+    angles, status = _pose_ik_kernel(
+        np.float64(target_x), np.float64(target_y), np.float64(phi), *arm_lengths, elbow_up
+    )
+    if status != IK_OK:
+        return None, IK_STATUS_MESSAGES[int(status)]
+    return [float(angle) for angle in angles], None
+
+
+def calculate_pose_ik_batch(
+    targets: np.ndarray,
+    phi: Union[float, np.ndarray],
+    arm_lengths: List[float],
+    elbow_up: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate pose IK for a batch of targets and tool orientations.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        phi: Tool orientation in degrees, a scalar or an array of shape (N,)
+        arm_lengths: List of three arm segment lengths
+        elbow_up: Choose the elbow-up branch
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, 3) with joint angles in degrees, NaN on failure
+        - Array of shape (N,) with a status code per target, see
+          IK_STATUS_MESSAGES
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    if len(arm_lengths) != 3:
+        n = targets.shape[0]
+        return np.full((n, 3), np.nan), np.full(n, IK_TOO_FEW_LINKS, dtype=np.int8)
+
+    phi = np.broadcast_to(np.asarray(phi, dtype=float), targets.shape[:1])
+    return _pose_ik_kernel(targets[:, 0], targets[:, 1], phi, *arm_lengths, elbow_up)
+
+
+def find_feasible_orientation(
+    targets: np.ndarray,
+    arm_lengths: List[float],
+    orientations: Optional[np.ndarray] = None,
+    preferred: Optional[Union[float, np.ndarray]] = None,
+    elbow_up: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sweep tool orientations and pick a feasible one for every target.
+
+    All targets and orientations are solved as one (N, P) array operation,
+    replacing a retry loop over orientations.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        arm_lengths: List of three arm segment lengths
+        orientations: Candidate orientations in degrees, every degree by default
+        preferred: Orientation to stay closest to, a scalar or an array of
+                   shape (N,); defaults to pointing away from the base
+        elbow_up: Choose the elbow-up branch
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, 3) with joint angles in degrees, NaN on failure
+        - Array of shape (N,) with the chosen orientation, NaN on failure
+        - Array of shape (N,) with a status code per target; targets with no
+          feasible orientation report the failure of the preferred one
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    n = targets.shape[0]
+    if len(arm_lengths) != 3:
+        return (
+            np.full((n, 3), np.nan),
+            np.full(n, np.nan),
+            np.full(n, IK_TOO_FEW_LINKS, dtype=np.int8),
+        )
+
+    if orientations is None:
+        orientations = np.arange(-180.0, 180.0, 1.0)
+    orientations = np.asarray(orientations, dtype=float)
+    if preferred is None:
+        preferred = np.degrees(np.arctan2(targets[:, 1], targets[:, 0]))
+    preferred = np.broadcast_to(np.asarray(preferred, dtype=float), (n,))
+
+    angles, status = _pose_ik_kernel(
+        targets[:, 0, None], targets[:, 1, None], orientations[None, :], *arm_lengths, elbow_up
+    )
+    distance = np.abs(_wrap_degrees(orientations[None, :] - preferred[:, None]))
+    distance[status != IK_OK] = np.inf
+    best = np.argmin(distance, axis=1)
+    rows = np.arange(n)
+    found = np.isfinite(distance[rows, best])
+
+    chosen_angles = angles[rows, best]
+    chosen_phi = np.where(found, orientations[best], np.nan)
+    _, preferred_status = _pose_ik_kernel(
+        targets[:, 0], targets[:, 1], preferred, *arm_lengths, elbow_up
+    )
+    chosen_status = np.where(found, IK_OK, preferred_status).astype(np.int8)
+    return chosen_angles, chosen_phi, chosen_status
@@ -0,0 +1,234 @@
+"""Registry that picks the fastest applicable IK solver for an arm topology.
+
+Solvers are registered by name with the topologies they handle and a
+priority (lower is faster). The solver itself is only imported the first
+time it is picked, so specialized kernels cost nothing until used.
+
+Third-party packages can add solvers through the "rasw.ik_solvers" entry
+point group; each entry point must resolve to a SolverSpec.
+"""
+
+import importlib
+import threading
+import warnings
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .inverse_kinematics import IK_NO_SOLVER, IK_TOO_FEW_LINKS
+
+ENTRY_POINT_GROUP = "rasw.ik_solvers"
+
+POSITION = "position"
+POSE = "pose"
+
+
+@dataclass(frozen=True)
+class SolverSpec:
+    """Description of a batch IK solver and the topologies it handles.
+
+    Attributes:
+        name: Unique solver name, reported back by `solve_ik`
+        loader: "module:function" path, or a callable returning the solver
+        min_links: Smallest supported link count
+        max_links: Largest supported link count, None for no limit
+        target: POSITION for (x, y) targets or POSE for (x, y, phi) targets
+        joint_limits: Whether the solver honours joint limits
+        priority: Lower values are preferred when several solvers apply
+    """
+
+    name: str
+    loader: Union[str, Callable[[], Callable]]
+    min_links: int
+    max_links: Optional[int] = None
+    target: str = POSITION
+    joint_limits: bool = False
+    priority: int = 50
+
+    def handles(self, link_count: int, target: str, joint_limits: bool) -> bool:
+        """Check whether this solver applies to the given topology."""
+        if link_count < self.min_links:
+            return False
+        if self.max_links is not None and link_count > self.max_links:
+            return False
+        if joint_limits and not self.joint_limits:
+            return False
+        return target == self.target
+
+
+_registry: Dict[str, SolverSpec] = {}
+_loaded: Dict[str, Callable] = {}
+_entry_points_loaded = False
+# Reentrant so plugins may call register_solver while they are imported
+_lock = threading.RLock()
+
+
+def register_solver(spec: SolverSpec) -> None:
+    """Add a solver, replacing any solver registered under the same name."""
+    with _lock:
+        _registry[spec.name] = spec
+        _loaded.pop(spec.name, None)
+
+
+def _load_entry_points() -> None:
+    """Register the entry point solvers once, on first use.
+
+    Loading happens under the lock and the flag is only set afterwards, so
+    no thread selects from a half-populated registry. A plugin that fails
+    to load is skipped with a warning and the others still load.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    with _lock:
+        if _entry_points_loaded:
+            return
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python < 3.8 without the backport
+            _entry_points_loaded = True
+            return
+
+        found = entry_points()
+        if hasattr(found, "select"):
+            group = found.select(group=ENTRY_POINT_GROUP)
+        else:
+            group = found.get(ENTRY_POINT_GROUP, [])
+        for entry_point in group:
+            try:
+                register_solver(entry_point.load())
+            except Exception as error:
+                warnings.warn(
+                    f"Skipping IK solver plugin {entry_point.name!r}: {error}",
+                    RuntimeWarning,
+                )
+        _entry_points_loaded = True
+
+
+def list_solvers() -> List[SolverSpec]:
+    """Return every registered solver, fastest first."""
+    _load_entry_points()
+    with _lock:
+        specs = list(_registry.values())
+    return sorted(specs, key=lambda spec: spec.priority)
+
+
+def select_solver(
+    link_count: int, target: str = POSITION, joint_limits: bool = False
+) -> Optional[SolverSpec]:
+    """Pick the highest priority solver that handles a topology.
+
+    Args:
+        link_count: Number of arm segments
+        target: POSITION or POSE
+        joint_limits: Whether the solver must honour joint limits
+
+    Returns:
+        The chosen SolverSpec, None if no solver applies
+    """
+    for spec in list_solvers():
+        if spec.handles(link_count, target, joint_limits):
+            return spec
+    return None
+
+
+def _resolve(spec: SolverSpec) -> Callable:
+    solver = _loaded.get(spec.name)
+    if solver is None:
+        if callable(spec.loader):
+            solver = spec.loader()
+        else:
+            module_name, _, attribute = spec.loader.partition(":")
+            solver = getattr(importlib.import_module(module_name), attribute)
+        _loaded[spec.name] = solver
+    return solver
+
+
+def solve_ik(
+    targets: np.ndarray,
+    arm_lengths: List[float],
+    phi: Optional[Union[float, np.ndarray]] = None,
+    joint_limits: Optional[np.ndarray] = None,
+    solver: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray, Optional[str]]:
+    """Solve a batch of targets with the best registered solver.
+
+    Args:
+        targets: Array of shape (N, 2) with target (x, y) positions
+        arm_lengths: List of arm segment lengths
+        phi: Tool orientation in degrees for pose targets, None for position
+        joint_limits: Array of shape (J, 2) with (min, max) joint angles
+        solver: Name of a registered solver to force instead of selecting,
+                it must still handle the link count, target type and joint
+                limits
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, J) with joint angles in degrees, NaN on failure
+        - Array of shape (N,) with a status code per target
+        - Name of the solver that was used, None if no solver applies, in
+          which case every status is IK_NO_SOLVER (IK_TOO_FEW_LINKS for
+          arms with fewer than two links)
+    """
+    target = POSITION if phi is None else POSE
+    if solver is not None:
+        _load_entry_points()
+        with _lock:
+            spec = _registry.get(solver)
+        # A forced solver must fit the arm just like a selected one
+        if spec is not None and not spec.handles(len(arm_lengths), target, joint_limits is not None):
+            spec = None
+    else:
+        spec = select_solver(len(arm_lengths), target, joint_limits is not None)
+
+    if spec is None:
+        n = np.asarray(targets).reshape(-1, 2).shape[0]
+        code = IK_TOO_FEW_LINKS if len(arm_lengths) < 2 else IK_NO_SOLVER
+        return np.full((n, len(arm_lengths)), np.nan), np.full(n, code, dtype=np.int8), None
+
+    options = {}
+    if spec.target == POSE:
+        options["phi"] = phi
+    if spec.joint_limits and joint_limits is not None:
+        options["joint_limits"] = joint_limits
+    angles, status = _resolve(spec)(targets=targets, arm_lengths=arm_lengths, **options)
+    return angles, status, spec.name
+
+
+register_solver(
+    SolverSpec(
+        name="analytic-2link",
+        loader="RASW.IK.inverse_kinematics:calculate_ik_batch",
+        min_links=2,
+        max_links=2,
+        priority=0,
+    )
+)
+register_solver(
+    SolverSpec(
+        name="heuristic-3link",
+        loader="RASW.IK.inverse_kinematics:calculate_ik_batch",
+        min_links=3,
+        max_links=3,
+        priority=10,
+    )
+)
+register_solver(
+    SolverSpec(
+        name="analytic-pose-3link",
+        loader="RASW.IK.pose:calculate_pose_ik_batch",
+        min_links=3,
+        max_links=3,
+        target=POSE,
+        priority=0,
+    )
+)
+register_solver(
+    SolverSpec(
+        name="numeric-dls",
+        loader="RASW.IK.numeric:calculate_ik_numeric_batch",
+        min_links=2,
+        joint_limits=True,
+        priority=100,
+    )
+)
@@ -0,0 +1,225 @@
+"""Resolved-rate (differential) IK for streaming velocity commands.
+
+Teleoperation sends end effector velocities at a high rate. Rather than
+solving position IK every tick, which wastes work and can jump between
+elbow branches, the controller maps each velocity to joint velocities with a
+damped pseudo-inverse of the Jacobian and integrates them:
+
+    q_dot = J# v + (I - J# J) z,    J# = J^T (J J^T + lambda^2 I)^-1
+
+The damping keeps joint speeds bounded near singularities. For redundant
+arms (more than two joints) z pulls the joints towards a rest pose inside
+the null space of J. Because J# is damped the projection is not exact and
+the tool drifts at lambda^2 (J J^T + lambda^2 I)^-1 J z, so use a small
+damping when the null-space goal must not move the tool.
+
+All working arrays are allocated once, so a tick does not allocate NumPy
+arrays. A controller can also step N independent arms at once for
+simulating many sessions.
+"""
+
+import numpy as np
+from typing import List, Optional
+
+from RASW.FK.forward_kinematics import _cumulative_sin_cos
+from RASW.FK.jacobian import _jacobian_from_sin_cos
+
+
+class ResolvedRateController:
+    """Integrate end effector velocity commands into joint angles.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        joint_angles: Starting joint angles in degrees, shape (J,) for one
+                      arm or (N, J) to step N arms in lockstep
+        damping: Damping factor relative to the total arm length
+        joint_limits: Array of shape (J, 2) with (min, max) joint angles in
+                      degrees
+        max_joint_speed: Joint speed limit in degrees per second, commands
+                         that need more are slowed down along their direction
+        rest_angles: Joint angles in degrees the null-space goal pulls
+                     towards, the middle of the joint limits or the starting
+                     pose by default
+        null_space_gain: Rate in 1/s at which redundant joints approach
+                         rest_angles, 0 disables the secondary goal
+    """
+
+    def __init__(
+        self,
+        arm_lengths: List[float],
+        joint_angles: np.ndarray,
+        damping: float = 1e-2,
+        joint_limits: Optional[np.ndarray] = None,
+        max_joint_speed: Optional[float] = None,
+        rest_angles: Optional[np.ndarray] = None,
+        null_space_gain: float = 0.0,
+    ):
+        joint_angles = np.asarray(joint_angles, dtype=float)
+        self.batched = joint_angles.ndim == 2
+        self.arm_lengths = np.asarray(arm_lengths, dtype=float)
+        if joint_angles.shape[-1] != self.arm_lengths.shape[0]:
+            raise ValueError("Number of arm lengths must match number of joint angles")
+
+        self.joint_limits = None if joint_limits is None else np.asarray(joint_limits, dtype=float)
+        self.max_joint_speed = None if max_joint_speed is None else np.radians(max_joint_speed)
+        self.null_space_gain = float(null_space_gain)
+        self._lambda2 = (damping * self.arm_lengths.sum()) ** 2
+
+        angles = np.array(np.atleast_2d(joint_angles))
+        n, j = angles.shape
+        self._angles = angles
+        if rest_angles is None:
+            rest_angles = (
+                self.joint_limits.mean(axis=1) if self.joint_limits is not None else angles
+            )
+        self._rest = np.radians(np.broadcast_to(rest_angles, (n, j)))
+
+        # Working arrays reused on every tick
+        self._radians = np.empty((n, j))
+        self._cos = np.empty((n, j))
+        self._sin = np.empty((n, j))
+        self._link_x = np.empty((n, j))
+        self._link_y = np.empty((n, j))
+        self._jac_x = np.empty((n, j))
+        self._jac_y = np.empty((n, j))
+        self._rate = np.empty((n, j))
+        self._secondary = np.empty((n, j))
+        self._scratch = np.empty((n, j))
+        self._a = np.empty(n)
+        self._b = np.empty(n)
+        self._d = np.empty(n)
+        self._det = np.empty(n)
+        self._wx = np.empty(n)
+        self._wy = np.empty(n)
+        self._ex = np.empty(n)
+        self._ey = np.empty(n)
+        self._tip = np.empty((n, 2))
+        # Reversed views for the tip-to-base cumulative sums of the Jacobian
+        self._link_x_reversed = self._link_x[:, ::-1]
+        self._link_y_reversed = self._link_y[:, ::-1]
+        self._jac_x_reversed = self._jac_x[:, ::-1]
+        self._jac_y_reversed = self._jac_y[:, ::-1]
+        self._update_kinematics()
+
+    @property
+    def joint_angles(self) -> np.ndarray:
+        """Current joint angles in degrees, (J,) or (N, J). Do not modify."""
+        return self._angles if self.batched else self._angles[0]
+
+    @property
+    def end_effector(self) -> np.ndarray:
+        """Current end effector (x, y), (2,) or (N, 2)."""
+        return self._tip if self.batched else self._tip[0]
+
+    @property
+    def jacobian(self) -> np.ndarray:
+        """Jacobian at the current pose in length units per radian."""
+        cos, sin = _cumulative_sin_cos(self._angles)
+        jacobian = _jacobian_from_sin_cos(self.arm_lengths, cos, sin)
+        return jacobian if self.batched else jacobian[0]
+
+    def _update_kinematics(self) -> None:
+        np.radians(self._angles, out=self._radians)
+        np.cumsum(self._radians, axis=1, out=self._scratch)
+        np.cos(self._scratch, out=self._cos)
+        np.sin(self._scratch, out=self._sin)
+        np.multiply(self.arm_lengths, self._cos, out=self._link_x)
+        np.multiply(self.arm_lengths, self._sin, out=self._link_y)
+        np.sum(self._link_x, axis=1, out=self._tip[:, 0])
+        np.sum(self._link_y, axis=1, out=self._tip[:, 1])
+        np.cumsum(self._link_y_reversed, axis=1, out=self._jac_x_reversed)
+        np.negative(self._jac_x, out=self._jac_x)
+        np.cumsum(self._link_x_reversed, axis=1, out=self._jac_y_reversed)
+
+        # A = J J^T + lambda^2 I as its three distinct entries
+        np.multiply(self._jac_x, self._jac_x, out=self._scratch)
+        np.sum(self._scratch, axis=1, out=self._a)
+        self._a += self._lambda2
+        np.multiply(self._jac_x, self._jac_y, out=self._scratch)
+        np.sum(self._scratch, axis=1, out=self._b)
+        np.multiply(self._jac_y, self._jac_y, out=self._scratch)
+        np.sum(self._scratch, axis=1, out=self._d)
+        self._d += self._lambda2
+        np.multiply(self._a, self._d, out=self._det)
+        np.multiply(self._b, self._b, out=self._wx)
+        self._det -= self._wx
+
+    def _solve(self, vx: np.ndarray, vy: np.ndarray) -> None:
+        """Set (wx, wy) = A^-1 (vx, vy)."""
+        np.multiply(self._d, vx, out=self._wx)
+        np.multiply(self._b, vy, out=self._scratch[:, 0])
+        self._wx -= self._scratch[:, 0]
+        self._wx /= self._det
+        np.multiply(self._a, vy, out=self._wy)
+        np.multiply(self._b, vx, out=self._scratch[:, 0])
+        self._wy -= self._scratch[:, 0]
+        self._wy /= self._det
+
+    def _add_jt_w(self, out: np.ndarray, sign: float) -> None:
+        """out += sign * J^T (wx, wy)."""
+        np.multiply(self._jac_x, self._wx[:, None], out=self._scratch)
+        if sign > 0:
+            out += self._scratch
+        else:
+            out -= self._scratch
+        np.multiply(self._jac_y, self._wy[:, None], out=self._scratch)
+        if sign > 0:
+            out += self._scratch
+        else:
+            out -= self._scratch
+
+    def step(self, velocity: np.ndarray, dt: float) -> np.ndarray:
+        """Apply an end effector velocity for dt seconds.
+
+        Args:
+            velocity: End effector velocity (vx, vy) in length units per
+                      second, shape (2,) or (N, 2)
+            dt: Tick length in seconds
+
+        Returns:
+            The new joint angles in degrees, a view that the next step
+            overwrites
+        """
+        velocity = np.asarray(velocity, dtype=float)
+        if velocity.ndim == 1:
+            vx, vy = velocity[0], velocity[1]
+            self._ex.fill(vx)
+            self._ey.fill(vy)
+        else:
+            self._ex[:] = velocity[:, 0]
+            self._ey[:] = velocity[:, 1]
+
+        # Primary task: q_dot = J^T A^-1 v
+        self._solve(self._ex, self._ey)
+        self._rate.fill(0.0)
+        self._add_jt_w(self._rate, 1.0)
+
+        if self.null_space_gain:
+            # z = k (rest - q), projected onto the null space as z - J# J z
+            np.subtract(self._rest, self._radians, out=self._secondary)
+            self._secondary *= self.null_space_gain
+            np.multiply(self._jac_x, self._secondary, out=self._scratch)
+            np.sum(self._scratch, axis=1, out=self._ex)
+            np.multiply(self._jac_y, self._secondary, out=self._scratch)
+            np.sum(self._scratch, axis=1, out=self._ey)
+            self._solve(self._ex, self._ey)
+            self._add_jt_w(self._secondary, -1.0)
+            self._rate += self._secondary
+
+        if self.max_joint_speed is not None:
+            # Scale the whole joint velocity so the direction is kept
+            np.abs(self._rate, out=self._scratch)
+            np.max(self._scratch, axis=1, out=self._wx)
+            np.maximum(self._wx, self.max_joint_speed, out=self._wx)
+            np.divide(self.max_joint_speed, self._wx, out=self._wx)
+            self._rate *= self._wx[:, None]
+
+        np.degrees(self._rate, out=self._rate)
+        self._rate *= dt
+        self._angles += self._rate
+        if self.joint_limits is not None:
+            np.clip(
+                self._angles, self.joint_limits[:, 0], self.joint_limits[:, 1], out=self._angles
+            )
+        self._update_kinematics()
+        return self.joint_angles
@@ -0,0 +1,201 @@
+"""Spatial-hash index of solved poses for warm-starting iterative IK.
+
+Iterative solvers converge in far fewer steps from a seed close to the
+answer. `WarmStartIndex` remembers (target -> joint angles) pairs for one arm
+and hands back the solution of the nearest remembered target as the seed for
+a new one.
+
+Targets are hashed into square cells. A query looks at the target's cell and
+its eight neighbours, so any remembered target within one cell size is
+found. The index holds at most capacity entries and evicts the least
+recently used ones first, and it can be saved to disk so a restarted process
+starts warm.
+
+An index is not thread safe; guard it with a lock when threads share it.
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from .numeric import default_seed
+
+# Offset that keeps the packed cell row non-negative
+_ROW_OFFSET = 1 << 31
+
+
+class WarmStartIndex:
+    """Bounded nearest-target lookup of previously solved joint angles.
+
+    Args:
+        arm_lengths: List of arm segment lengths the solutions belong to
+        capacity: Maximum number of remembered solutions, at least 1
+        cell_size: Hash cell edge length, 1/64 of the reach by default
+    """
+
+    def __init__(
+        self,
+        arm_lengths: List[float],
+        capacity: int = 100_000,
+        cell_size: Optional[float] = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        self.arm_lengths = np.asarray(arm_lengths, dtype=float)
+        self.capacity = int(capacity)
+        self.cell_size = float(cell_size or self.arm_lengths.sum() / 64)
+        joint_count = self.arm_lengths.shape[-1]
+
+        self.size = 0
+        self._targets = np.empty((self.capacity, 2))
+        self._angles = np.empty((self.capacity, joint_count))
+        self._keys = np.empty(self.capacity, dtype=np.int64)
+        self._last_used = np.zeros(self.capacity, dtype=np.int64)
+        self._clock = 0
+        self._order: Optional[np.ndarray] = None
+        self._sorted_keys: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _cells(self, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cells = np.floor(targets / self.cell_size).astype(np.int64)
+        return cells[:, 0], cells[:, 1]
+
+    @staticmethod
+    def _pack(column: np.ndarray, row: np.ndarray) -> np.ndarray:
+        return (column << 32) + row + _ROW_OFFSET
+
+    def matches(self, arm_lengths: List[float]) -> bool:
+        """Check that the index was built for this arm."""
+        arm_lengths = np.asarray(arm_lengths, dtype=float)
+        return arm_lengths.shape == self.arm_lengths.shape and np.allclose(
+            arm_lengths, self.arm_lengths
+        )
+
+    def insert(self, targets: np.ndarray, joint_angles: np.ndarray) -> None:
+        """Remember solved targets, evicting the least recently used on overflow.
+
+        Rows with NaN angles (failed solves) are skipped.
+
+        Args:
+            targets: Array of shape (N, 2) with target (x, y) positions
+            joint_angles: Array of shape (N, J) with joint angles in degrees
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        joint_angles = np.asarray(joint_angles, dtype=float).reshape(targets.shape[0], -1)
+        solved = ~np.isnan(joint_angles).any(axis=1)
+        targets, joint_angles = targets[solved], joint_angles[solved]
+        if targets.shape[0] > self.capacity:
+            targets, joint_angles = targets[-self.capacity :], joint_angles[-self.capacity :]
+        count = targets.shape[0]
+        if not count:
+            return
+
+        free = self.capacity - self.size
+        slots = np.arange(self.size, self.size + min(free, count))
+        if count > free:
+            evicted = np.argpartition(self._last_used[: self.size], count - free - 1)
+            slots = np.concatenate([slots, evicted[: count - free]])
+        self.size += min(free, count)
+
+        self._clock += 1
+        self._targets[slots] = targets
+        self._angles[slots] = joint_angles
+        self._keys[slots] = self._pack(*self._cells(targets))
+        self._last_used[slots] = self._clock
+        self._order = None
+
+    def query(
+        self, targets: np.ndarray, max_distance: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the remembered solution nearest to each target.
+
+        Args:
+            targets: Array of shape (N, 2) with target (x, y) positions
+            max_distance: Ignore solutions further than this from the target
+
+        Returns:
+            Tuple containing:
+            - Array of shape (N, J) with joint angles in degrees, NaN where
+              no solution was found nearby
+            - Array of shape (N,) with the distance to the remembered
+              target, inf where none was found
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        n = targets.shape[0]
+        best = np.full(n, -1, dtype=np.int64)
+        best_distance = np.full(n, np.inf if max_distance is None else float(max_distance))
+
+        if self.size:
+            if self._order is None:
+                self._order = np.argsort(self._keys[: self.size], kind="stable")
+                self._sorted_keys = self._keys[self._order]
+            column, row = self._cells(targets)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    key = self._pack(column + dx, row + dy)
+                    low = np.searchsorted(self._sorted_keys, key, side="left")
+                    run = np.searchsorted(self._sorted_keys, key, side="right") - low
+                    # Walk the entries of every target's cell in lockstep
+                    for offset in range(int(run.max(initial=0))):
+                        rows = np.flatnonzero(run > offset)
+                        slots = self._order[low[rows] + offset]
+                        delta = targets[rows] - self._targets[slots]
+                        distance = np.hypot(delta[:, 0], delta[:, 1])
+                        closer = distance < best_distance[rows]
+                        best_distance[rows[closer]] = distance[closer]
+                        best[rows[closer]] = slots[closer]
+
+        found = best >= 0
+        angles = np.full((n, self._angles.shape[1]), np.nan)
+        angles[found] = self._angles[best[found]]
+        best_distance[~found] = np.inf
+        if found.any():
+            self._clock += 1
+            self._last_used[best[found]] = self._clock
+        return angles, best_distance
+
+    def seed(self, targets: np.ndarray) -> np.ndarray:
+        """Initial guesses for an iterative solver.
+
+        Targets without a remembered neighbour get `default_seed`.
+
+        Args:
+            targets: Array of shape (N, 2) with target (x, y) positions
+
+        Returns:
+            Array of shape (N, J) with joint angles in degrees
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        angles, _ = self.query(targets)
+        missing = np.isnan(angles[:, 0])
+        if missing.any():
+            angles[missing] = default_seed(targets[missing], angles.shape[1])
+        return angles
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to an .npz file."""
+        np.savez(
+            path,
+            arm_lengths=self.arm_lengths,
+            capacity=self.capacity,
+            cell_size=self.cell_size,
+            targets=self._targets[: self.size],
+            angles=self._angles[: self.size],
+            last_used=self._last_used[: self.size],
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "WarmStartIndex":
+        """Read an index written by `save`."""
+        with np.load(path) as data:
+            index = cls(data["arm_lengths"], int(data["capacity"]), float(data["cell_size"]))
+            size = data["targets"].shape[0]
+            index._targets[:size] = data["targets"]
+            index._angles[:size] = data["angles"]
+            index._last_used[:size] = data["last_used"]
+        index.size = size
+        index._keys[:size] = index._pack(*index._cells(index._targets[:size]))
+        index._clock = int(index._last_used[:size].max(initial=0))
+        return index
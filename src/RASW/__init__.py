@@ -3,11 +3,57 @@
 __version__ = "0.1.0"
 
 # Import main functionality
-from RASW.FK import calculate_fk
-from RASW.IK import calculate_ik
+from RASW.FK import (
+    QuantizedFK,
+    calculate_fk,
+    calculate_fk_batch,
+    calculate_jacobian,
+    condition_number,
+    manipulability,
+)
+from RASW.IK import (
+    IK_NO_SOLVER,
+    IK_STATUS_MESSAGES,
+    calculate_ik,
+    calculate_ik_batch,
+    calculate_ik_best_effort,
+    calculate_pose_ik,
+    calculate_pose_ik_batch,
+    find_feasible_orientation,
+    project_to_reachable,
+    solve_ik,
+)
+from RASW.fleet import calculate_fk_fleet, calculate_ik_fleet
+from RASW.pool import SolverPool
+from RASW.stream import iter_fk, iter_ik
+from RASW.uncertainty import analytic_uncertainty, monte_carlo_uncertainty
 
 # Expose key functions at the package level
-__all__ = ["calculate_fk", "calculate_ik"]
+__all__ = [
+    "IK_NO_SOLVER",
+    "IK_STATUS_MESSAGES",
+    "QuantizedFK",
+    "SolverPool",
+    "analytic_uncertainty",
+    "calculate_fk",
+    "calculate_fk_batch",
+    "calculate_fk_fleet",
+    "calculate_ik",
+    "calculate_ik_batch",
+    "calculate_ik_best_effort",
+    "calculate_ik_fleet",
+    "calculate_jacobian",
+    "calculate_pose_ik",
+    "calculate_pose_ik_batch",
+    "condition_number",
+    "find_feasible_orientation",
+    "iter_fk",
+    "iter_ik",
+    "manipulability",
+    "monte_carlo_uncertainty",
+    "project_to_reachable",
+    "solve_ik",
+]
 
 # Check if this is the first import after installation
 import os
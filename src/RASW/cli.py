@@ -35,6 +35,37 @@ def main():
     ik_parser.add_argument("--lengths", nargs="+", type=float, required=True,
                           help="Arm segment lengths")
     
+    # Round-trip accuracy and throughput harness
+    roundtrip_parser = subparsers.add_parser(
+        "roundtrip", help="Check that IK solutions reach their targets through FK"
+    )
+    roundtrip_parser.add_argument("--lengths", nargs="+", type=float, required=True,
+                                  help="Arm segment lengths")
+    roundtrip_parser.add_argument("--samples", type=int, default=1_000_000,
+                                  help="Number of targets sampled across the workspace")
+    roundtrip_parser.add_argument("--tolerance", type=float, default=1e-6,
+                                  help="Round-trip error that counts as a miss")
+    roundtrip_parser.add_argument("--seed", type=int, default=0,
+                                  help="Seed for the target sampler")
+
+    # Parallel replay of recorded joint logs
+    replay_parser = subparsers.add_parser(
+        "replay", help="Reconstruct tool tip paths from recorded joint logs"
+    )
+    replay_parser.add_argument("logs", nargs="+",
+                               help="Joint logs (.npy or .csv) with rows of time, angles...")
+    replay_parser.add_argument("--lengths", nargs="+", type=float, required=True,
+                               help="Arm segment lengths")
+    replay_parser.add_argument("--output", default="replay",
+                               help="Directory for the tool tip paths")
+    replay_parser.add_argument("--workspace", nargs=4, type=float,
+                               metavar=("X_MIN", "Y_MIN", "X_MAX", "Y_MAX"),
+                               help="Box the tool tip should stay inside")
+    replay_parser.add_argument("--workers", type=int, default=None,
+                               help="Worker processes, one per CPU by default")
+    replay_parser.add_argument("--chunk-size", type=int, default=65536,
+                               help="Rows per FK call in each worker")
+    
     args = parser.parse_args()
     
     if args.command is None:
@@ -71,6 +102,31 @@ def main():
         else:
             print("No solution found.")
 
+    elif args.command == "roundtrip":
+        from RASW.roundtrip import run_roundtrip
+
+        report = run_roundtrip(
+            args.lengths, samples=args.samples, tolerance=args.tolerance, seed=args.seed
+        )
+        print(report.format())
+
+    elif args.command == "replay":
+        from RASW.replay import replay_logs
+
+        try:
+            report = replay_logs(
+                args.logs,
+                args.lengths,
+                args.output,
+                workspace=tuple(args.workspace) if args.workspace else None,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+            )
+        except (OSError, ValueError) as exc:
+            print(f"Error: {exc}")
+            return 1
+        print(report.format())
+
 
 if __name__ == "__main__":
     sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""Collision and clearance checking for RASW."""
+
+from .multi_arm import ArmContacts, ArmModel, check_arm_collisions, segment_distance
+from .sdf import Box, Circle, SignedDistanceField, link_sample_points
+from .swept import SweptCheck, check_swept, swept_motion_bound
+
+__all__ = [
+    "ArmContacts",
+    "ArmModel",
+    "Box",
+    "Circle",
+    "SignedDistanceField",
+    "SweptCheck",
+    "check_arm_collisions",
+    "check_swept",
+    "link_sample_points",
+    "segment_distance",
+    "swept_motion_bound",
+]
@@ -0,0 +1,201 @@
+"""Collision checking between arms that share a workspace.
+
+Every link is a capsule: a segment between two joints with a radius. The
+links of all arms at all timesteps go into one uniform spatial hash whose
+cells are at least as large as any padded link, so a link covers at most
+2 x 2 cells. Links of different arms that share a cell at the same timestep
+are candidate pairs, and only those get the exact segment distance test.
+Hashing, pairing and the distance test are all array operations, so a
+whole trajectory of many arms is checked in one call.
+"""
+
+import numpy as np
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from RASW.fleet import calculate_fk_fleet, pad_arm_lengths
+
+
+class ArmModel(NamedTuple):
+    """An arm placed in a shared workspace.
+
+    Attributes:
+        arm_lengths: List of arm segment lengths
+        base: Base pose (x, y, theta) with theta in degrees
+        radius: Half the link thickness
+    """
+
+    arm_lengths: Sequence[float]
+    base: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    radius: float = 0.0
+
+
+class ArmContacts(NamedTuple):
+    """Pairs of links from different arms that are too close.
+
+    Every attribute is an array with one entry per contact, sorted by
+    timestep. arm_a is always smaller than arm_b.
+
+    Attributes:
+        timestep: Index of the timestep
+        arm_a: Index of the first arm
+        link_a: Link index on the first arm
+        arm_b: Index of the second arm
+        link_b: Link index on the second arm
+        distance: Distance between the link surfaces, negative when they
+                  overlap
+    """
+
+    timestep: np.ndarray
+    arm_a: np.ndarray
+    link_a: np.ndarray
+    arm_b: np.ndarray
+    link_b: np.ndarray
+    distance: np.ndarray
+
+
+def segment_distance(
+    a0: np.ndarray, a1: np.ndarray, b0: np.ndarray, b1: np.ndarray
+) -> np.ndarray:
+    """Distance between 2D segments a0-a1 and b0-b1, arrays of shape (..., 2).
+
+    Crossing segments are 0 apart. Otherwise the closest pair of points
+    includes an endpoint, so the distance is the smallest of the four
+    endpoint-to-segment distances.
+    """
+
+    def cross(u, v):
+        return u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+
+    def point_segment(p, s0, s1):
+        direction = s1 - s0
+        length2 = (direction**2).sum(-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = np.clip(((p - s0) * direction).sum(-1) / length2, 0.0, 1.0)
+        t = np.where(length2 > 0, t, 0.0)
+        closest = s0 + t[..., None] * direction
+        return np.hypot(p[..., 0] - closest[..., 0], p[..., 1] - closest[..., 1])
+
+    da, db = a1 - a0, b1 - b0
+    side_b0 = cross(da, b0 - a0)
+    side_b1 = cross(da, b1 - a0)
+    side_a0 = cross(db, a0 - b0)
+    side_a1 = cross(db, a1 - b0)
+    crossing = (side_b0 * side_b1 < 0) & (side_a0 * side_a1 < 0)
+    distance = np.minimum(
+        np.minimum(point_segment(a0, b0, b1), point_segment(a1, b0, b1)),
+        np.minimum(point_segment(b0, a0, a1), point_segment(b1, a0, a1)),
+    )
+    return np.where(crossing, 0.0, distance)
+
+
+def check_arm_collisions(
+    arms: Sequence[ArmModel],
+    joint_angles: Sequence[np.ndarray],
+    margin: float = 0.0,
+    cell_size: Optional[float] = None,
+) -> ArmContacts:
+    """Find links of different arms closer than margin.
+
+    Args:
+        arms: The arms sharing the workspace
+        joint_angles: One array per arm with its joint angles in degrees,
+                      shape (J,) for a single timestep or (T, J) for a
+                      trajectory; every arm needs the same T
+        margin: Required distance between link surfaces
+        cell_size: Spatial hash cell size, the longest padded link by
+                   default and never smaller
+
+    Returns:
+        ArmContacts with every pair of links closer than margin
+    """
+    arm_count = len(arms)
+    if len(joint_angles) != arm_count:
+        raise ValueError("Need one joint angle array per arm")
+    lengths, link_counts = pad_arm_lengths([arm.arm_lengths for arm in arms])
+    max_links = lengths.shape[1]
+    per_arm = [np.atleast_2d(np.asarray(angles, dtype=float)) for angles in joint_angles]
+    steps = per_arm[0].shape[0] if per_arm else 0
+    if any(angles.shape[0] != steps for angles in per_arm):
+        raise ValueError("Every arm needs the same number of timesteps")
+    angles = np.zeros((steps, arm_count, max_links))
+    for index, arm_angles in enumerate(per_arm):
+        angles[:, index, : arm_angles.shape[1]] = arm_angles
+
+    # FK for every arm at every timestep as one (T * A)-row fleet
+    bases = np.array([arm.base for arm in arms], dtype=float)
+    positions, error = calculate_fk_fleet(
+        np.tile(lengths, (steps, 1)),
+        angles.reshape(-1, max_links),
+        np.tile(link_counts, steps),
+        np.tile(bases, (steps, 1)),
+    )
+    if error:
+        raise ValueError(error)
+    start = positions[:, :-1].reshape(-1, 2)
+    end = positions[:, 1:].reshape(-1, 2)
+
+    # One entry per (timestep, arm, link), dropping padding links
+    link_index = np.tile(np.arange(max_links), steps * arm_count)
+    arm_index = np.tile(np.repeat(np.arange(arm_count), max_links), steps)
+    timestep = np.repeat(np.arange(steps), arm_count * max_links)
+    real = link_index < link_counts[arm_index]
+    start, end = start[real], end[real]
+    link_index, arm_index, timestep = link_index[real], arm_index[real], timestep[real]
+    radius = np.array([arm.radius for arm in arms], dtype=float)[arm_index]
+
+    # Boxes padded so overlapping boxes are exactly the candidate pairs
+    pad = (radius + margin / 2)[:, None]
+    low = np.minimum(start, end) - pad
+    high = np.maximum(start, end) + pad
+    longest = float((high - low).max(initial=0.0))
+    cell = max(cell_size or 0.0, longest, 1e-9)
+    first = np.floor(low / cell).astype(np.int64)
+    last = np.floor(high / cell).astype(np.int64)
+
+    entries, cells = [], []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            covered = (first[:, 0] + dx <= last[:, 0]) & (first[:, 1] + dy <= last[:, 1])
+            rows = np.flatnonzero(covered)
+            entries.append(rows)
+            cells.append(np.stack([first[rows, 0] + dx, first[rows, 1] + dy], axis=-1))
+    entries = np.concatenate(entries)
+    cells = np.concatenate(cells)
+    cells -= cells.min(axis=0, initial=0)
+    span = cells.max(axis=0, initial=0) + 1
+    key = (timestep[entries] * span[0] + cells[:, 0]) * span[1] + cells[:, 1]
+    order = np.argsort(key, kind="stable")
+    key, entries = key[order], entries[order]
+
+    # Pair every entry with the later entries of the same cell
+    pair_a, pair_b = [], []
+    offset = 1
+    while offset < key.size:
+        same = np.flatnonzero(key[offset:] == key[:-offset])
+        if not same.size:
+            break
+        a, b = entries[same], entries[same + offset]
+        different = arm_index[a] != arm_index[b]
+        pair_a.append(a[different])
+        pair_b.append(b[different])
+        offset += 1
+
+    empty = np.empty(0, dtype=np.int64)
+    if not pair_a:
+        return ArmContacts(empty, empty, empty, empty, empty, np.empty(0))
+    a = np.concatenate(pair_a)
+    b = np.concatenate(pair_b)
+    # Order each pair by arm and drop pairs found in several cells
+    swap = arm_index[a] > arm_index[b]
+    a, b = np.where(swap, b, a), np.where(swap, a, b)
+    unique = np.unique(a * start.shape[0] + b)
+    a, b = unique // start.shape[0], unique % start.shape[0]
+
+    distance = segment_distance(start[a], end[a], start[b], end[b]) - radius[a] - radius[b]
+    close = distance < margin
+    a, b, distance = a[close], b[close], distance[close]
+    order = np.argsort(timestep[a], kind="stable")
+    a, b, distance = a[order], b[order], distance[order]
+    return ArmContacts(
+        timestep[a], arm_index[a], link_index[a], arm_index[b], link_index[b], distance
+    )
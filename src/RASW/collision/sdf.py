@@ -0,0 +1,221 @@
+"""Grid signed-distance field of static obstacles for fast clearance queries."""
+
+import hashlib
+import math
+import os
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+class Circle(NamedTuple):
+    """Circular obstacle."""
+
+    x: float
+    y: float
+    radius: float
+
+    def signed_distance(self, points: np.ndarray) -> np.ndarray:
+        """Exact signed distance, negative inside the obstacle."""
+        return np.hypot(points[..., 0] - self.x, points[..., 1] - self.y) - self.radius
+
+
+class Box(NamedTuple):
+    """Axis-aligned rectangular obstacle."""
+
+    x_min: float
+    y_min: float
+    x_max: float
+    y_max: float
+
+    def signed_distance(self, points: np.ndarray) -> np.ndarray:
+        """Exact signed distance, negative inside the obstacle."""
+        cx, cy = (self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2
+        hx, hy = (self.x_max - self.x_min) / 2, (self.y_max - self.y_min) / 2
+        dx = np.abs(points[..., 0] - cx) - hx
+        dy = np.abs(points[..., 1] - cy) - hy
+        outside = np.hypot(np.maximum(dx, 0.0), np.maximum(dy, 0.0))
+        inside = np.minimum(np.maximum(dx, dy), 0.0)
+        return outside + inside
+
+
+Obstacle = Union[Circle, Box]
+Bounds = Tuple[float, float, float, float]
+
+# Default directory for baked fields, override with RASW_CACHE_DIR
+DEFAULT_CACHE_DIR = Path(os.environ.get("RASW_CACHE_DIR", Path.home() / ".cache" / "rasw"))
+
+
+class SignedDistanceField:
+    """Signed distance to the nearest obstacle sampled on a regular grid.
+
+    Lookups use bilinear interpolation between grid nodes. The exact signed
+    distance changes by at most one unit per unit of travel, so an
+    interpolated value is within `max_interpolation_error` of the truth.
+
+    Args:
+        values: Array of shape (H, W) with the distance at each node
+        origin: (x, y) position of node [0, 0]
+        resolution: Spacing between nodes
+    """
+
+    def __init__(self, values: np.ndarray, origin: Tuple[float, float], resolution: float):
+        self.values = np.asarray(values, dtype=float)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.resolution = float(resolution)
+
+    @property
+    def max_interpolation_error(self) -> float:
+        """Worst case difference between a lookup and the exact distance."""
+        return self.resolution * math.sqrt(2) / 2
+
+    @property
+    def bounds(self) -> Bounds:
+        """(x_min, y_min, x_max, y_max) covered by the grid."""
+        height, width = self.values.shape
+        return (
+            self.origin[0],
+            self.origin[1],
+            self.origin[0] + (width - 1) * self.resolution,
+            self.origin[1] + (height - 1) * self.resolution,
+        )
+
+    @classmethod
+    def bake(
+        cls,
+        obstacles: Sequence[Obstacle],
+        bounds: Bounds,
+        resolution: float,
+        rows_per_chunk: int = 256,
+    ) -> "SignedDistanceField":
+        """Evaluate the exact signed distance at every grid node.
+
+        Args:
+            obstacles: Circles and boxes making up the static cell
+            bounds: (x_min, y_min, x_max, y_max) area to cover
+            resolution: Spacing between nodes
+            rows_per_chunk: Grid rows evaluated at once, bounds peak memory
+
+        Returns:
+            The baked SignedDistanceField
+        """
+        if not obstacles:
+            raise ValueError("Need at least one obstacle to bake a distance field")
+        x_min, y_min, x_max, y_max = bounds
+        xs = x_min + resolution * np.arange(int(math.ceil((x_max - x_min) / resolution)) + 1)
+        ys = y_min + resolution * np.arange(int(math.ceil((y_max - y_min) / resolution)) + 1)
+        values = np.full((ys.size, xs.size), np.inf)
+        for start in range(0, ys.size, rows_per_chunk):
+            gx, gy = np.meshgrid(xs, ys[start : start + rows_per_chunk])
+            points = np.stack([gx, gy], axis=-1)
+            block = values[start : start + rows_per_chunk]
+            for obstacle in obstacles:
+                np.minimum(block, obstacle.signed_distance(points), out=block)
+        return cls(values, (x_min, y_min), resolution)
+
+    @classmethod
+    def cached(
+        cls,
+        obstacles: Sequence[Obstacle],
+        bounds: Bounds,
+        resolution: float,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> "SignedDistanceField":
+        """Load a previously baked field, baking and saving it on a miss.
+
+        The cache key is a hash of the obstacles, bounds and resolution, so a
+        changed cell is baked again automatically. The file is written under
+        a temporary name and renamed into place, so a concurrent process never
+        loads a half-written field.
+        """
+        key = repr(
+            (sorted((type(o).__name__, tuple(o)) for o in obstacles), tuple(bounds), resolution)
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        path = Path(cache_dir or DEFAULT_CACHE_DIR) / f"sdf-{digest}.npz"
+        if path.exists():
+            return cls.load(path)
+        field = cls.bake(obstacles, bounds, resolution)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                field.save(file)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return field
+
+    def save(self, path: Union[str, Path, BinaryIO]) -> None:
+        """Write the field to an .npz file or open binary file."""
+        np.savez(path, values=self.values, origin=self.origin, resolution=self.resolution)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SignedDistanceField":
+        """Read a field written by `save`."""
+        with np.load(path) as data:
+            return cls(data["values"], tuple(data["origin"]), float(data["resolution"]))
+
+    def distance(self, points: np.ndarray) -> np.ndarray:
+        """Interpolated signed distance at arbitrary points.
+
+        Points outside the grid get the value at the nearest grid point minus
+        their distance to it, which never overestimates the clearance.
+
+        Args:
+            points: Array of shape (..., 2)
+
+        Returns:
+            Array of shape (...)
+        """
+        points = np.asarray(points, dtype=float)
+        height, width = self.values.shape
+        gx = (points[..., 0] - self.origin[0]) / self.resolution
+        gy = (points[..., 1] - self.origin[1]) / self.resolution
+        cx = np.clip(gx, 0, width - 1)
+        cy = np.clip(gy, 0, height - 1)
+        outside = np.hypot(gx - cx, gy - cy) * self.resolution
+
+        ix = np.minimum(cx.astype(np.intp), width - 2)
+        iy = np.minimum(cy.astype(np.intp), height - 2)
+        fx = cx - ix
+        fy = cy - iy
+        v = self.values
+        top = v[iy, ix] * (1 - fx) + v[iy, ix + 1] * fx
+        bottom = v[iy + 1, ix] * (1 - fx) + v[iy + 1, ix + 1] * fx
+        return top * (1 - fy) + bottom * fy - outside
+
+    def clearance(self, positions: np.ndarray, samples_per_link: int = 8) -> np.ndarray:
+        """Minimum distance to the obstacles along every link.
+
+        Links are sampled at evenly spaced points including both ends. A point
+        between two samples is at most half the sample spacing away from one,
+        so subtract that (and `max_interpolation_error`) for a strict bound.
+
+        Args:
+            positions: Array of shape (N, J + 1, 2) from `calculate_fk_batch`
+            samples_per_link: Number of samples along each link
+
+        Returns:
+            Array of shape (N, J) with the clearance of each link
+        """
+        return self.distance(link_sample_points(positions, samples_per_link)).min(axis=-1)
+
+
+def link_sample_points(positions: np.ndarray, samples_per_link: int = 8) -> np.ndarray:
+    """Evenly spaced points along every link of a batch of poses.
+
+    Args:
+        positions: Array of shape (..., J + 1, 2) with joint positions
+        samples_per_link: Number of samples along each link, at least 2
+
+    Returns:
+        Array of shape (..., J, samples_per_link, 2)
+    """
+    positions = np.asarray(positions, dtype=float)
+    s = np.linspace(0.0, 1.0, max(samples_per_link, 2))[:, None]
+    start = positions[..., :-1, None, :]
+    end = positions[..., 1:, None, :]
+    return start + s * (end - start)
@@ -0,0 +1,228 @@
+"""Fixed-rate control loop runner with deadline-miss statistics."""
+
+import bisect
+import gc
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Log-spaced timing histogram edges from 100 ns to 1 s
+HISTOGRAM_EDGES = [float(edge) for edge in np.logspace(-7, 0, 71)]
+
+
+class TimingHistogram:
+    """Fixed-bin histogram of durations in seconds.
+
+    Recording a sample is a bisect into a preallocated edge list and an
+    increment of a preallocated counter, so it does not allocate arrays.
+    """
+
+    def __init__(self, edges: Sequence[float] = HISTOGRAM_EDGES):
+        self.edges = list(edges)
+        self.counts = np.zeros(len(self.edges) + 1, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add one sample."""
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded samples."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound on the q-th percentile (0-100), from the bin edges."""
+        if not self.count:
+            return 0.0
+        rank = int(np.searchsorted(np.cumsum(self.counts), q / 100 * self.count))
+        if rank >= len(self.edges):
+            return self.max
+        return min(self.edges[rank], self.max)
+
+
+@dataclass
+class LoopStats:
+    """Timing statistics collected by `LoopRunner`.
+
+    Attributes:
+        period: Target period in seconds
+        iterations: Number of steps run
+        overruns: Steps that finished after the next deadline
+        missed_cycles: Deadlines skipped because of overruns
+        jitter: Lateness of each step start relative to its deadline
+        step_time: Duration of each step
+        phases: Durations of the phases marked with `LoopContext.mark`
+    """
+
+    period: float
+    iterations: int = 0
+    overruns: int = 0
+    missed_cycles: int = 0
+    jitter: TimingHistogram = field(default_factory=TimingHistogram)
+    step_time: TimingHistogram = field(default_factory=TimingHistogram)
+    phases: Dict[str, TimingHistogram] = field(default_factory=dict)
+
+    def format(self) -> str:
+        """Human readable summary in microseconds."""
+
+        def line(name: str, histogram: TimingHistogram) -> str:
+            return (
+                f"{name}: mean {histogram.mean * 1e6:.1f} us, "
+                f"p99 <= {histogram.percentile(99) * 1e6:.1f} us, "
+                f"max {histogram.max * 1e6:.1f} us"
+            )
+
+        lines = [
+            f"Rate: {1 / self.period:g} Hz, iterations: {self.iterations}",
+            f"Overruns: {self.overruns}, missed cycles: {self.missed_cycles}",
+            line("Jitter", self.jitter),
+            line("Step", self.step_time),
+        ]
+        lines += [line(f"  {name}", histogram) for name, histogram in self.phases.items()]
+        return "\n".join(lines)
+
+
+class LoopContext:
+    """Per-iteration state handed to the step function.
+
+    The same object is reused for every iteration.
+
+    Attributes:
+        iteration: Index of the current step
+        deadline: perf_counter() time the step was scheduled for
+        buffers: Arrays preallocated for the step, see `LoopRunner`
+    """
+
+    def __init__(self, stats: LoopStats, buffers: Dict[str, np.ndarray]):
+        self.iteration = 0
+        self.deadline = 0.0
+        self.buffers = buffers
+        self._stats = stats
+        self._last_mark = 0.0
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the step started or the previous mark."""
+        now = time.perf_counter()
+        histogram = self._stats.phases.get(phase)
+        if histogram is None:
+            histogram = self._stats.phases[phase] = TimingHistogram()
+        histogram.record(now - self._last_mark)
+        self._last_mark = now
+
+
+class LoopRunner:
+    """Call a step function at a fixed rate using absolute deadlines.
+
+    Deadline k is start + k * period, so timing errors do not accumulate the
+    way they do with sleep(period) after each step. The runner sleeps until
+    shortly before the deadline and busy-waits the rest, trading a little
+    CPU for low jitter.
+
+    A step that runs past the next deadline counts as an overrun. The loop
+    then skips the deadlines it missed instead of running a burst of late
+    steps to catch up.
+
+    Args:
+        step: Function called with a LoopContext every period
+        rate_hz: Loop rate in Hz
+        spin_time: Seconds before each deadline to stop sleeping and spin
+        phases: Phase names to preallocate histograms for
+        buffers: Arrays the step writes into instead of allocating, exposed
+                 as context.buffers
+        disable_gc: Disable the garbage collector while the loop runs, so
+                    collections do not land in the middle of a step
+    """
+
+    def __init__(
+        self,
+        step: Callable[[LoopContext], None],
+        rate_hz: float,
+        spin_time: float = 2e-4,
+        phases: Sequence[str] = (),
+        buffers: Optional[Dict[str, np.ndarray]] = None,
+        disable_gc: bool = False,
+    ):
+        if rate_hz <= 0:
+            raise ValueError("Rate must be positive")
+        self.step = step
+        self.period = 1.0 / rate_hz
+        self.spin_time = spin_time
+        self.disable_gc = disable_gc
+        self.stats = LoopStats(self.period)
+        for phase in phases:
+            self.stats.phases[phase] = TimingHistogram()
+        self.context = LoopContext(self.stats, buffers or {})
+        self._running = False
+
+    def stop(self) -> None:
+        """Ask the loop to return after the current step."""
+        self._running = False
+
+    def run(self, iterations: Optional[int] = None, duration: Optional[float] = None) -> LoopStats:
+        """Run until stopped, or for a number of iterations or seconds.
+
+        Args:
+            iterations: Number of steps to run
+            duration: Number of seconds to run
+
+        Returns:
+            The LoopStats accumulated over every call to run
+        """
+        stats = self.stats
+        context = self.context
+        period = self.period
+        spin_time = self.spin_time
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+
+        gc_was_enabled = gc.isenabled()
+        if self.disable_gc:
+            gc.disable()
+        self._running = True
+        start = perf_counter()
+        end = start + duration if duration is not None else float("inf")
+        cycle = 0
+        count = 0
+        try:
+            while self._running and (iterations is None or count < iterations):
+                deadline = start + cycle * period
+                if deadline >= end:
+                    break
+                remaining = deadline - perf_counter()
+                if remaining > spin_time:
+                    sleep(remaining - spin_time)
+                while perf_counter() < deadline:
+                    pass
+
+                began = perf_counter()
+                context.iteration = stats.iterations
+                context.deadline = deadline
+                context._last_mark = began
+                self.step(context)
+                finished = perf_counter()
+
+                stats.jitter.record(began - deadline)
+                stats.step_time.record(finished - began)
+                stats.iterations += 1
+                count += 1
+
+                cycle += 1
+                next_deadline = start + cycle * period
+                if finished > next_deadline:
+                    stats.overruns += 1
+                    skipped = int((finished - next_deadline) / period) + 1
+                    stats.missed_cycles += skipped
+                    cycle += skipped
+        finally:
+            self._running = False
+            if self.disable_gc and gc_was_enabled:
+                gc.enable()
+        return stats
@@ -0,0 +1,211 @@
+"""Link length optimization for new arm designs.
+
+Candidate arms are scored against the target points they must reach:
+the fraction of targets reached (optionally without touching obstacles),
+the mean normalized manipulability at those targets, and the total arm
+length. `optimize_design` searches link lengths with the cross-entropy
+method. Every generation samples a population from a Gaussian, scores each
+candidate with one batched IK pass on a process pool, and refits the
+Gaussian to the best candidates.
+
+The search state is written to a JSON file after every generation, so an
+interrupted run continues where it stopped.
+"""
+
+import json
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from RASW.collision import SignedDistanceField
+from RASW.FK import calculate_fk_batch, calculate_jacobian, manipulability
+from RASW.IK import solve_ik
+
+
+@dataclass
+class DesignWeights:
+    """Weights of the terms in a design score.
+
+    Attributes:
+        coverage: Weight of the fraction of targets reached
+        manipulability: Weight of the mean normalized manipulability
+        length: Penalty per unit of total arm length
+    """
+
+    coverage: float = 1.0
+    manipulability: float = 0.1
+    length: float = 0.0
+
+
+@dataclass
+class DesignScore:
+    """Evaluation of one candidate arm."""
+
+    arm_lengths: List[float]
+    coverage: float
+    manipulability: float
+    total_length: float
+    score: float
+
+
+def evaluate_design(
+    arm_lengths: Sequence[float],
+    targets: np.ndarray,
+    weights: Optional[DesignWeights] = None,
+    sdf: Optional[SignedDistanceField] = None,
+    margin: float = 0.0,
+) -> DesignScore:
+    """Score one candidate arm with a single batched IK pass.
+
+    Manipulability is divided by the square of the total length, so it
+    measures how well conditioned the arm is rather than how big.
+
+    Args:
+        arm_lengths: Candidate link lengths
+        targets: Array of shape (N, 2) with required target positions
+        weights: Score weights, DesignWeights() by default
+        sdf: Optional SignedDistanceField, targets whose IK pose comes
+             within margin of an obstacle do not count as reached
+        margin: Required link clearance when sdf is given
+
+    Returns:
+        DesignScore of the candidate
+    """
+    weights = weights or DesignWeights()
+    arm_lengths = [float(length) for length in arm_lengths]
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    total = float(sum(arm_lengths))
+
+    angles, status, _ = solve_ik(targets, arm_lengths)
+    reached = status == 0
+    if sdf is not None and reached.any():
+        positions, _ = calculate_fk_batch(arm_lengths, angles[reached])
+        clear = sdf.clearance(positions).min(axis=1) >= margin
+        reached[np.flatnonzero(reached)[~clear]] = False
+
+    coverage = float(reached.mean()) if targets.shape[0] else 0.0
+    dexterity = 0.0
+    if reached.any():
+        jacobian, _ = calculate_jacobian(arm_lengths, angles[reached])
+        dexterity = float(manipulability(jacobian).mean() / total**2)
+
+    score = (
+        weights.coverage * coverage
+        + weights.manipulability * dexterity
+        - weights.length * total
+    )
+    return DesignScore(arm_lengths, coverage, dexterity, total, score)
+
+
+def _evaluate_many(candidates, targets, weights, sdf, margin) -> List[DesignScore]:
+    return [evaluate_design(lengths, targets, weights, sdf, margin) for lengths in candidates]
+
+
+@dataclass
+class DesignState:
+    """Resumable state of a cross-entropy design search."""
+
+    generation: int
+    mean: List[float]
+    std: List[float]
+    best: Optional[DesignScore] = None
+    history: List[float] = field(default_factory=list)
+    rng_state: Optional[dict] = None
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the state to a JSON file, replacing it atomically."""
+        path = Path(path)
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_text(json.dumps(asdict(self), indent=2))
+        temporary.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DesignState":
+        """Read a state written by `save`."""
+        data = json.loads(Path(path).read_text())
+        if data["best"] is not None:
+            data["best"] = DesignScore(**data["best"])
+        return cls(**data)
+
+
+def optimize_design(
+    targets: np.ndarray,
+    bounds: Sequence[Tuple[float, float]],
+    weights: Optional[DesignWeights] = None,
+    sdf: Optional[SignedDistanceField] = None,
+    margin: float = 0.0,
+    generations: int = 30,
+    population: int = 64,
+    elite_fraction: float = 0.2,
+    workers: Optional[int] = None,
+    state_path: Optional[Union[str, Path]] = None,
+    seed: Optional[int] = 0,
+    progress: Optional[Callable[[DesignState], None]] = None,
+) -> DesignState:
+    """Search link lengths that maximize the design score.
+
+    Args:
+        targets: Array of shape (N, 2) with required target positions
+        bounds: (min, max) length of every link, one pair per link
+        weights: Score weights, DesignWeights() by default
+        sdf: Optional SignedDistanceField of obstacles to keep clear of
+        margin: Required link clearance when sdf is given
+        generations: Total number of generations, including resumed ones
+        population: Candidates evaluated per generation
+        elite_fraction: Fraction of the population the Gaussian is refit to
+        workers: Worker processes, one per CPU by default
+        state_path: JSON file the state is saved to after every
+                    generation and resumed from when it exists
+        seed: Seed for the candidate sampler
+        progress: Called with the state after every generation
+
+    Returns:
+        The final DesignState, whose best attribute is the best arm found
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    low, high = bounds[:, 0], bounds[:, 1]
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    elites = max(2, int(round(population * elite_fraction)))
+    workers = workers or os.cpu_count() or 1
+
+    if state_path is not None and Path(state_path).exists():
+        state = DesignState.load(state_path)
+    else:
+        state = DesignState(0, ((low + high) / 2).tolist(), ((high - low) / 4).tolist())
+    rng = np.random.default_rng(seed)
+    if state.rng_state is not None:
+        rng.bit_generator.state = state.rng_state
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while state.generation < generations:
+            mean, std = np.asarray(state.mean), np.asarray(state.std)
+            candidates = np.clip(rng.normal(mean, std, (population, mean.size)), low, high)
+
+            # A few candidates per task keeps every worker busy
+            chunks = np.array_split(candidates, min(population, workers * 4))
+            futures = [
+                pool.submit(_evaluate_many, chunk.tolist(), targets, weights, sdf, margin)
+                for chunk in chunks
+                if len(chunk)
+            ]
+            scores = [score for future in futures for score in future.result()]
+
+            ranked = sorted(scores, key=lambda score: -score.score)
+            elite = np.array([score.arm_lengths for score in ranked[:elites]])
+            state.mean = elite.mean(axis=0).tolist()
+            # Keep a little spread so the search does not collapse early
+            state.std = np.maximum(elite.std(axis=0), 1e-3 * (high - low)).tolist()
+            if state.best is None or ranked[0].score > state.best.score:
+                state.best = ranked[0]
+            state.history.append(ranked[0].score)
+            state.generation += 1
+            state.rng_state = rng.bit_generator.state
+
+            if state_path is not None:
+                state.save(state_path)
+            if progress is not None:
+                progress(state)
+    return state
@@ -0,0 +1,15 @@
+"""Servo command streaming for RASW."""
+
+from .simulated import SimulatedServoController
+from .streamer import CommandStreamer, StreamStats
+from .transport import SerialTransport, SocketTransport, TCPTransport, Transport
+
+__all__ = [
+    "CommandStreamer",
+    "SerialTransport",
+    "SimulatedServoController",
+    "SocketTransport",
+    "StreamStats",
+    "TCPTransport",
+    "Transport",
+]
@@ -0,0 +1,50 @@
+"""Binary wire format shared by the command streamer and servo controllers.
+
+Command frame: magic b"RSWC", sequence (uint32), command count (uint16),
+joint count (uint8), then count * joints little-endian float32 angles in
+degrees.
+
+Ack frame: magic b"RSWA", sequence (uint32), status (uint8), and the number
+of free command slots left in the controller's buffer (uint16).
+"""
+
+import struct
+import numpy as np
+from typing import Tuple
+
+COMMAND_MAGIC = b"RSWC"
+ACK_MAGIC = b"RSWA"
+
+COMMAND_HEADER = struct.Struct("<4sIHB")
+ACK = struct.Struct("<4sIBH")
+
+ACK_OK = 0
+ACK_REJECTED = 1
+
+
+def encode_commands(sequence: int, joint_angles: np.ndarray) -> bytes:
+    """Pack an (N, J) block of joint commands into one frame."""
+    joint_angles = np.ascontiguousarray(joint_angles, dtype="<f4")
+    count, joints = joint_angles.shape
+    return COMMAND_HEADER.pack(COMMAND_MAGIC, sequence, count, joints) + joint_angles.tobytes()
+
+
+def decode_command_header(header: bytes) -> Tuple[int, int, int]:
+    """Unpack (sequence, count, joints) from a command frame header."""
+    magic, sequence, count, joints = COMMAND_HEADER.unpack(header)
+    if magic != COMMAND_MAGIC:
+        raise ValueError("Bad command frame magic")
+    return sequence, count, joints
+
+
+def encode_ack(sequence: int, status: int, free_slots: int) -> bytes:
+    """Pack an acknowledgement frame."""
+    return ACK.pack(ACK_MAGIC, sequence, status, free_slots)
+
+
+def decode_ack(frame: bytes) -> Tuple[int, int, int]:
+    """Unpack (sequence, status, free_slots) from an acknowledgement frame."""
+    magic, sequence, status, free_slots = ACK.unpack(frame)
+    if magic != ACK_MAGIC:
+        raise ValueError("Bad ack frame magic")
+    return sequence, status, free_slots
@@ -0,0 +1,130 @@
+"""In-process simulated servo controller for tests and benchmarks."""
+
+import collections
+import socket
+import threading
+import time
+import numpy as np
+from typing import Optional
+
+from .protocol import (
+    ACK_OK,
+    ACK_REJECTED,
+    COMMAND_HEADER,
+    decode_command_header,
+    encode_ack,
+)
+from .transport import SocketTransport
+
+
+class SimulatedServoController:
+    """Servo controller that runs on a background thread.
+
+    It speaks the same protocol as a hardware controller: command frames go
+    into a bounded buffer, every frame is acknowledged with the free space
+    left, and the servos consume one command per update tick. Frames that
+    do not fit in the buffer are rejected, as a real controller would.
+
+    Args:
+        joint_count: Number of servos
+        buffer_size: Number of commands the controller can hold
+        update_rate: Servo updates per second, 0 executes commands instantly
+        frame_delay: Extra seconds spent handling each frame, to model a
+                     slow link or handshake
+    """
+
+    def __init__(
+        self,
+        joint_count: int,
+        buffer_size: int = 256,
+        update_rate: float = 0.0,
+        frame_delay: float = 0.0,
+    ):
+        self.joint_count = joint_count
+        self.buffer_size = buffer_size
+        self.update_rate = update_rate
+        self.frame_delay = frame_delay
+        self.angles = np.zeros(joint_count)
+        self.executed = 0
+        self.rejected_frames = 0
+        self._buffer = collections.deque()
+        self._lock = threading.Lock()
+        self._device, host = socket.socketpair()
+        self._host_transport = SocketTransport(host)
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._receive, name="rasw-sim-rx", daemon=True),
+            threading.Thread(target=self._execute, name="rasw-sim-servo", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def transport(self) -> SocketTransport:
+        """The host side of the link, to pass to a CommandStreamer."""
+        return self._host_transport
+
+    def _read_exact(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self._device.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError
+            data += chunk
+        return data
+
+    def _receive(self) -> None:
+        try:
+            while self._running:
+                sequence, count, joints = decode_command_header(
+                    self._read_exact(COMMAND_HEADER.size)
+                )
+                payload = self._read_exact(count * joints * 4)
+                commands = np.frombuffer(payload, dtype="<f4").reshape(count, joints)
+                if self.frame_delay:
+                    time.sleep(self.frame_delay)
+                with self._lock:
+                    if joints == self.joint_count and len(self._buffer) + count <= self.buffer_size:
+                        self._buffer.extend(commands.astype(float))
+                        status = ACK_OK
+                    else:
+                        self.rejected_frames += 1
+                        status = ACK_REJECTED
+                    if not self.update_rate:
+                        self._drain(len(self._buffer))
+                    free = self.buffer_size - len(self._buffer)
+                self._device.sendall(encode_ack(sequence, status, free))
+        except (ConnectionError, OSError, ValueError):
+            self._running = False
+
+    def _drain(self, count: int) -> None:
+        for _ in range(min(count, len(self._buffer))):
+            self.angles = self._buffer.popleft()
+            self.executed += 1
+
+    def _execute(self) -> None:
+        if not self.update_rate:
+            return
+        period = 1.0 / self.update_rate
+        start = time.perf_counter()
+        ticks = 0
+        while self._running:
+            ticks += 1
+            remaining = start + ticks * period - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            with self._lock:
+                self._drain(1)
+
+    def close(self) -> None:
+        """Stop the controller threads and close both ends of the link."""
+        self._running = False
+        self._host_transport.close()
+        self._device.close()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+
+    def __enter__(self) -> "SimulatedServoController":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
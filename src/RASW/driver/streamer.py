@@ -0,0 +1,224 @@
+"""Batched, pipelined joint command streaming with flow control."""
+
+import threading
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from RASW.control import TimingHistogram
+from .protocol import ACK, ACK_OK, decode_ack, encode_commands
+from .transport import Transport
+
+
+@dataclass
+class StreamStats:
+    """Throughput and latency of a CommandStreamer.
+
+    Attributes:
+        commands: Joint commands acknowledged by the controller
+        frames: Frames acknowledged by the controller
+        rejected_frames: Frames the controller refused, their commands are
+                         dropped
+        bytes_sent: Bytes written to the transport
+        elapsed: Seconds from the first send to the last acknowledgement
+        latency: Time from writing a frame to receiving its ack
+    """
+
+    commands: int = 0
+    frames: int = 0
+    rejected_frames: int = 0
+    bytes_sent: int = 0
+    elapsed: float = 0.0
+    latency: TimingHistogram = field(default_factory=TimingHistogram)
+
+    @property
+    def commands_per_second(self) -> float:
+        """Acknowledged commands per second."""
+        return self.commands / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        """Human readable summary."""
+        return "\n".join(
+            [
+                f"Commands: {self.commands} in {self.frames} frames "
+                f"({self.rejected_frames} rejected)",
+                f"Throughput: {self.commands_per_second:,.0f} commands/s, "
+                f"{self.bytes_sent / max(self.elapsed, 1e-9) / 1024:,.1f} KiB/s",
+                f"Frame latency: mean {self.latency.mean * 1e6:.0f} us, "
+                f"p99 <= {self.latency.percentile(99) * 1e6:.0f} us",
+            ]
+        )
+
+
+class CommandStreamer:
+    """Stream joint commands to a servo controller in batched frames.
+
+    Commands are collected into frames of up to batch_size commands, so one
+    write and one acknowledgement cover many commands. Up to window frames
+    may be in flight at once (pipelining), and the streamer never sends more
+    commands than the controller last reported room for (flow control), so
+    frames are only rejected on a protocol mismatch. Acknowledgements are
+    read on a background thread.
+
+    Args:
+        transport: Link to the controller
+        joint_count: Number of joints per command
+        batch_size: Maximum commands per frame
+        window: Maximum unacknowledged frames in flight
+        device_buffer: Controller buffer size assumed before the first ack,
+                       batch_size must not exceed the real buffer size
+        poll_interval: Seconds between free space polls while the
+                       controller buffer is full
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        joint_count: int,
+        batch_size: int = 32,
+        window: int = 4,
+        device_buffer: int = 64,
+        poll_interval: float = 1e-3,
+    ):
+        self.transport = transport
+        self.joint_count = joint_count
+        self.batch_size = batch_size
+        self.window = window
+        self.poll_interval = poll_interval
+        self.stats = StreamStats()
+
+        self._pending = np.empty((batch_size, joint_count), dtype=np.float32)
+        self._pending_count = 0
+        self._sequence = 0
+        self._in_flight: Dict[int, Tuple[int, float]] = {}
+        self._free_slots = device_buffer
+        self._started: Optional[float] = None
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+        self._running = True
+        self._reader = threading.Thread(target=self._read_acks, name="rasw-acks", daemon=True)
+        self._reader.start()
+
+    def _read_acks(self) -> None:
+        try:
+            while self._running:
+                frame = self.transport.read_exact(ACK.size, timeout=0.1)
+                if not frame:
+                    continue
+                received = time.perf_counter()
+                sequence, status, free_slots = decode_ack(frame)
+                with self._condition:
+                    count, sent = self._in_flight.pop(sequence)
+                    # Commands in frames the controller has not seen yet
+                    # still need room once they arrive
+                    unseen = sum(c for s, (c, _) in self._in_flight.items() if s > sequence)
+                    self._free_slots = free_slots - unseen
+                    if not count:
+                        pass  # free space poll, see flush
+                    elif status == ACK_OK:
+                        self.stats.commands += count
+                        self.stats.frames += 1
+                        self.stats.latency.record(received - sent)
+                    else:
+                        self.stats.rejected_frames += 1
+                    self.stats.elapsed = received - self._started
+                    self._condition.notify_all()
+        except BaseException as exc:
+            with self._condition:
+                self._error = exc
+                self._running = False
+                self._condition.notify_all()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise ConnectionError("Command stream failed") from self._error
+
+    def send(self, joint_angles: np.ndarray) -> None:
+        """Queue one (J,) joint command, sending a frame once the batch fills."""
+        self._pending[self._pending_count] = joint_angles
+        self._pending_count += 1
+        if self._pending_count == self.batch_size:
+            self.flush()
+
+    def send_many(self, joint_angles: np.ndarray) -> None:
+        """Queue an (N, J) block of joint commands, e.g. a batch IK result."""
+        joint_angles = np.asarray(joint_angles).reshape(-1, self.joint_count)
+        start = 0
+        while start < joint_angles.shape[0]:
+            take = min(self.batch_size - self._pending_count, joint_angles.shape[0] - start)
+            end = self._pending_count + take
+            self._pending[self._pending_count : end] = joint_angles[start : start + take]
+            self._pending_count = end
+            start += take
+            if self._pending_count == self.batch_size:
+                self.flush()
+
+    def _write_frame(self, commands: np.ndarray) -> None:
+        # Called with the condition held so frames go out in sequence order
+        frame = encode_commands(self._sequence, commands)
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now
+        self._in_flight[self._sequence] = (commands.shape[0], now)
+        self._free_slots -= commands.shape[0]
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        self.stats.bytes_sent += len(frame)
+        self.transport.write(frame)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Send the pending commands now, waiting for window and buffer room."""
+        if not self._pending_count:
+            return
+        count = self._pending_count
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(deadline - time.perf_counter(), 0.0)
+
+        with self._condition:
+            while True:
+                ready = self._condition.wait_for(
+                    lambda: self._error is not None
+                    or (len(self._in_flight) < self.window and self._free_slots >= count)
+                    or not self._in_flight,
+                    remaining(),
+                )
+                self._check()
+                if not ready:
+                    raise TimeoutError("Servo controller did not make room in time")
+                if self._free_slots >= count:
+                    break
+                # Nothing in flight means no ack will refresh the free space,
+                # so give the servos time to drain and then ask with an
+                # empty frame
+                self._condition.wait(self.poll_interval)
+                self._write_frame(self._pending[:0])
+            self._write_frame(self._pending[:count])
+        self._pending_count = 0
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Flush and wait until every frame has been acknowledged."""
+        self.flush(timeout)
+        with self._condition:
+            done = self._condition.wait_for(
+                lambda: self._error is not None or not self._in_flight, timeout
+            )
+            self._check()
+            if not done:
+                raise TimeoutError("Servo controller did not acknowledge in time")
+
+    def close(self) -> None:
+        """Drain outstanding commands and stop the ack reader."""
+        try:
+            if self._error is None:
+                self.drain(timeout=5.0)
+        finally:
+            self._running = False
+            self._reader.join(timeout=1.0)
+
+    def __enter__(self) -> "CommandStreamer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,103 @@
+"""Byte transports the command streamer can talk through."""
+
+import select
+import socket
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class Transport(ABC):
+    """Bidirectional byte stream to a servo controller."""
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """Send all of data."""
+
+    @abstractmethod
+    def read(self, size: int, timeout: Optional[float] = None) -> bytes:
+        """Read up to size bytes, b"" if nothing arrived within timeout."""
+
+    def read_exact(self, size: int, timeout: Optional[float] = None) -> bytes:
+        """Read exactly size bytes, b"" if the first byte did not arrive in time."""
+        data = self.read(size, timeout)
+        if not data:
+            return b""
+        while len(data) < size:
+            chunk = self.read(size - len(data), None)
+            if not chunk:
+                raise ConnectionError("Transport closed mid-frame")
+            data += chunk
+        return data
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SocketTransport(Transport):
+    """Transport over a connected stream socket.
+
+    Nagle's algorithm is turned off, since the streamer already batches
+    commands into frames and would otherwise wait on delayed ACKs.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        sock.settimeout(None)
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    @classmethod
+    def connect(cls, host: str, port: int, timeout: Optional[float] = 5.0) -> "SocketTransport":
+        """Open a TCP connection to a networked servo controller."""
+        return cls(socket.create_connection((host, port), timeout=timeout))
+
+    def write(self, data: bytes) -> None:
+        self.sock.sendall(data)
+
+    def read(self, size: int, timeout: Optional[float] = None) -> bytes:
+        # select instead of settimeout, which would also affect a writer
+        # on another thread
+        if timeout is not None and not select.select([self.sock], [], [], timeout)[0]:
+            return b""
+        return self.sock.recv(size)
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+# TCP controllers are plain sockets
+TCPTransport = SocketTransport
+
+
+class SerialTransport(Transport):
+    """Transport over a serial port. Requires the optional pyserial package.
+
+    Args:
+        port: Device name, e.g. "/dev/ttyUSB0" or "COM3"
+        baudrate: Line speed in bits per second
+    """
+
+    def __init__(self, port: str, baudrate: int = 115200):
+        try:
+            import serial
+        except ImportError as exc:
+            raise ImportError(
+                "SerialTransport requires pyserial, install it with 'pip install rasw[serial]'"
+            ) from exc
+        self.port = serial.Serial(port, baudrate=baudrate, timeout=None)
+
+    def write(self, data: bytes) -> None:
+        self.port.write(data)
+
+    def read(self, size: int, timeout: Optional[float] = None) -> bytes:
+        self.port.timeout = timeout
+        return self.port.read(size)
+
+    def close(self) -> None:
+        self.port.close()
@@ -0,0 +1,170 @@
+"""Gravity and inverse dynamics torques for planar arms.
+
+The arm moves in a vertical plane with gravity along -y. Joint angles follow
+the FK convention (degrees, each relative to the previous link), and every
+function works on (T, J) trajectories in one pass over time: the only Python
+loops run over the links.
+"""
+
+import numpy as np
+from typing import List, Optional
+
+from RASW.FK.forward_kinematics import _cumulative_sin_cos
+
+STANDARD_GRAVITY = 9.80665
+
+
+def _cross(ax: np.ndarray, ay: np.ndarray, bx: np.ndarray, by: np.ndarray) -> np.ndarray:
+    """z component of the cross product of planar vectors."""
+    return ax * by - ay * bx
+
+
+class ArmDynamics:
+    """Rigid body model of a planar serial arm.
+
+    Torques come out in newton metres when masses are in kilograms and
+    lengths in metres. Lengths in other units are converted with
+    length_scale, e.g. 1e-3 for the millimetre lengths used with
+    `calculate_fk`.
+
+    Args:
+        arm_lengths: List of arm segment lengths, as passed to `calculate_fk`
+        masses: List of link masses in kilograms
+        centers_of_mass: Distance from each joint to its link's centre of
+                         mass along the link, half the length by default
+        inertias: Moment of inertia of each link about its centre of mass
+                  in kg m^2, a uniform rod m L^2 / 12 by default
+        payload: Point mass in kilograms carried at the end effector
+        gravity: Gravitational acceleration in m/s^2
+        length_scale: Metres per length unit of arm_lengths and
+                      centers_of_mass
+    """
+
+    def __init__(
+        self,
+        arm_lengths: List[float],
+        masses: List[float],
+        centers_of_mass: Optional[List[float]] = None,
+        inertias: Optional[List[float]] = None,
+        payload: float = 0.0,
+        gravity: float = STANDARD_GRAVITY,
+        length_scale: float = 1.0,
+    ):
+        self.arm_lengths = np.asarray(arm_lengths, dtype=float) * length_scale
+        self.masses = np.asarray(masses, dtype=float)
+        if self.masses.shape != self.arm_lengths.shape:
+            raise ValueError("Number of masses must match number of arm lengths")
+        if centers_of_mass is None:
+            self.centers_of_mass = self.arm_lengths / 2
+        else:
+            self.centers_of_mass = np.asarray(centers_of_mass, dtype=float) * length_scale
+        if inertias is None:
+            self.inertias = self.masses * self.arm_lengths**2 / 12
+        else:
+            self.inertias = np.asarray(inertias, dtype=float)
+        if not (self.centers_of_mass.shape == self.inertias.shape == self.masses.shape):
+            raise ValueError("Link parameters must have one value per link")
+        self.payload = float(payload)
+        self.gravity = float(gravity)
+
+    @property
+    def joint_count(self) -> int:
+        return self.arm_lengths.shape[0]
+
+    def gravity_torques(self, joint_angles: np.ndarray) -> np.ndarray:
+        """Torques each joint needs to hold the arm still.
+
+        Joint i carries the weight of every link from i outwards, acting at
+        the horizontal distance of that link's centre of mass from joint i.
+
+        Args:
+            joint_angles: Array of shape (..., J) with joint angles in degrees
+
+        Returns:
+            Array of shape (..., J) with joint torques
+        """
+        joint_angles = np.asarray(joint_angles, dtype=float)
+        cos, _ = _cumulative_sin_cos(joint_angles)
+        joint_x = np.cumsum(self.arm_lengths * cos, axis=-1)
+        joint_x = np.concatenate([np.zeros_like(joint_x[..., :1]), joint_x], axis=-1)
+        com_x = joint_x[..., :-1] + self.centers_of_mass * cos
+
+        # Moments about the base, accumulated from the tip inwards
+        weight = self.masses * self.gravity
+        moment = np.cumsum((weight * com_x)[..., ::-1], axis=-1)[..., ::-1]
+        outboard = np.cumsum(weight[::-1])[::-1]
+        moment += self.payload * self.gravity * joint_x[..., -1:]
+        outboard = outboard + self.payload * self.gravity
+        return moment - outboard * joint_x[..., :-1]
+
+    def inverse_dynamics(
+        self,
+        joint_angles: np.ndarray,
+        joint_velocities: Optional[np.ndarray] = None,
+        joint_accelerations: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Joint torques along a trajectory with recursive Newton-Euler.
+
+        The forward pass propagates link angular rates and joint
+        accelerations from the base outwards, with the base accelerating
+        upwards at g to account for gravity. The backward pass accumulates
+        link forces and moments from the tip inwards.
+
+        Args:
+            joint_angles: Array of shape (T, J) with joint angles in degrees
+            joint_velocities: Array of shape (T, J) in degrees per second,
+                              zero when None
+            joint_accelerations: Array of shape (T, J) in degrees per second
+                                 squared, zero when None
+
+        Returns:
+            Array of shape (T, J) with joint torques
+        """
+        joint_angles = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+        zeros = np.zeros_like(joint_angles)
+        qd = zeros if joint_velocities is None else np.radians(joint_velocities)
+        qdd = zeros if joint_accelerations is None else np.radians(joint_accelerations)
+        cos, sin = _cumulative_sin_cos(joint_angles)
+        omega = np.cumsum(qd, axis=-1)
+        alpha = np.cumsum(qdd, axis=-1)
+        omega2 = omega**2
+
+        def point_acceleration(base_x, base_y, i, distance):
+            # a = a_base + alpha x r - omega^2 r, with r = distance * link direction
+            tangential = alpha[..., i] * distance
+            centripetal = omega2[..., i] * distance
+            return (
+                base_x - tangential * sin[..., i] - centripetal * cos[..., i],
+                base_y + tangential * cos[..., i] - centripetal * sin[..., i],
+            )
+
+        shape = joint_angles.shape[:-1]
+        joint_ax = np.zeros(shape)
+        joint_ay = np.full(shape, self.gravity)
+        com_ax, com_ay = [], []
+        for i in range(self.joint_count):
+            ax, ay = point_acceleration(joint_ax, joint_ay, i, self.centers_of_mass[i])
+            com_ax.append(ax)
+            com_ay.append(ay)
+            joint_ax, joint_ay = point_acceleration(joint_ax, joint_ay, i, self.arm_lengths[i])
+
+        # Force and moment the next link exerts back on link i, starting
+        # with the payload at the tip
+        force_x = self.payload * joint_ax
+        force_y = self.payload * joint_ay
+        moment = np.zeros(shape)
+        torques = np.empty(joint_angles.shape)
+        for i in reversed(range(self.joint_count)):
+            length, com, mass = self.arm_lengths[i], self.centers_of_mass[i], self.masses[i]
+            inertial_x = mass * com_ax[i]
+            inertial_y = mass * com_ay[i]
+            moment = (
+                moment
+                + self.inertias[i] * alpha[..., i]
+                + _cross(com * cos[..., i], com * sin[..., i], inertial_x, inertial_y)
+                + _cross(length * cos[..., i], length * sin[..., i], force_x, force_y)
+            )
+            force_x = force_x + inertial_x
+            force_y = force_y + inertial_y
+            torques[..., i] = moment
+        return torques
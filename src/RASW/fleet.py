@@ -0,0 +1,151 @@
+"""Fleet kinematics: many arms with different geometries in one call.
+
+Arm geometries are given per row, either as a ragged list of link lengths
+or as a zero-padded (N, Jmax) array with a link count per row.
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+from RASW.FK.forward_kinematics import _apply_base, _cumulative_sin_cos, _fk_from_sin_cos
+from RASW.IK import calculate_ik_batch
+from RASW.IK.inverse_kinematics import IK_NOT_CONVERGED, IK_OK, IK_TOO_FEW_LINKS
+from RASW.IK.numeric import calculate_ik_numeric_batch
+
+ArmGeometry = Union[np.ndarray, Sequence[Sequence[float]]]
+
+
+def pad_arm_lengths(arm_lengths: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a ragged list of per-arm link lengths to a padded array.
+
+    Args:
+        arm_lengths: One list of link lengths per arm
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, Jmax) with zero padding after each arm's links
+        - Array of shape (N,) with the link count of each arm
+    """
+    link_counts = np.array([len(lengths) for lengths in arm_lengths], dtype=np.int64)
+    padded = np.zeros((len(link_counts), int(link_counts.max(initial=0))))
+    for row, lengths in enumerate(arm_lengths):
+        padded[row, : len(lengths)] = lengths
+    return padded, link_counts
+
+
+def _as_padded(
+    values: ArmGeometry, link_counts: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalize ragged or padded per-row values to (padded, link_counts)."""
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        padded = values.astype(float)
+    elif len({len(row) for row in values}) <= 1:
+        padded = np.asarray(values, dtype=float).reshape(len(values), -1)
+    else:
+        padded, counts = pad_arm_lengths(values)
+        return padded, counts if link_counts is None else np.asarray(link_counts)
+
+    if link_counts is None:
+        link_counts = np.count_nonzero(padded, axis=1)
+    return padded, np.asarray(link_counts, dtype=np.int64)
+
+
+def calculate_fk_fleet(
+    arm_lengths: ArmGeometry,
+    joint_angles: ArmGeometry,
+    link_counts: Optional[np.ndarray] = None,
+    bases: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, Optional[str]]:
+    """Calculate forward kinematics for a fleet of arms in one pass.
+
+    Padding links have zero length, so the padded joint positions of a short
+    arm repeat its end effector and positions[:, -1] is always the tool point.
+
+    Args:
+        arm_lengths: Ragged list or (N, Jmax) array of link lengths per arm
+        joint_angles: Ragged list or (N, Jmax) array of joint angles in degrees
+        link_counts: Number of links per arm, defaults to the number of
+                     non-zero lengths in each row of a padded array
+        bases: Array of shape (N, 3) with each arm's base pose (x, y, theta),
+               theta in degrees, all at the origin facing +x by default
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, Jmax + 1, 2) with joint positions
+        - Error message if any, None otherwise
+    """
+    lengths, link_counts = _as_padded(arm_lengths, link_counts)
+    angles, _ = _as_padded(joint_angles, link_counts)
+    if angles.shape[0] != lengths.shape[0]:
+        return np.empty((0, 0, 2)), "Number of arms must match number of joint angle rows"
+    if angles.shape[1] < lengths.shape[1]:
+        angles = np.pad(angles, ((0, 0), (0, lengths.shape[1] - angles.shape[1])))
+    elif angles.shape[1] > lengths.shape[1]:
+        return np.empty((0, 0, 2)), "Number of arm lengths must match number of joint angles"
+
+    active = np.arange(lengths.shape[1]) < link_counts[:, None]
+    lengths = np.where(active, lengths, 0.0)
+    cos, sin = _cumulative_sin_cos(_apply_base(np.where(active, angles, 0.0), bases))
+    positions = _fk_from_sin_cos(lengths, cos, sin)
+    if bases is not None:
+        positions += np.asarray(bases, dtype=float)[:, None, :2]
+    return positions, None
+
+
+def calculate_ik_fleet(
+    targets: np.ndarray,
+    arm_lengths: ArmGeometry,
+    link_counts: Optional[np.ndarray] = None,
+    tolerance: float = 1e-6,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve inverse kinematics for one target per arm across a fleet.
+
+    Arms are grouped by link count and each group is solved in one call
+    using per-row link lengths: `calculate_ik_batch` for 2 and 3 links and
+    the damped least squares solver for longer arms, which the closed forms
+    do not cover. Every solution is checked with FK before it counts.
+
+    Args:
+        targets: Array of shape (N, 2) with one target per arm
+        arm_lengths: Ragged list or (N, Jmax) array of link lengths per arm
+        link_counts: Number of links per arm, defaults to the number of
+                     non-zero lengths in each row of a padded array
+        tolerance: Largest end effector error of a solved arm
+
+    Returns:
+        Tuple containing:
+        - Array of shape (N, Jmax) with joint angles in degrees, NaN where
+          no solution was found or the joint does not exist
+        - Array of shape (N,) with a status code per arm, see
+          IK_STATUS_MESSAGES
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    lengths, link_counts = _as_padded(arm_lengths, link_counts)
+    if targets.shape[0] != lengths.shape[0]:
+        raise ValueError("Number of targets must match number of arms")
+    angles = np.full(lengths.shape, np.nan)
+    status = np.full(lengths.shape[0], IK_TOO_FEW_LINKS, dtype=np.int8)
+
+    for count in np.unique(link_counts):
+        rows = np.flatnonzero(link_counts == count)
+        group_lengths = lengths[rows, :count]
+        if count > 3:
+            group_angles, group_status = calculate_ik_numeric_batch(
+                targets[rows], group_lengths, tolerance=tolerance
+            )
+        else:
+            group_angles, group_status = calculate_ik_batch(targets[rows], group_lengths)
+
+        solved = np.flatnonzero(group_status == IK_OK)
+        if solved.size and count >= 2:
+            cos, sin = _cumulative_sin_cos(group_angles[solved])
+            tip = _fk_from_sin_cos(group_lengths[solved], cos, sin)[:, -1]
+            error = np.hypot(*(tip - targets[rows[solved]]).T)
+            # The solvers measure the error with a differently ordered sum
+            missed = solved[~(error <= tolerance * (1 + 1e-6))]
+            group_status[missed] = IK_NOT_CONVERGED
+            group_angles[missed] = np.nan
+
+        angles[rows, : group_angles.shape[1]] = group_angles
+        status[rows] = group_status
+    return angles, status
@@ -0,0 +1,162 @@
+"""Intercept planning for parts moving on a conveyor.
+
+A part at p0 moving with velocity v is at p0 + v t after t seconds. The arm
+can pick it at time t when IK solves that point and every joint can turn
+from its start angle to the solution within t at its top speed, the same
+time model as the TIME cost of `plan_pick_sequence`.
+
+`plan_intercepts` evaluates a dense grid of future times for all parts in
+one batched IK call, takes the first feasible grid time of every part and
+then bisects between it and the grid time before, again batched over all
+parts, until the intercept time is known to within the tolerance.
+"""
+
+import math
+import numpy as np
+from typing import List, NamedTuple, Optional
+
+from RASW.IK import solve_ik
+
+# Targets solved per IK call, about 50 MB of working arrays
+MAX_BATCH_TARGETS = 1 << 20
+
+
+class Intercept(NamedTuple):
+    """Result of `plan_intercepts` for P parts.
+
+    Attributes:
+        time: Array of shape (P,) with the intercept time in seconds, NaN
+              where no intercept was found within the horizon
+        position: Array of shape (P, 2) with the part position at that time
+        joint_angles: Array of shape (P, J) with the joint angles in degrees
+                      that reach it
+        feasible: Array of shape (P,), True where an intercept was found
+    """
+
+    time: np.ndarray
+    position: np.ndarray
+    joint_angles: np.ndarray
+    feasible: np.ndarray
+
+
+def _evaluate(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    times: np.ndarray,
+    start_angles: np.ndarray,
+    inverse_speeds: np.ndarray,
+    arm_lengths: List[float],
+    phi: Optional[float],
+    joint_limits: Optional[np.ndarray],
+):
+    """Solve parts at times of shape (P, K) and check they can be met.
+
+    Returns the targets (P, K, 2), joint angles (P, K, J) and whether each
+    time is feasible (P, K).
+    """
+    targets = positions[:, None] + velocities[:, None] * times[..., None]
+    angles, status, _ = solve_ik(targets.reshape(-1, 2), arm_lengths, phi, joint_limits)
+    angles = angles.reshape(times.shape + angles.shape[-1:])
+    travel = (np.abs(angles - start_angles[:, None]) * inverse_speeds).max(axis=-1)
+    feasible = (status.reshape(times.shape) == 0) & (travel <= times)
+    return targets, angles, feasible
+
+
+def plan_intercepts(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    arm_lengths: List[float],
+    start_angles: np.ndarray,
+    joint_speeds: np.ndarray,
+    horizon: float,
+    time_step: float = 0.05,
+    tolerance: float = 1e-3,
+    phi: Optional[float] = None,
+    joint_limits: Optional[np.ndarray] = None,
+) -> Intercept:
+    """Find the earliest time and pose at which the arm can meet each part.
+
+    Every part is searched on the grid 0, time_step, ..., horizon. An
+    intercept window shorter than time_step can fall between two grid
+    times and be missed, so pick time_step below the shortest window that
+    matters.
+
+    Args:
+        positions: Array of shape (P, 2) with the part positions now
+        velocities: Array of shape (P, 2) with the part velocities in
+                    length units per second
+        arm_lengths: List of arm segment lengths
+        start_angles: Joint angles in degrees the arm starts from, shape
+                      (J,) or (P, J) with a start pose per part
+        joint_speeds: Joint speeds in degrees per second, a scalar or
+                      shape (J,)
+        horizon: Latest intercept time searched, in seconds
+        time_step: Spacing of the time grid in seconds
+        tolerance: Accuracy of the refined intercept time in seconds
+        phi: Tool orientation in degrees for pose IK, None for position
+        joint_limits: Array of shape (J, 2) with (min, max) joint angles
+
+    Returns:
+        Intercept with the earliest feasible time of every part
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    velocities = np.broadcast_to(np.asarray(velocities, dtype=float), positions.shape)
+    parts = positions.shape[0]
+    start_angles = np.asarray(start_angles, dtype=float)
+    start_angles = np.broadcast_to(start_angles, (parts, start_angles.shape[-1]))
+    joints = start_angles.shape[-1]
+    inverse_speeds = 1.0 / np.broadcast_to(np.asarray(joint_speeds, dtype=float), (joints,))
+    grid = np.arange(0.0, horizon + time_step / 2, time_step)
+    args = (arm_lengths, phi, joint_limits)
+
+    time = np.full(parts, np.nan)
+    position = np.full((parts, 2), np.nan)
+    joint_angles = np.full((parts, joints), np.nan)
+    feasible = np.zeros(parts, dtype=bool)
+
+    # Coarse pass: the first feasible grid time of every part
+    first = np.zeros(parts, dtype=np.intp)
+    chunk = max(1, MAX_BATCH_TARGETS // grid.size)
+    for begin in range(0, parts, chunk):
+        rows = slice(begin, begin + chunk)
+        count = positions[rows].shape[0]
+        targets, angles, ok = _evaluate(
+            positions[rows],
+            velocities[rows],
+            np.broadcast_to(grid, (count, grid.size)),
+            start_angles[rows],
+            inverse_speeds,
+            *args,
+        )
+        found = ok.any(axis=1)
+        index = np.argmax(ok, axis=1)
+        picked = np.arange(count)
+        feasible[rows] = found
+        first[rows] = index
+        time[rows] = np.where(found, grid[index], np.nan)
+        position[rows] = np.where(found[:, None], targets[picked, index], np.nan)
+        joint_angles[rows] = np.where(found[:, None], angles[picked, index], np.nan)
+
+    # Bisect between the last infeasible and the first feasible grid time
+    refine = np.flatnonzero(feasible & (first > 0))
+    if refine.size:
+        low = grid[first[refine] - 1]
+        high = grid[first[refine]]
+        for _ in range(max(0, math.ceil(math.log2(time_step / tolerance)))):
+            middle = (low + high) / 2
+            targets, angles, ok = _evaluate(
+                positions[refine],
+                velocities[refine],
+                middle[:, None],
+                start_angles[refine],
+                inverse_speeds,
+                *args,
+            )
+            ok = ok[:, 0]
+            high = np.where(ok, middle, high)
+            low = np.where(ok, low, middle)
+            better = refine[ok]
+            time[better] = middle[ok]
+            position[better] = targets[ok, 0]
+            joint_angles[better] = angles[ok, 0]
+    return Intercept(time, position, joint_angles, feasible)
@@ -0,0 +1,139 @@
+"""Concurrent solver pool for serving FK and IK requests from many threads.
+
+The batch FK and IK functions the pool runs keep no state between calls,
+so workers never contend. The pool itself guards its submission slots and
+shutdown with a lock, so one pool may be shared by any number of threads.
+"""
+
+import os
+import threading
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from RASW.FK import calculate_fk_batch
+from RASW.IK import calculate_ik_batch
+
+
+class SolverPool:
+    """Run batched FK and IK on worker threads or processes.
+
+    NumPy releases the GIL inside large array operations, so batches of a
+    few thousand rows or more scale across cores on threads alone. Small
+    batches spend most of their time in Python and scale better with
+    use_processes=True, at the cost of pickling inputs and outputs.
+
+    At most max_pending batches may be queued or running at once. Further
+    submissions block until a slot frees up (or raise TimeoutError when a
+    timeout is given), so a burst of requests cannot grow memory unbounded.
+
+    Submitting and shutting down are safe from any thread. Once `shutdown`
+    has been called, further submissions raise RuntimeError, including
+    ones that were waiting for a slot.
+
+    Args:
+        max_workers: Number of workers, defaults to the CPU count
+        max_pending: Maximum number of outstanding batches, defaults to
+                     twice the number of workers
+        use_processes: Use worker processes instead of threads
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        use_processes: bool = False,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        if use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="rasw-solver"
+            )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _submit(self, fn, *args, timeout: Optional[float] = None) -> Future:
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("Solver pool submission queue is full")
+        try:
+            # Checking and submitting under one lock keeps a concurrent
+            # shutdown from slipping in between
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Solver pool has been shut down")
+                future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def submit_ik(
+        self, targets: np.ndarray, arm_lengths: List[float], timeout: Optional[float] = None
+    ) -> Future:
+        """Queue a `calculate_ik_batch` call.
+
+        Args:
+            targets: Array of shape (N, 2) with target (x, y) positions
+            arm_lengths: List of arm segment lengths
+            timeout: Seconds to wait for a free slot, None waits forever
+
+        Returns:
+            Future resolving to the (angles, status) result
+        """
+        return self._submit(calculate_ik_batch, targets, arm_lengths, timeout=timeout)
+
+    def submit_fk(
+        self, arm_lengths: List[float], joint_angles: np.ndarray, timeout: Optional[float] = None
+    ) -> Future:
+        """Queue a `calculate_fk_batch` call.
+
+        Args:
+            arm_lengths: List of arm segment lengths
+            joint_angles: Array of shape (N, J) with joint angles in degrees
+            timeout: Seconds to wait for a free slot, None waits forever
+
+        Returns:
+            Future resolving to the (positions, error) result
+        """
+        return self._submit(calculate_fk_batch, arm_lengths, joint_angles, timeout=timeout)
+
+    def map_ik(
+        self, targets: np.ndarray, arm_lengths: List[float], chunk_size: int = 65536
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Split one large IK batch across the workers and join the results.
+
+        Args:
+            targets: Array of shape (N, 2) with target (x, y) positions
+            arm_lengths: List of arm segment lengths
+            chunk_size: Number of targets per worker task
+
+        Returns:
+            The same (angles, status) result as `calculate_ik_batch`
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        futures = [
+            self.submit_ik(targets[start : start + chunk_size], arm_lengths)
+            for start in range(0, max(targets.shape[0], 1), chunk_size)
+        ]
+        results = [future.result() for future in futures]
+        return (
+            np.concatenate([angles for angles, _ in results]),
+            np.concatenate([status for _, status in results]),
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers, optionally waiting for queued batches."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "SolverPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
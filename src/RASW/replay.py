@@ -0,0 +1,314 @@
+"""Replay recorded joint logs through FK in parallel.
+
+A joint log has one row per sample: a timestamp in seconds followed by the
+J joint angles in degrees. Logs are either .npy arrays of shape (T, J + 1),
+which are memory mapped and split into row shards, or .csv files, which are
+replayed one file per shard.
+
+Each shard runs on a worker process that reads its rows in chunks, runs
+`calculate_fk_batch` and streams the tool tip path (t, x, y) to an output
+file next to the log's name in the output directory. Shards of an .npy log
+write straight into their rows of one preallocated .npy output, so no
+merge pass is needed. Workers also return path metrics, which are combined
+per log.
+"""
+
+import itertools
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from RASW.FK import calculate_fk_batch
+
+# Rows per shard of an .npy log, and rows per FK call inside a shard
+DEFAULT_SHARD_ROWS = 1 << 22
+DEFAULT_CHUNK_SIZE = 65536
+
+# (x_min, y_min, x_max, y_max) box the tool tip is expected to stay inside
+Workspace = Tuple[float, float, float, float]
+
+
+@dataclass
+class LogMetrics:
+    """Tool tip path metrics for one log or part of one.
+
+    Attributes:
+        samples: Number of rows replayed
+        start_time: Timestamp of the first row
+        end_time: Timestamp of the last row
+        path_length: Distance travelled by the tool tip
+        max_speed: Highest tool tip speed between consecutive rows
+        max_speed_time: Timestamp at which max_speed was reached
+        excursion_samples: Rows with the tool tip outside the workspace
+        excursions: Number of times the tool tip left the workspace
+        first_excursion: Timestamp of the first row outside the workspace
+    """
+
+    samples: int = 0
+    start_time: float = np.inf
+    end_time: float = -np.inf
+    path_length: float = 0.0
+    max_speed: float = 0.0
+    max_speed_time: float = np.nan
+    excursion_samples: int = 0
+    excursions: int = 0
+    first_excursion: float = np.nan
+
+    def merge(self, other: "LogMetrics") -> None:
+        """Add the metrics of a later part of the same log."""
+        self.samples += other.samples
+        self.start_time = min(self.start_time, other.start_time)
+        self.end_time = max(self.end_time, other.end_time)
+        self.path_length += other.path_length
+        if other.max_speed > self.max_speed:
+            self.max_speed, self.max_speed_time = other.max_speed, other.max_speed_time
+        self.excursion_samples += other.excursion_samples
+        self.excursions += other.excursions
+        if np.isnan(self.first_excursion):
+            self.first_excursion = other.first_excursion
+        elif not np.isnan(other.first_excursion):
+            self.first_excursion = min(self.first_excursion, other.first_excursion)
+
+
+@dataclass
+class ReplayReport:
+    """Metrics of every replayed log and the throughput of the run."""
+
+    logs: List[Tuple[str, str, LogMetrics]] = field(default_factory=list)
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def samples(self) -> int:
+        return sum(metrics.samples for _, _, metrics in self.logs)
+
+    @property
+    def samples_per_second(self) -> float:
+        return self.samples / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        """Human readable summary of the run."""
+        lines = []
+        for log, output, metrics in self.logs:
+            lines += [
+                f"{log} -> {output}",
+                f"  Samples: {metrics.samples}, "
+                f"duration: {metrics.end_time - metrics.start_time:.3f} s",
+                f"  Path length: {metrics.path_length:.3f}",
+                f"  Max speed: {metrics.max_speed:.3f} at t={metrics.max_speed_time:.3f}",
+                f"  Workspace excursions: {metrics.excursions} "
+                f"({metrics.excursion_samples} samples)",
+            ]
+            if metrics.excursions:
+                lines.append(f"  First excursion at t={metrics.first_excursion:.3f}")
+        lines.append(
+            f"Replayed {self.samples} samples with {self.workers} workers in "
+            f"{self.elapsed:.2f} s ({self.samples_per_second:,.0f} samples/s)"
+        )
+        return "\n".join(lines)
+
+
+class _PathTracker:
+    """Accumulates LogMetrics over consecutive chunks of one shard."""
+
+    def __init__(self, workspace: Optional[Workspace]):
+        self.workspace = workspace
+        self.metrics = LogMetrics()
+        self.previous: Optional[np.ndarray] = None
+        self.previous_outside = False
+
+    def _outside(self, path: np.ndarray) -> np.ndarray:
+        if self.workspace is None:
+            return np.zeros(path.shape[0], dtype=bool)
+        x_min, y_min, x_max, y_max = self.workspace
+        x, y = path[:, 1], path[:, 2]
+        return (x < x_min) | (x > x_max) | (y < y_min) | (y > y_max)
+
+    def prime(self, row: np.ndarray) -> None:
+        """Use the row before the shard as the start of the path."""
+        self.previous = row
+        self.previous_outside = bool(self._outside(row[None])[0])
+
+    def update(self, path: np.ndarray) -> None:
+        metrics = self.metrics
+        if not path.shape[0]:
+            return
+        metrics.samples += path.shape[0]
+        metrics.start_time = min(metrics.start_time, float(path[0, 0]))
+        metrics.end_time = max(metrics.end_time, float(path[-1, 0]))
+
+        joined = path if self.previous is None else np.concatenate([self.previous[None], path])
+        if joined.shape[0] > 1:
+            step = np.diff(joined, axis=0)
+            distance = np.hypot(step[:, 1], step[:, 2])
+            metrics.path_length += float(distance.sum())
+            with np.errstate(divide="ignore", invalid="ignore"):
+                speed = np.where(step[:, 0] > 0, distance / step[:, 0], 0.0)
+            fastest = int(np.argmax(speed))
+            if speed[fastest] > metrics.max_speed:
+                metrics.max_speed = float(speed[fastest])
+                metrics.max_speed_time = float(joined[fastest + 1, 0])
+
+        outside = self._outside(path)
+        if outside.any():
+            metrics.excursion_samples += int(outside.sum())
+            before = np.concatenate([[self.previous_outside], outside[:-1]])
+            metrics.excursions += int(np.count_nonzero(outside & ~before))
+            if np.isnan(metrics.first_excursion):
+                metrics.first_excursion = float(path[np.argmax(outside), 0])
+        self.previous = path[-1]
+        self.previous_outside = bool(outside[-1])
+
+
+def _tool_path(arm_lengths: Sequence[float], rows: np.ndarray) -> np.ndarray:
+    """(n, 3) array of (t, x, y) from (n, J + 1) log rows."""
+    positions, error = calculate_fk_batch(arm_lengths, rows[:, 1:])
+    if error:
+        raise ValueError(f"{error} (log has {rows.shape[1] - 1} joints)")
+    return np.column_stack([rows[:, 0], positions[:, -1]])
+
+
+def _replay_npy_shard(
+    log: str,
+    output: str,
+    start: int,
+    stop: int,
+    arm_lengths: Sequence[float],
+    workspace: Optional[Workspace],
+    chunk_size: int,
+) -> LogMetrics:
+    rows = np.load(log, mmap_mode="r")
+    out = np.load(output, mmap_mode="r+")
+    tracker = _PathTracker(workspace)
+    if start > 0:
+        tracker.prime(_tool_path(arm_lengths, np.array(rows[start - 1 : start], dtype=float))[0])
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        path = _tool_path(arm_lengths, np.array(rows[chunk_start:chunk_stop], dtype=float))
+        out[chunk_start:chunk_stop] = path
+        tracker.update(path)
+    out.flush()
+    return tracker.metrics
+
+
+def _iter_csv_rows(log: str, chunk_size: int) -> Iterator[np.ndarray]:
+    with open(log) as handle:
+        first = handle.readline()
+        try:
+            first_row = np.array(first.split(","), dtype=float)
+        except ValueError:
+            first_row = None  # header with column names
+        if first_row is not None:
+            yield first_row[None]
+        while True:
+            lines = list(itertools.islice(handle, chunk_size))
+            if not lines:
+                return
+            yield np.loadtxt(lines, delimiter=",", ndmin=2)
+
+
+def _replay_csv(
+    log: str,
+    output: str,
+    arm_lengths: Sequence[float],
+    workspace: Optional[Workspace],
+    chunk_size: int,
+) -> LogMetrics:
+    tracker = _PathTracker(workspace)
+    with open(output, "w") as out:
+        out.write("t,x,y\n")
+        for rows in _iter_csv_rows(log, chunk_size):
+            path = _tool_path(arm_lengths, rows)
+            np.savetxt(out, path, delimiter=",", fmt="%.9g")
+            tracker.update(path)
+    return tracker.metrics
+
+
+def _output_paths(logs: List[Path], output_dir: Path) -> List[Path]:
+    """Name each log's tool tip output, numbering logs with the same name."""
+    outputs, used = [], set()
+    for log in logs:
+        if log.suffix not in (".npy", ".csv"):
+            raise ValueError(f"Unsupported log format: {log}")
+        name, number = log.stem, 1
+        while f"{name}.tip{log.suffix}" in used:
+            number += 1
+            name = f"{log.stem}-{number}"
+        used.add(f"{name}.tip{log.suffix}")
+        outputs.append(output_dir / f"{name}.tip{log.suffix}")
+    return outputs
+
+
+def replay_logs(
+    logs: Sequence[Union[str, Path]],
+    arm_lengths: List[float],
+    output_dir: Union[str, Path],
+    workspace: Optional[Workspace] = None,
+    workers: Optional[int] = None,
+    shard_rows: int = DEFAULT_SHARD_ROWS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ReplayReport:
+    """Replay joint logs through FK on a process pool.
+
+    Args:
+        logs: Paths of .npy or .csv joint logs
+        arm_lengths: List of arm segment lengths
+        output_dir: Directory for the tool tip paths, one <log>.tip.npy or
+                    <log>.tip.csv per log. Logs sharing a file name get
+                    <log>-2, <log>-3... so no output is overwritten; the
+                    report lists the output of every log
+        workspace: (x_min, y_min, x_max, y_max) box for excursion counting
+        workers: Number of worker processes, one per CPU by default
+        shard_rows: Rows of an .npy log replayed per task
+        chunk_size: Rows per FK call, bounds each worker's memory use
+
+    Returns:
+        ReplayReport with per-log metrics and throughput
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    arm_lengths = [float(length) for length in arm_lengths]
+    report = ReplayReport(workers=workers)
+
+    logs = [Path(log) for log in logs]
+    outputs = _output_paths(logs, output_dir)
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = []
+        for log, output in zip(logs, outputs):
+            if log.suffix == ".npy":
+                rows = np.load(log, mmap_mode="r")
+                if rows.ndim != 2 or rows.shape[1] != len(arm_lengths) + 1:
+                    raise ValueError(
+                        f"{log} has shape {rows.shape}, expected (T, {len(arm_lengths) + 1})"
+                    )
+                np.lib.format.open_memmap(output, mode="w+", shape=(rows.shape[0], 3)).flush()
+                futures = [
+                    pool.submit(
+                        _replay_npy_shard, str(log), str(output), start,
+                        min(start + shard_rows, rows.shape[0]),
+                        arm_lengths, workspace, chunk_size,
+                    )
+                    for start in range(0, rows.shape[0], shard_rows)
+                ]
+            else:
+                futures = [
+                    pool.submit(_replay_csv, str(log), str(output), arm_lengths, workspace, chunk_size)
+                ]
+            jobs.append((str(log), str(output), futures))
+
+        for log, output, futures in jobs:
+            metrics = LogMetrics()
+            # Shards are submitted in order, so merging in order keeps
+            # first-excursion and path continuity right
+            for future in futures:
+                metrics.merge(future.result())
+            report.logs.append((log, output, metrics))
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -0,0 +1,171 @@
+"""IK to FK round-trip harness that tracks accuracy and speed together.
+
+Targets are sampled across the workspace, solved with `calculate_ik_batch`
+and fed back through `calculate_fk_batch`. The distance between the target
+and the reached end effector is the round-trip error.
+"""
+
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from RASW.FK import calculate_fk_batch
+from RASW.IK import IK_STATUS_MESSAGES, calculate_ik_batch
+
+# Reason reported for targets the solver accepted but did not reach
+MISSED_TARGET = "Solution misses target"
+
+# Log-spaced error histogram edges, errors below the first edge count as exact
+ERROR_BIN_EDGES = np.logspace(-12, 3, 61)
+
+
+@dataclass
+class RoundTripReport:
+    """Accuracy and throughput of one round-trip run."""
+
+    arm_lengths: List[float]
+    samples: int
+    tolerance: float
+    solved: int = 0
+    reached: int = 0
+    failures: Dict[str, int] = field(default_factory=dict)
+    error_histogram: np.ndarray = field(
+        default_factory=lambda: np.zeros(len(ERROR_BIN_EDGES) + 1, dtype=np.int64)
+    )
+    error_sum: float = 0.0
+    error_max: float = 0.0
+    ik_seconds: float = 0.0
+    fk_seconds: float = 0.0
+
+    @property
+    def solves_per_second(self) -> float:
+        """IK throughput over all samples, including failed ones."""
+        return self.samples / self.ik_seconds if self.ik_seconds else float("inf")
+
+    @property
+    def error_mean(self) -> float:
+        """Mean round-trip error over the targets the solver accepted."""
+        return self.error_sum / self.solved if self.solved else 0.0
+
+    def error_percentile(self, q: float) -> float:
+        """Upper bound on the q-th percentile (0-100) of the round-trip error.
+
+        Computed from the histogram, so the result is the upper edge of the
+        bin holding the percentile.
+        """
+        if not self.solved:
+            return 0.0
+        rank = np.searchsorted(np.cumsum(self.error_histogram), q / 100 * self.solved)
+        if rank >= len(ERROR_BIN_EDGES):
+            return self.error_max
+        return float(min(ERROR_BIN_EDGES[rank], self.error_max))
+
+    def format(self) -> str:
+        """Human readable summary of the run."""
+        lines = [
+            f"Arm lengths: {self.arm_lengths}",
+            f"Samples: {self.samples}",
+            f"Solved: {self.solved}",
+            f"Reached within {self.tolerance:g}: {self.reached} "
+            f"({100 * self.reached / max(self.samples, 1):.2f}%)",
+        ]
+        for reason, count in sorted(self.failures.items(), key=lambda item: -item[1]):
+            lines.append(f"  {reason}: {count}")
+        lines += [
+            f"Error mean: {self.error_mean:.3e}",
+            f"Error p50 <= {self.error_percentile(50):.3e}",
+            f"Error p99 <= {self.error_percentile(99):.3e}",
+            f"Error max: {self.error_max:.3e}",
+            f"IK solves per second: {self.solves_per_second:,.0f}",
+            f"FK time: {self.fk_seconds:.3f} s",
+        ]
+        return "\n".join(lines)
+
+
+def sample_workspace(
+    arm_lengths: List[float], samples: int, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Sample targets uniformly over the area of the reachable annulus.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        samples: Number of targets
+        rng: Random generator, a fresh unseeded one by default
+
+    Returns:
+        Array of shape (samples, 2) with target (x, y) positions
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    outer = float(sum(arm_lengths))
+    inner = max(0.0, 2 * max(arm_lengths) - outer)
+    radius = np.sqrt(rng.uniform(inner**2, outer**2, samples))
+    angle = rng.uniform(-np.pi, np.pi, samples)
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=-1)
+
+
+def run_roundtrip(
+    arm_lengths: List[float],
+    samples: int = 1_000_000,
+    chunk_size: int = 65536,
+    tolerance: float = 1e-6,
+    seed: Optional[int] = 0,
+) -> RoundTripReport:
+    """Run IK then FK on sampled targets and collect error statistics.
+
+    Memory use is bounded by chunk_size, so millions of samples are fine.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        samples: Number of targets to sample
+        chunk_size: Number of targets solved per vectorized call
+        tolerance: Round-trip error above which a solution counts as a miss
+        seed: Seed for the target sampler, None for a random seed
+
+    Returns:
+        RoundTripReport with failure reasons, error distribution and timings
+    """
+    rng = np.random.default_rng(seed)
+    report = RoundTripReport(list(arm_lengths), samples, tolerance)
+    joint_count = len(arm_lengths)
+
+    for start in range(0, samples, chunk_size):
+        targets = sample_workspace(arm_lengths, min(chunk_size, samples - start), rng)
+
+        t0 = time.perf_counter()
+        angles, status = calculate_ik_batch(targets, arm_lengths)
+        t1 = time.perf_counter()
+
+        for code in np.unique(status[status != 0]):
+            reason = IK_STATUS_MESSAGES[int(code)]
+            report.failures[reason] = report.failures.get(reason, 0) + int(
+                np.count_nonzero(status == code)
+            )
+
+        ok = status == 0
+        if not ok.any():
+            report.ik_seconds += t1 - t0
+            continue
+
+        # Solvers that ignore trailing links leave those joints straight
+        solved = np.zeros((int(ok.sum()), joint_count))
+        solved[:, : angles.shape[1]] = angles[ok]
+        t2 = time.perf_counter()
+        positions, _ = calculate_fk_batch(arm_lengths, solved)
+        t3 = time.perf_counter()
+
+        error = np.linalg.norm(positions[:, -1] - targets[ok], axis=-1)
+        missed = int(np.count_nonzero(error > tolerance))
+        if missed:
+            report.failures[MISSED_TARGET] = report.failures.get(MISSED_TARGET, 0) + missed
+        report.solved += error.size
+        report.reached += error.size - missed
+        report.error_sum += float(error.sum())
+        report.error_max = max(report.error_max, float(error.max()))
+        report.error_histogram += np.bincount(
+            np.searchsorted(ERROR_BIN_EDGES, error), minlength=len(ERROR_BIN_EDGES) + 1
+        )
+        report.ik_seconds += t1 - t0
+        report.fk_seconds += t3 - t2
+
+    return report
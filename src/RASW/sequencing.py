@@ -0,0 +1,177 @@
+"""Joint-space aware ordering of pick points."""
+
+import numpy as np
+from typing import List, NamedTuple, Optional
+
+from RASW.IK import solve_ik
+
+MAX_DELTA = "max_delta"
+TIME = "time"
+
+
+class PickSequence(NamedTuple):
+    """Result of `plan_pick_sequence`.
+
+    Attributes:
+        order: Indices into the input targets in visiting order
+        joint_angles: Array of shape (M, J) with the IK solution of each
+                      visited target, in visiting order
+        cost: Total travel cost of the order
+        unreachable: Indices of targets left out because IK failed
+    """
+
+    order: np.ndarray
+    joint_angles: np.ndarray
+    cost: float
+    unreachable: np.ndarray
+
+
+def joint_travel_cost(
+    from_angles: np.ndarray,
+    to_angles: np.ndarray,
+    cost: str = MAX_DELTA,
+    joint_speeds: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Pairwise travel cost between two sets of joint configurations.
+
+    With MAX_DELTA the cost is the largest joint rotation in degrees. With
+    TIME every joint moves at its own top speed at the same time, so the
+    cost is the time taken by the slowest joint.
+
+    Args:
+        from_angles: Array of shape (A, J) with joint angles in degrees
+        to_angles: Array of shape (B, J) with joint angles in degrees
+        cost: MAX_DELTA or TIME
+        joint_speeds: Array of shape (J,) with joint speeds in degrees per
+                      second, required for TIME
+
+    Returns:
+        Array of shape (A, B)
+    """
+    if cost == TIME:
+        if joint_speeds is None:
+            raise ValueError("Time-optimal cost requires joint speeds")
+        scale = 1.0 / np.broadcast_to(np.asarray(joint_speeds, dtype=float), from_angles.shape[-1:])
+    elif cost == MAX_DELTA:
+        scale = np.ones(from_angles.shape[-1])
+    else:
+        raise ValueError(f"Unknown cost {cost!r}, expected {MAX_DELTA!r} or {TIME!r}")
+
+    # One joint at a time keeps peak memory at a single (A, B) matrix
+    result = np.zeros((from_angles.shape[0], to_angles.shape[0]))
+    for joint in range(from_angles.shape[-1]):
+        delta = np.abs(from_angles[:, None, joint] - to_angles[None, :, joint]) * scale[joint]
+        np.maximum(result, delta, out=result)
+    return result
+
+
+def _nearest_neighbour(costs: np.ndarray) -> np.ndarray:
+    """Greedy tour from node 0 of a (M + 1) square cost matrix."""
+    n = costs.shape[0]
+    tour = np.empty(n, dtype=np.intp)
+    visited = np.zeros(n, dtype=bool)
+    tour[0] = 0
+    visited[0] = True
+    for step in range(1, n):
+        row = np.where(visited, np.inf, costs[tour[step - 1]])
+        tour[step] = np.argmin(row)
+        visited[tour[step]] = True
+    return tour
+
+
+def _two_opt_pass(costs: np.ndarray, tour: np.ndarray) -> bool:
+    """Apply the best segment reversal for every start position once."""
+    n = tour.size
+    improved = False
+    for i in range(1, n - 1):
+        j = np.arange(i + 1, n)
+        a, b = tour[i - 1], tour[i]
+        c, d = tour[j], tour[(j + 1) % n]
+        gain = costs[a, c] + costs[b, d] - costs[a, b] - costs[c, d]
+        best = np.argmin(gain)
+        if gain[best] < -1e-9:
+            tour[i : j[best] + 1] = tour[i : j[best] + 1][::-1].copy()
+            improved = True
+    return improved
+
+
+def _or_opt_pass(costs: np.ndarray, tour: np.ndarray, max_segment: int = 3) -> bool:
+    """Move short segments to their cheapest insertion point."""
+    n = tour.size
+    k = np.arange(n)
+    improved = False
+    for length in range(1, max_segment + 1):
+        for i in range(1, n - length + 1):
+            seg_first, seg_last = tour[i], tour[i + length - 1]
+            prev, nxt = tour[i - 1], tour[(i + length) % n]
+            # Insert between tour[k] and tour[k + 1], outside the segment
+            p, q = tour, tour[(k + 1) % n]
+            gain = costs[p, seg_first] + costs[seg_last, q] - costs[p, q]
+            gain[i - 1 : i + length] = np.inf
+            best = int(np.argmin(gain))
+            removal = costs[prev, nxt] - costs[prev, seg_first] - costs[seg_last, nxt]
+            if gain[best] + removal < -1e-9:
+                segment = tour[i : i + length].copy()
+                rest = np.concatenate([tour[:i], tour[i + length :]])
+                at = best + 1 if best < i else best + 1 - length
+                tour[:] = np.concatenate([rest[:at], segment, rest[at:]])
+                improved = True
+    return improved
+
+
+def plan_pick_sequence(
+    targets: np.ndarray,
+    arm_lengths: List[float],
+    start_angles: Optional[List[float]] = None,
+    cost: str = MAX_DELTA,
+    joint_speeds: Optional[np.ndarray] = None,
+    max_passes: int = 50,
+) -> PickSequence:
+    """Order pick points to minimize joint-space travel.
+
+    All targets are solved in one batch, the travel costs between every pair
+    of solutions are computed in one vectorized pass, and a nearest
+    neighbour tour is improved with 2-opt and Or-opt moves until neither
+    finds a gain. The path is open: it starts at start_angles (or anywhere
+    when no start is given) and ends at the last pick.
+
+    Args:
+        targets: Array of shape (N, 2) with pick (x, y) positions
+        arm_lengths: List of arm segment lengths
+        start_angles: Joint angles in degrees the arm starts from
+        cost: MAX_DELTA or TIME, see `joint_travel_cost`
+        joint_speeds: Joint speeds in degrees per second, required for TIME
+        max_passes: Maximum number of improvement passes
+
+    Returns:
+        PickSequence with the visiting order and its joint angles
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    angles, status, _ = solve_ik(targets, arm_lengths)
+    reachable = np.flatnonzero(status == 0)
+    unreachable = np.flatnonzero(status != 0)
+    solved = angles[reachable]
+    m = solved.shape[0]
+    if m == 0:
+        return PickSequence(reachable, solved, 0.0, unreachable)
+
+    # Node 0 is a depot: leaving it costs the move from the start pose (or
+    # nothing without one) and returning to it is free, which turns the open
+    # path into a closed tour the improvement moves can work on.
+    costs = np.zeros((m + 1, m + 1))
+    costs[1:, 1:] = joint_travel_cost(solved, solved, cost, joint_speeds)
+    if start_angles is not None:
+        start = np.asarray(start_angles, dtype=float)[None, :]
+        costs[0, 1:] = joint_travel_cost(start, solved, cost, joint_speeds)[0]
+
+    tour = _nearest_neighbour(costs)
+    for _ in range(max_passes):
+        improved = _two_opt_pass(costs, tour)
+        improved = _or_opt_pass(costs, tour) or improved
+        if not improved:
+            break
+
+    # Rotate so the depot is first, then drop it
+    tour = np.roll(tour, -int(np.flatnonzero(tour == 0)[0]))[1:] - 1
+    total = float(costs[np.r_[0, tour[:-1] + 1], tour + 1].sum())
+    return PickSequence(reachable[tour], solved[tour], total, unreachable)
@@ -0,0 +1,318 @@
+"""Shared-memory joint state bus for processes on the same machine.
+
+One publisher writes joint angles and their FK joint positions once per
+control cycle; any number of reader processes map the same memory and read
+them without copying or pickling.
+
+The buffer is a ring of slots, each guarded by a sequence counter (a
+seqlock): the counter is odd while the slot is being written and even once
+it is complete. Readers check the counter before and after reading, so a
+torn read is detected and retried instead of returned. With several slots a
+reader holding zero-copy views of the latest slot has slots - 1 cycles to
+finish before the publisher comes back round to overwrite it.
+
+The seqlock relies on the publisher's stores becoming visible in program
+order, which holds on x86 and other TSO machines.
+"""
+
+import multiprocessing
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from typing import List, Optional, Set, Tuple
+
+from RASW.FK.forward_kinematics import _cumulative_sin_cos, _fk_from_sin_cos
+
+# Header: magic, slot count, joint count, latest published sequence number
+_MAGIC = 0x52415357  # "RASW"
+_HEADER_WORDS = 4
+
+# Buses created by this process, still registered with its resource tracker
+_CREATED: Set[str] = set()
+
+
+def _shares_creator_tracker(name: str) -> bool:
+    """Whether this process uses the resource tracker that registered a bus.
+
+    That is the creating process itself and the children it starts with
+    multiprocessing, which inherit its tracker.
+    """
+    return name in _CREATED or multiprocessing.parent_process() is not None
+
+
+def _open_shared_memory(name: str, untrack: Optional[bool]) -> shared_memory.SharedMemory:
+    """Attach without letting this process's resource tracker unlink it.
+
+    Before Python 3.13 attaching registers the segment with the resource
+    tracker, which would unlink it when an unrelated reader process exits.
+    On 3.13 and later the segment is never tracked on attach.
+    """
+    if untrack is None:
+        untrack = not _shares_creator_tracker(name)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        memory = shared_memory.SharedMemory(name=name)
+        if untrack:
+            try:
+                from multiprocessing import resource_tracker
+
+                resource_tracker.unregister(memory._name, "shared_memory")
+            except Exception:
+                pass
+        return memory
+
+
+class JointStateBus:
+    """Ring buffer of joint states in shared memory.
+
+    Use `create` in the publishing process and `attach` in readers.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool):
+        self._memory = memory
+        self._owner = owner
+        words = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=memory.buf)
+        if words[0] != _MAGIC:
+            raise ValueError(f"Shared memory {memory.name!r} is not a RASW joint state bus")
+        self.slots = int(words[1])
+        self.joint_count = int(words[2])
+        self._header = words
+
+        j = self.joint_count
+        offset = _HEADER_WORDS * 8
+        self.arm_lengths = np.ndarray((j,), dtype=np.float64, buffer=memory.buf, offset=offset)
+        offset += j * 8
+        # Per slot: sequence, timestamp, J angles, (J + 1) * 2 positions
+        self._slot_words = 2 + j + 2 * (j + 1)
+        slots = np.ndarray(
+            (self.slots, self._slot_words), dtype=np.float64, buffer=memory.buf, offset=offset
+        )
+        self._sequences = np.ndarray(
+            (self.slots,), dtype=np.int64, buffer=memory.buf,
+            offset=offset, strides=(self._slot_words * 8,),
+        )
+        self._timestamps = slots[:, 1]
+        self._angles = slots[:, 2 : 2 + j]
+        self._positions = slots[:, 2 + j :].reshape(self.slots, j + 1, 2)
+
+    @property
+    def name(self) -> str:
+        """Shared memory name readers pass to `attach`."""
+        return self._memory.name
+
+    @classmethod
+    def create(
+        cls, arm_lengths: List[float], slots: int = 8, name: Optional[str] = None
+    ) -> "JointStateBus":
+        """Allocate a new bus for an arm.
+
+        Args:
+            arm_lengths: List of arm segment lengths, shared with readers
+            slots: Number of ring slots, at least 2
+            name: Shared memory name, generated when None
+
+        Returns:
+            The publishing side of the bus, which unlinks it on close
+        """
+        j = len(arm_lengths)
+        slots = max(int(slots), 2)
+        size = 8 * (_HEADER_WORDS + j + slots * (2 + j + 2 * (j + 1)))
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=memory.buf)
+        header[:] = (_MAGIC, slots, j, -1)
+        bus = cls(memory, owner=True)
+        _CREATED.add(memory.name)
+        bus.arm_lengths[:] = arm_lengths
+        bus._sequences[:] = 0
+        return bus
+
+    @classmethod
+    def attach(cls, name: str, untrack: Optional[bool] = None) -> "JointStateBus":
+        """Map an existing bus.
+
+        Args:
+            name: Shared memory name of the bus
+            untrack: Keep this process's resource tracker from unlinking the
+                     bus at exit, which it otherwise does before Python 3.13.
+                     None decides per process: False in the creating process
+                     and in multiprocessing children, which share its tracker
+                     and whose untracking would drop the creator's
+                     registration, True everywhere else. Pass it explicitly
+                     for a reader started some other way from the creator.
+        """
+        return cls(_open_shared_memory(name, untrack), owner=False)
+
+    def publish(self, joint_angles: np.ndarray, timestamp: Optional[float] = None) -> int:
+        """Write joint angles and their FK positions to the next slot.
+
+        Args:
+            joint_angles: Array of shape (J,) with joint angles in degrees
+            timestamp: Sample time, time.perf_counter() by default
+
+        Returns:
+            Sequence number of the published state
+        """
+        sequence = int(self._header[3]) + 1
+        slot = sequence % self.slots
+        self._sequences[slot] = 2 * sequence + 1
+        self._timestamps[slot] = time.perf_counter() if timestamp is None else timestamp
+        self._angles[slot] = joint_angles
+        cos, sin = _cumulative_sin_cos(self._angles[slot])
+        self._positions[slot] = _fk_from_sin_cos(self.arm_lengths, cos, sin)
+        self._sequences[slot] = 2 * sequence + 2
+        self._header[3] = sequence
+        return sequence
+
+    def latest_sequence(self) -> int:
+        """Sequence number of the newest complete state, -1 before the first."""
+        return int(self._header[3])
+
+    def view(self, sequence: Optional[int] = None) -> Tuple[int, float, np.ndarray, np.ndarray]:
+        """Zero-copy views of a published state.
+
+        The views alias shared memory. Call `is_valid` with the returned
+        sequence after using them to confirm they were not overwritten.
+
+        Args:
+            sequence: State to view, the latest by default
+
+        Returns:
+            Tuple (sequence, timestamp, angles view (J,), positions view (J + 1, 2))
+        """
+        if sequence is None:
+            sequence = self.latest_sequence()
+        slot = sequence % self.slots
+        return (
+            sequence,
+            float(self._timestamps[slot]),
+            self._angles[slot],
+            self._positions[slot],
+        )
+
+    def is_valid(self, sequence: int) -> bool:
+        """Check that a state has been completely written and not overwritten."""
+        return sequence >= 0 and self._sequences[sequence % self.slots] == 2 * sequence + 2
+
+    def read(
+        self,
+        out_angles: Optional[np.ndarray] = None,
+        out_positions: Optional[np.ndarray] = None,
+    ) -> Tuple[int, float, np.ndarray, np.ndarray]:
+        """Copy the latest complete state, retrying torn reads.
+
+        Args:
+            out_angles: Preallocated (J,) array to copy the angles into
+            out_positions: Preallocated (J + 1, 2) array for the positions
+
+        Returns:
+            Tuple (sequence, timestamp, angles, positions), sequence -1 if
+            nothing has been published yet
+        """
+        if out_angles is None:
+            out_angles = np.empty(self.joint_count)
+        if out_positions is None:
+            out_positions = np.empty((self.joint_count + 1, 2))
+        while True:
+            sequence, timestamp, angles, positions = self.view()
+            if sequence < 0:
+                return sequence, 0.0, out_angles, out_positions
+            out_angles[:] = angles
+            out_positions[:] = positions
+            if self.is_valid(sequence):
+                return sequence, timestamp, out_angles, out_positions
+
+    def close(self) -> None:
+        """Unmap the bus, and unlink it when this process created it."""
+        self._header = self._sequences = self._timestamps = None
+        self._angles = self._positions = self.arm_lengths = None
+        self._memory.close()
+        if self._owner:
+            _CREATED.discard(self._memory.name)
+            self._memory.unlink()
+
+    def __enter__(self) -> "JointStateBus":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _bus_reader(name: str, messages: int, results) -> None:
+    # The reader only ever sees the newest state, so it stops at the last
+    # sequence number rather than after a fixed number of reads
+    bus = JointStateBus.attach(name)
+    latencies = []
+    seen = -1
+    angles = np.empty(bus.joint_count)
+    positions = np.empty((bus.joint_count + 1, 2))
+    while seen < messages - 1:
+        if bus.latest_sequence() == seen:
+            continue
+        sequence, timestamp, _, _ = bus.read(angles, positions)
+        latencies.append(time.perf_counter() - timestamp)
+        seen = sequence
+    bus.close()
+    results.put(np.array(latencies))
+
+
+def _queue_reader(channel, messages: int, results) -> None:
+    latencies = np.empty(messages)
+    for received in range(messages):
+        timestamp, _, _ = channel.get()
+        latencies[received] = time.perf_counter() - timestamp
+    results.put(latencies)
+
+
+def benchmark_latency(
+    messages: int = 2000, arm_lengths: Optional[List[float]] = None, interval: float = 5e-4
+) -> dict:
+    """Compare publish-to-read latency of the bus and a multiprocessing.Queue.
+
+    A reader process records how long after publication it saw each
+    message. Messages are spaced by interval seconds so the reader keeps up
+    and only transport latency is measured.
+
+    Returns:
+        Dict mapping "shared_memory" and "queue" to median and 99th
+        percentile latency in microseconds
+    """
+    import multiprocessing
+
+    arm_lengths = arm_lengths or [160.0, 160.0, 160.0]
+    context = multiprocessing.get_context("spawn")
+    results = {}
+
+    with JointStateBus.create(arm_lengths) as bus:
+        output = context.Queue()
+        reader = context.Process(target=_bus_reader, args=(bus.name, messages, output))
+        reader.start()
+        time.sleep(1.0)  # let the reader start polling
+        angles = np.zeros(len(arm_lengths))
+        for i in range(messages):
+            angles[0] = i
+            bus.publish(angles)
+            time.sleep(interval)
+        results["shared_memory"] = output.get()
+        reader.join()
+
+    channel, output = context.Queue(), context.Queue()
+    reader = context.Process(target=_queue_reader, args=(channel, messages, output))
+    reader.start()
+    time.sleep(1.0)
+    for i in range(messages):
+        angles = np.array([i] + [0.0] * (len(arm_lengths) - 1))
+        cos, sin = _cumulative_sin_cos(angles)
+        positions = _fk_from_sin_cos(np.asarray(arm_lengths), cos, sin)
+        channel.put((time.perf_counter(), angles, positions))
+        time.sleep(interval)
+    results["queue"] = output.get()
+    reader.join()
+
+    return {
+        transport: {
+            "median_us": float(np.median(latency) * 1e6),
+            "p99_us": float(np.percentile(latency, 99) * 1e6),
+        }
+        for transport, latency in results.items()
+    }
@@ -0,0 +1,152 @@
+"""Chunked, out-of-core FK and IK over datasets that do not fit in memory."""
+
+import queue
+import threading
+import numpy as np
+from typing import Iterable, Iterator, List, Tuple, Optional, Union
+
+from RASW.FK import calculate_fk_batch
+from RASW.IK import calculate_ik_batch
+
+# Default number of rows solved at once, a few MB of working memory
+DEFAULT_CHUNK_SIZE = 65536
+
+ChunkSource = Union[np.ndarray, Iterable]
+
+
+def iter_chunks(source: ChunkSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Split a data source into 2D chunks of at most chunk_size rows.
+
+    Arrays (including np.memmap) are sliced, so only one chunk is read into
+    memory at a time. Any other iterable may yield single rows, 2D blocks of
+    rows, or a mix of both; rows are gathered and blocks re-split so every
+    chunk except the last has exactly chunk_size rows.
+
+    Args:
+        source: Array, memmap or iterable of rows/blocks
+        chunk_size: Maximum number of rows per chunk
+
+    Yields:
+        Arrays of shape (n, C) with n <= chunk_size
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    if isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunk_size):
+            # np.array forces memmap pages to be read here, not in the solver
+            yield np.array(source[start : start + chunk_size], dtype=float)
+        return
+
+    pending = []
+    pending_rows = 0
+    for item in source:
+        block = np.atleast_2d(np.asarray(item, dtype=float))
+        pending.append(block)
+        pending_rows += block.shape[0]
+        if pending_rows < chunk_size:
+            continue
+        merged = np.concatenate(pending)
+        for start in range(0, merged.shape[0] - chunk_size + 1, chunk_size):
+            yield merged[start : start + chunk_size]
+        rest = merged[merged.shape[0] - merged.shape[0] % chunk_size :]
+        pending = [rest] if rest.shape[0] else []
+        pending_rows = rest.shape[0]
+    if pending_rows:
+        yield np.concatenate(pending)
+
+
+def _prefetch(chunks: Iterator[np.ndarray], depth: int) -> Iterator[np.ndarray]:
+    """Read chunks on a background thread while the caller solves."""
+    buffer = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(done)
+        except BaseException as exc:  # re-raised on the consumer thread
+            put(exc)
+
+    thread = threading.Thread(target=reader, name="rasw-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def _chunks(source: ChunkSource, chunk_size: int, prefetch: int) -> Iterator[np.ndarray]:
+    chunks = iter_chunks(source, chunk_size)
+    if prefetch > 0:
+        return _prefetch(chunks, prefetch)
+    return chunks
+
+
+def iter_ik(
+    targets: ChunkSource,
+    arm_lengths: List[float],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    prefetch: int = 0,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Solve inverse kinematics chunk by chunk.
+
+    Peak memory is bounded by (prefetch + 2) chunks regardless of the size
+    of the dataset.
+
+    Args:
+        targets: Array, memmap or iterable of (x, y) rows or (n, 2) blocks
+        arm_lengths: List of arm segment lengths
+        chunk_size: Number of targets solved per vectorized call
+        prefetch: Number of chunks to read ahead on a background thread,
+                  0 reads on the calling thread
+
+    Yields:
+        The (angles, status) result of `calculate_ik_batch` for each chunk
+    """
+    for chunk in _chunks(targets, chunk_size, prefetch):
+        yield calculate_ik_batch(chunk, arm_lengths)
+
+
+def iter_fk(
+    joint_angles: ChunkSource,
+    arm_lengths: List[float],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    prefetch: int = 0,
+) -> Iterator[Tuple[np.ndarray, Optional[str]]]:
+    """Calculate forward kinematics chunk by chunk.
+
+    Peak memory is bounded by (prefetch + 2) chunks regardless of the size
+    of the dataset.
+
+    Args:
+        joint_angles: Array, memmap or iterable of angle rows or (n, J) blocks,
+                      in degrees
+        arm_lengths: List of arm segment lengths
+        chunk_size: Number of configurations per vectorized call
+        prefetch: Number of chunks to read ahead on a background thread,
+                  0 reads on the calling thread
+
+    Yields:
+        The (positions, error) result of `calculate_fk_batch` for each chunk
+    """
+    for chunk in _chunks(joint_angles, chunk_size, prefetch):
+        yield calculate_fk_batch(arm_lengths, chunk)
@@ -0,0 +1,165 @@
+"""Compact spline representation of joint trajectories."""
+
+import numpy as np
+from typing import List, Optional
+
+from RASW.FK import calculate_fk_batch
+from RASW.IK import IK_STATUS_MESSAGES, solve_ik
+
+
+class SplineTrajectory:
+    """Piecewise cubic joint trajectory stored as polynomial coefficients.
+
+    Segment k covers [knots[k], knots[k + 1]] and evaluates
+    c0 + c1 u + c2 u^2 + c3 u^3 with u = t - knots[k]. Neighbouring segments
+    share positions and velocities at the knots, so the path is C1.
+
+    Args:
+        knots: Array of shape (K + 1,) with increasing segment boundaries
+        coefficients: Array of shape (K, 4, J) with per-segment coefficients
+    """
+
+    def __init__(self, knots: np.ndarray, coefficients: np.ndarray):
+        self.knots = np.asarray(knots, dtype=float)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+
+    @property
+    def duration(self) -> float:
+        """Time between the first and last knot."""
+        return float(self.knots[-1] - self.knots[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the knots and coefficients."""
+        return self.knots.nbytes + self.coefficients.nbytes
+
+    @classmethod
+    def fit(
+        cls, times: np.ndarray, joint_angles: np.ndarray, tolerance: float = 0.01
+    ) -> "SplineTrajectory":
+        """Fit a dense sampled trajectory within a tolerance.
+
+        Segments are cubic Hermite curves through the samples at their ends,
+        using finite-difference velocities. A segment that misses any sample
+        in between by more than the tolerance is split in half, so smooth
+        stretches end up with few coefficients and sharp ones with many.
+
+        Args:
+            times: Array of shape (T,) with increasing sample times
+            joint_angles: Array of shape (T, J) with joint angles in degrees
+            tolerance: Maximum deviation from the samples in degrees
+
+        Returns:
+            The fitted SplineTrajectory
+        """
+        times = np.asarray(times, dtype=float)
+        angles = np.asarray(joint_angles, dtype=float).reshape(times.shape[0], -1)
+        if times.shape[0] < 2:
+            raise ValueError("At least two samples are required")
+        velocities = np.gradient(angles, times, axis=0)
+
+        boundaries = []
+        stack = [(0, times.shape[0] - 1)]
+        while stack:
+            start, end = stack.pop()
+            coefficients = _hermite(
+                times[end] - times[start],
+                angles[start], angles[end], velocities[start], velocities[end],
+            )
+            u = times[start : end + 1] - times[start]
+            fitted = _horner(coefficients[None], u)
+            if end - start > 1 and np.abs(fitted - angles[start : end + 1]).max() > tolerance:
+                middle = (start + end) // 2
+                stack.append((middle, end))
+                stack.append((start, middle))
+            else:
+                boundaries.append((start, coefficients))
+
+        boundaries.sort(key=lambda item: item[0])
+        starts = [start for start, _ in boundaries]
+        knots = np.append(times[starts], times[-1])
+        return cls(knots, np.stack([coefficients for _, coefficients in boundaries]))
+
+    @classmethod
+    def fit_cartesian(
+        cls,
+        times: np.ndarray,
+        path: np.ndarray,
+        arm_lengths: List[float],
+        tolerance: float = 0.01,
+        joint_limits: Optional[np.ndarray] = None,
+    ) -> "SplineTrajectory":
+        """Solve IK along a Cartesian path and fit the joint trajectory.
+
+        IK returns angles within +-180 degrees, so a path crossing that seam
+        would make a joint spin a full turn between two samples. Without
+        joint limits the angles are unwrapped first; with limits the solver's
+        angles are kept, since unwrapping could leave the allowed range.
+
+        Args:
+            times: Array of shape (T,) with increasing sample times
+            path: Array of shape (T, 2) with end effector (x, y) positions
+            arm_lengths: List of arm segment lengths
+            tolerance: Maximum deviation from the IK samples in degrees
+            joint_limits: Optional (J, 2) joint limits passed to `solve_ik`
+
+        Returns:
+            The fitted SplineTrajectory
+        """
+        angles, status, _ = solve_ik(path, arm_lengths, joint_limits=joint_limits)
+        failed = np.flatnonzero(status)
+        if failed.size:
+            raise ValueError(
+                f"IK failed at sample {failed[0]}: {IK_STATUS_MESSAGES[int(status[failed[0]])]}"
+            )
+        if joint_limits is None:
+            angles = np.unwrap(angles, period=360.0, axis=0)
+        return cls.fit(times, angles, tolerance)
+
+    def _locate(self, t: np.ndarray):
+        t = np.asarray(t, dtype=float)
+        segment = np.clip(
+            np.searchsorted(self.knots, t, side="right") - 1, 0, len(self.coefficients) - 1
+        )
+        return segment, t - self.knots[segment]
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        """Joint angles in degrees at the given times, shape t.shape + (J,)."""
+        segment, u = self._locate(t)
+        return _horner(self.coefficients[segment], u)
+
+    def velocity(self, t: np.ndarray) -> np.ndarray:
+        """Joint velocities in degrees per unit time, shape t.shape + (J,)."""
+        segment, u = self._locate(t)
+        c = self.coefficients[segment]
+        u = u[..., None]
+        return c[..., 1, :] + u * (2 * c[..., 2, :] + u * 3 * c[..., 3, :])
+
+    def acceleration(self, t: np.ndarray) -> np.ndarray:
+        """Joint accelerations in degrees per unit time squared, shape t.shape + (J,)."""
+        segment, u = self._locate(t)
+        c = self.coefficients[segment]
+        return 2 * c[..., 2, :] + 6 * u[..., None] * c[..., 3, :]
+
+    def end_effector(self, t: np.ndarray, arm_lengths: List[float]) -> np.ndarray:
+        """End effector (x, y) positions at the given times, shape t.shape + (2,)."""
+        t = np.asarray(t, dtype=float)
+        angles = self.evaluate(t.ravel())
+        positions, _ = calculate_fk_batch(arm_lengths, angles)
+        return positions[:, -1].reshape(t.shape + (2,))
+
+
+def _hermite(
+    dt: float, p0: np.ndarray, p1: np.ndarray, v0: np.ndarray, v1: np.ndarray
+) -> np.ndarray:
+    """Cubic coefficients (4, J) matching positions and velocities at both ends."""
+    c2 = (3 * (p1 - p0) / dt - 2 * v0 - v1) / dt
+    c3 = (2 * (p0 - p1) / dt + v0 + v1) / dt**2
+    return np.stack([p0, v0, c2, c3])
+
+
+def _horner(coefficients: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Evaluate (..., 4, J) cubic coefficients at local times u."""
+    u = np.asarray(u)[..., None]
+    c = coefficients
+    return c[..., 0, :] + u * (c[..., 1, :] + u * (c[..., 2, :] + u * c[..., 3, :]))
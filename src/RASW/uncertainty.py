@@ -0,0 +1,203 @@
+"""Propagate joint encoder noise and link length tolerance to the tool tip.
+
+Two estimates of the end effector covariance are provided for batches of
+poses:
+
+- `analytic_uncertainty` linearizes FK around each pose, so the covariance is
+  J_q diag(joint variance) J_q^T + J_L diag(length variance) J_L^T, where J_q
+  is the usual Jacobian and column k of J_L is the direction of link k.
+- `monte_carlo_uncertainty` perturbs every pose S times and evaluates all
+  samples as one (N, S, J) array operation.
+
+The first-order estimate is exact for link length errors, which enter FK
+linearly, and good for joint noise of a few degrees. Monte Carlo also
+captures the curvature of the workspace for larger noise.
+
+Both return the covariance as an ellipse per pose at a chosen confidence.
+"""
+
+import numpy as np
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from RASW.FK.forward_kinematics import _cumulative_sin_cos
+from RASW.FK.jacobian import _jacobian_from_sin_cos
+
+# Cap on samples * joints held in memory at once by the Monte Carlo mode
+MAX_BATCH_ELEMENTS = 1 << 22
+
+
+class PoseUncertainty(NamedTuple):
+    """End effector uncertainty for a batch of N poses.
+
+    Attributes:
+        mean: Array of shape (N, 2) with the expected end effector position
+        covariance: Array of shape (N, 2, 2)
+        semi_axes: Array of shape (N, 2) with the major and minor ellipse
+                   semi-axes at the requested confidence
+        orientation: Array of shape (N,) with the major axis angle in degrees
+    """
+
+    mean: np.ndarray
+    covariance: np.ndarray
+    semi_axes: np.ndarray
+    orientation: np.ndarray
+
+
+def covariance_ellipses(
+    covariance: np.ndarray, confidence: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert 2D covariance matrices to confidence ellipses.
+
+    For a 2D Gaussian the squared Mahalanobis distance is chi-square with
+    two degrees of freedom, so the ellipse holding a fraction p of the
+    samples scales the standard deviations by sqrt(-2 ln(1 - p)).
+
+    Args:
+        covariance: Array of shape (..., 2, 2)
+        confidence: Fraction of the distribution inside the ellipse
+
+    Returns:
+        Tuple containing:
+        - Array of shape (..., 2) with the major and minor semi-axes
+        - Array of shape (...) with the major axis angle in degrees
+    """
+    a = covariance[..., 0, 0]
+    b = covariance[..., 0, 1]
+    c = covariance[..., 1, 1]
+    # Closed-form eigenvalues of a symmetric 2x2 matrix
+    mid = (a + c) / 2
+    radius = np.hypot((a - c) / 2, b)
+    eigenvalues = np.stack([mid + radius, np.maximum(mid - radius, 0.0)], axis=-1)
+    scale = np.sqrt(-2.0 * np.log1p(-confidence))
+    semi_axes = scale * np.sqrt(eigenvalues)
+    orientation = np.degrees(0.5 * np.arctan2(2 * b, a - c))
+    return semi_axes, orientation
+
+
+def _prepare(
+    arm_lengths: List[float],
+    joint_angles: np.ndarray,
+    joint_std: Union[float, List[float]],
+    length_std: Union[float, List[float]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Optional[str]]:
+    arm_lengths = np.asarray(arm_lengths, dtype=float)
+    joint_angles = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+    joint_count = joint_angles.shape[-1]
+    joint_std = np.broadcast_to(np.asarray(joint_std, dtype=float), (joint_count,))
+    length_std = np.broadcast_to(np.asarray(length_std, dtype=float), (joint_count,))
+    error = None
+    if arm_lengths.shape[-1] != joint_count:
+        error = "Number of arm lengths must match number of joint angles"
+    return arm_lengths, joint_angles, joint_std, length_std, error
+
+
+def _empty_result() -> PoseUncertainty:
+    return PoseUncertainty(
+        np.empty((0, 2)), np.empty((0, 2, 2)), np.empty((0, 2)), np.empty(0)
+    )
+
+
+def analytic_uncertainty(
+    arm_lengths: List[float],
+    joint_angles: np.ndarray,
+    joint_std: Union[float, List[float]],
+    length_std: Union[float, List[float]] = 0.0,
+    confidence: float = 0.95,
+) -> Tuple[PoseUncertainty, Optional[str]]:
+    """First-order end effector covariance for a batch of poses.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        joint_angles: Array of shape (N, J) with joint angles in degrees
+        joint_std: Joint angle standard deviation in degrees, one value or
+                   one per joint
+        length_std: Link length standard deviation, one value or one per link
+        confidence: Fraction of the distribution inside the reported ellipses
+
+    Returns:
+        Tuple containing:
+        - PoseUncertainty for every pose
+        - Error message if any, None otherwise
+    """
+    arm_lengths, joint_angles, joint_std, length_std, error = _prepare(
+        arm_lengths, joint_angles, joint_std, length_std
+    )
+    if error:
+        return _empty_result(), error
+
+    cos, sin = _cumulative_sin_cos(joint_angles)
+    mean = np.stack([(arm_lengths * cos).sum(-1), (arm_lengths * sin).sum(-1)], axis=-1)
+
+    # Scaling the Jacobian columns by the standard deviations gives A with
+    # covariance A A^T, one (N, 2, J) product per error source
+    joint_part = _jacobian_from_sin_cos(arm_lengths, cos, sin) * np.radians(joint_std)
+    length_part = np.stack([cos, sin], axis=-2) * length_std
+    covariance = joint_part @ np.swapaxes(joint_part, -1, -2)
+    covariance += length_part @ np.swapaxes(length_part, -1, -2)
+
+    semi_axes, orientation = covariance_ellipses(covariance, confidence)
+    return PoseUncertainty(mean, covariance, semi_axes, orientation), None
+
+
+def monte_carlo_uncertainty(
+    arm_lengths: List[float],
+    joint_angles: np.ndarray,
+    joint_std: Union[float, List[float]],
+    length_std: Union[float, List[float]] = 0.0,
+    samples: int = 1000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> Tuple[PoseUncertainty, Optional[str]]:
+    """Sampled end effector covariance for a batch of poses.
+
+    Joint angles and link lengths are drawn from independent Gaussians and
+    each block of poses is evaluated as one (N, S, J) FK batch. Large pose
+    sets are split so at most MAX_BATCH_ELEMENTS samples are held at once.
+
+    Args:
+        arm_lengths: List of arm segment lengths
+        joint_angles: Array of shape (N, J) with joint angles in degrees
+        joint_std: Joint angle standard deviation in degrees, one value or
+                   one per joint
+        length_std: Link length standard deviation, one value or one per link
+        samples: Number of samples S per pose
+        confidence: Fraction of the distribution inside the reported ellipses
+        seed: Seed for reproducible samples
+
+    Returns:
+        Tuple containing:
+        - PoseUncertainty for every pose
+        - Error message if any, None otherwise
+    """
+    arm_lengths, joint_angles, joint_std, length_std, error = _prepare(
+        arm_lengths, joint_angles, joint_std, length_std
+    )
+    if error:
+        return _empty_result(), error
+    if samples < 2:
+        return _empty_result(), "At least two samples are needed per pose"
+
+    rng = np.random.default_rng(seed)
+    count, joint_count = joint_angles.shape
+    mean = np.empty((count, 2))
+    covariance = np.empty((count, 2, 2))
+    block = max(1, MAX_BATCH_ELEMENTS // (samples * joint_count))
+
+    for start in range(0, count, block):
+        angles = joint_angles[start : start + block, None, :]
+        noisy = angles + rng.standard_normal((angles.shape[0], samples, joint_count)) * joint_std
+        cos, sin = _cumulative_sin_cos(noisy)
+        lengths = arm_lengths
+        if np.any(length_std):
+            lengths = arm_lengths + rng.standard_normal(noisy.shape) * length_std
+        tips = np.stack([(lengths * cos).sum(-1), (lengths * sin).sum(-1)], axis=-1)
+
+        block_mean = tips.mean(axis=1)
+        centered = tips - block_mean[:, None, :]
+        mean[start : start + block] = block_mean
+        covariance[start : start + block] = np.einsum(
+            "nsi,nsj->nij", centered, centered
+        ) / (samples - 1)
+
+    semi_axes, orientation = covariance_ellipses(covariance, confidence)
+    return PoseUncertainty(mean, covariance, semi_axes, orientation), None
@@ -0,0 +1,21 @@
+"""Shared pytest setup for the RASW test suite."""
+
+import os
+
+import pytest
+
+# Importing RASW opens the documentation in a browser on first run
+os.environ.setdefault("RASW_NO_BROWSER", "1")
+
+
+@pytest.fixture
+def clean_registry():
+    """Restore the IK solver registry after a test registers solvers."""
+    from RASW.IK import registry
+
+    saved, loaded = dict(registry._registry), dict(registry._loaded)
+    yield
+    registry._registry.clear()
+    registry._registry.update(saved)
+    registry._loaded.clear()
+    registry._loaded.update(loaded)
@@ -0,0 +1,86 @@
+"""Tests for calculate_ik_batch and the chunked RASW.stream iterators."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch, calculate_ik, calculate_ik_batch, iter_fk, iter_ik
+from RASW.IK import IK_STATUS_MESSAGES
+from RASW.IK.inverse_kinematics import IK_OK, IK_TOO_FEW_LINKS
+from RASW.stream import iter_chunks
+
+
+def _targets(seed, count, radius):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-radius, radius, size=(count, 2))
+
+
+@pytest.mark.parametrize("arm", [[160.0, 120.0], [160.0, 120.0, 80.0]])
+def test_batch_matches_scalar_solver(arm):
+    targets = _targets(0, 300, 1.1 * sum(arm))
+    angles, status = calculate_ik_batch(targets, arm)
+    for row, (x, y) in enumerate(targets):
+        expected, error = calculate_ik(x, y, arm)
+        assert error == IK_STATUS_MESSAGES[status[row]]
+        if expected is None:
+            assert np.all(np.isnan(angles[row]))
+        else:
+            assert np.allclose(angles[row], expected)
+
+
+@pytest.mark.parametrize("arm", [[160.0, 120.0], [160.0, 120.0, 80.0]])
+def test_solutions_round_trip_through_fk(arm):
+    targets = _targets(1, 2000, sum(arm))
+    angles, status = calculate_ik_batch(targets, arm)
+    solved = status == IK_OK
+    assert solved.any()
+    positions, _ = calculate_fk_batch(arm, angles[solved])
+    assert np.abs(positions[:, -1] - targets[solved]).max() < 1e-9
+
+
+def test_empty_and_too_few_links():
+    angles, status = calculate_ik_batch(np.empty((0, 2)), [1.0, 1.0])
+    assert angles.shape == (0, 2) and status.shape == (0,)
+    angles, status = calculate_ik_batch([[0.5, 0.0]], [1.0])
+    assert status[0] == IK_TOO_FEW_LINKS and np.isnan(angles).all()
+
+
+def test_iter_chunks_resplits_mixed_rows_and_blocks():
+    rows = [np.arange(2.0), np.ones((5, 2)), np.zeros(2), np.full((4, 2), 3.0)]
+    chunks = list(iter_chunks(rows, chunk_size=4))
+    assert [chunk.shape[0] for chunk in chunks] == [4, 4, 3]
+    assert np.array_equal(np.concatenate(chunks), np.vstack([np.atleast_2d(r) for r in rows]))
+    assert list(iter_chunks(iter([]), chunk_size=4)) == []
+    with pytest.raises(ValueError):
+        list(iter_chunks(rows, chunk_size=0))
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_ik_over_memmap_matches_batch(tmp_path, prefetch):
+    arm = [160.0, 120.0, 80.0]
+    targets = _targets(2, 1000, 360.0)
+    mapped = np.lib.format.open_memmap(tmp_path / "targets.npy", mode="w+", shape=targets.shape)
+    mapped[:] = targets
+    results = list(iter_ik(mapped, arm, chunk_size=128, prefetch=prefetch))
+    assert len(results) == 8
+    angles = np.concatenate([angles for angles, _ in results])
+    status = np.concatenate([status for _, status in results])
+    expected_angles, expected_status = calculate_ik_batch(targets, arm)
+    assert np.array_equal(status, expected_status)
+    assert np.allclose(angles, expected_angles, equal_nan=True)
+
+
+def test_iter_fk_matches_batch():
+    arm = [1.0, 2.0]
+    angles = np.random.default_rng(3).uniform(-180, 180, size=(50, 2))
+    positions = np.concatenate([p for p, _ in iter_fk(iter(angles), arm, chunk_size=16)])
+    expected, _ = calculate_fk_batch(arm, angles)
+    assert np.allclose(positions, expected)
+
+
+def test_prefetch_reraises_source_errors():
+    def source():
+        yield np.zeros((4, 2))
+        raise OSError("read failed")
+
+    with pytest.raises(OSError):
+        list(iter_ik(source(), [1.0, 1.0], chunk_size=2, prefetch=1))
@@ -0,0 +1,101 @@
+"""Tests for best-effort IK and reach projection."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch, calculate_ik_best_effort, project_to_reachable
+from RASW.IK import calculate_ik_batch
+
+
+def _tip(arm_lengths, angles):
+    positions, error = calculate_fk_batch(arm_lengths, angles)
+    assert error is None
+    return positions[:, -1]
+
+
+@pytest.mark.parametrize(
+    "arm_lengths",
+    [[1.0, 0.6], [0.6, 1.0], [1.0, 1.0], [1.0, 0.8, 0.5], [0.5, 1.0, 0.7], [3.0, 0.2, 0.2]],
+)
+def test_residual_is_the_distance_to_the_end_effector(arm_lengths):
+    rng = np.random.default_rng(1)
+    targets = rng.uniform(-3, 3, (2000, 2))
+    targets[0] = 0.0
+    angles, residual = calculate_ik_best_effort(targets, arm_lengths)
+    assert not np.isnan(angles).any()
+    error = np.hypot(*(_tip(arm_lengths, angles) - targets).T)
+    assert np.allclose(error, residual, atol=1e-9)
+
+
+@pytest.mark.parametrize("arm_lengths", [[1.0, 0.6], [1.0, 0.8, 0.5], [0.5, 1.0, 0.7]])
+def test_projection_is_the_nearest_solvable_radius(arm_lengths):
+    rng = np.random.default_rng(2)
+    targets = rng.uniform(-3, 3, (2000, 2))
+    _, moved = project_to_reachable(targets, arm_lengths)
+
+    # Brute force: the solvable radii along +x, at a fine spacing
+    radii = np.linspace(0.0, sum(arm_lengths) * 1.01, 100001)
+    _, status = calculate_ik_batch(np.stack([radii, np.zeros_like(radii)], -1), arm_lengths)
+    solvable = radii[status == 0]
+    distance = np.abs(np.hypot(*targets.T)[:, None] - solvable[None, ::50]).min(axis=1)
+    spacing = radii[1] * 50
+    assert np.all(moved <= distance + 1e-9)
+    assert np.all(moved >= distance - spacing)
+
+
+def test_reachable_targets_are_unchanged():
+    arm_lengths = [160.0, 160.0, 160.0]
+    targets = np.array([[300.0, 100.0], [-200.0, 250.0]])
+    projected, moved = project_to_reachable(targets, arm_lengths)
+    assert np.array_equal(projected, targets)
+    assert np.all(moved == 0)
+    _, residual = calculate_ik_best_effort(targets, arm_lengths)
+    assert residual.max() < 1e-9
+
+
+@pytest.mark.parametrize(
+    "arm_lengths", [[100.0, 100.0, 100.0, 100.0], [80.0, 60.0, 60.0, 40.0, 30.0], [300.0, 50.0, 40.0, 30.0]]
+)
+def test_long_arms_reach_every_reachable_target(arm_lengths):
+    rng = np.random.default_rng(3)
+    targets = rng.uniform(-500, 500, (3000, 2))
+    angles, residual = calculate_ik_best_effort(targets, arm_lengths)
+    assert angles.shape == (3000, len(arm_lengths))
+    error = np.hypot(*(_tip(arm_lengths, angles) - targets).T)
+    assert np.allclose(error, residual, atol=1e-9)
+
+    radius = np.hypot(*targets.T)
+    total = sum(arm_lengths)
+    inner = max(0.0, 2 * max(arm_lengths) - total)
+    reachable = (radius >= inner) & (radius <= total)
+    assert residual[reachable].max() < 1e-5
+    # Unreachable targets end up on the rim of the reach annulus
+    expected = np.maximum(radius - total, 0.0) + np.maximum(inner - radius, 0.0)
+    assert np.allclose(residual[~reachable], expected[~reachable], atol=1e-5)
+
+
+def test_four_link_target_missed_by_three_link_solver():
+    angles, residual = calculate_ik_best_effort([[200.0, 50.0]], [100.0, 100.0, 100.0, 100.0])
+    assert residual[0] < 1e-5
+
+
+def test_per_row_arm_lengths():
+    rng = np.random.default_rng(4)
+    arm_lengths = rng.uniform(0.3, 1.5, (500, 4))
+    targets = rng.uniform(-5, 5, (500, 2))
+    angles, residual = calculate_ik_best_effort(targets, arm_lengths)
+    cumulative = np.radians(np.cumsum(angles, axis=1))
+    tip = np.stack([(arm_lengths * np.cos(cumulative)).sum(1), (arm_lengths * np.sin(cumulative)).sum(1)], -1)
+    assert np.allclose(np.hypot(*(tip - targets).T), residual, atol=1e-9)
+    _, moved = project_to_reachable(targets, arm_lengths)
+    assert np.all(residual <= moved + 1e-5)
+
+
+def test_too_few_links():
+    angles, residual = calculate_ik_best_effort([[1.0, 1.0]], [1.0])
+    assert np.isnan(angles).all() and np.isnan(residual).all()
+
+
+def test_empty_batch():
+    angles, residual = calculate_ik_best_effort(np.empty((0, 2)), [1.0, 1.0, 1.0, 1.0])
+    assert angles.shape == (0, 4) and residual.shape == (0,)
@@ -0,0 +1,84 @@
+"""Tests for RASW.control."""
+
+import gc
+import time
+
+import numpy as np
+import pytest
+
+from RASW.control import LoopRunner, TimingHistogram
+
+
+def test_histogram_statistics():
+    histogram = TimingHistogram([1e-3, 1e-2, 1e-1])
+    assert histogram.percentile(50) == 0.0
+    for value in (5e-4, 2e-3, 3e-3, 5e-2):
+        histogram.record(value)
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(13.875e-3)
+    assert histogram.max == 5e-2
+    assert histogram.percentile(50) == 1e-2
+    assert histogram.percentile(100) == 5e-2
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        LoopRunner(lambda context: None, 0.0)
+
+
+def test_deadlines_are_absolute():
+    deadlines = []
+    buffer = np.zeros(3)
+
+    def step(context):
+        deadlines.append(context.deadline)
+        context.buffers["out"][:] = context.iteration
+        context.mark("work")
+
+    runner = LoopRunner(step, 500.0, phases=["work"], buffers={"out": buffer})
+    stats = runner.run(iterations=50)
+    assert stats.iterations == 50
+    # Whole periods after the first deadline, more than one only after an overrun
+    cycles = (np.array(deadlines) - deadlines[0]) / 2e-3
+    assert np.allclose(cycles, np.round(cycles), atol=1e-6)
+    assert np.all(np.diff(np.round(cycles)) >= 1)
+    assert len(deadlines) - 1 + stats.missed_cycles == np.round(cycles[-1])
+    assert np.all(buffer == 49)
+    assert stats.phases["work"].count == 50
+    assert stats.jitter.count == stats.step_time.count == 50
+    assert "Overruns" in stats.format()
+
+
+def test_overruns_skip_missed_deadlines():
+    def step(context):
+        if context.iteration == 2:
+            time.sleep(0.035)
+
+    runner = LoopRunner(step, 100.0)
+    stats = runner.run(iterations=5)
+    assert stats.iterations == 5
+    assert stats.overruns == 1
+    assert stats.missed_cycles >= 3
+
+
+def test_stop_and_duration():
+    def step(context):
+        if context.iteration == 3:
+            runner.stop()
+
+    runner = LoopRunner(step, 1000.0)
+    assert runner.run().iterations == 4
+
+    runner = LoopRunner(lambda context: None, 100.0)
+    started = time.perf_counter()
+    stats = runner.run(duration=0.1)
+    assert time.perf_counter() - started < 0.5
+    assert 5 <= stats.iterations <= 10
+
+
+def test_gc_is_restored():
+    assert gc.isenabled()
+    seen = []
+    LoopRunner(lambda context: seen.append(gc.isenabled()), 1000.0, disable_gc=True).run(3)
+    assert seen == [False, False, False]
+    assert gc.isenabled()
@@ -0,0 +1,99 @@
+"""Tests for RASW.design."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch, calculate_ik_batch
+from RASW.collision import Circle, SignedDistanceField
+from RASW.design import DesignScore, DesignState, DesignWeights, evaluate_design, optimize_design
+
+ARM = [1.0, 0.8]
+
+
+def _targets(seed, count, radius=2.0):
+    return np.random.default_rng(seed).uniform(-radius, radius, size=(count, 2))
+
+
+def test_score_matches_closed_form_two_link():
+    targets = _targets(0, 500)
+    weights = DesignWeights(coverage=1.0, manipulability=0.5, length=0.1)
+    score = evaluate_design(ARM, targets, weights)
+
+    distance = np.hypot(*targets.T)
+    reached = (distance >= 0.2) & (distance <= 1.8)
+    angles, _ = calculate_ik_batch(targets[reached], ARM)
+    # A 2-link arm has manipulability L1 L2 |sin q2|
+    dexterity = np.mean(1.0 * 0.8 * np.abs(np.sin(np.radians(angles[:, 1])))) / 1.8**2
+    assert score.coverage == pytest.approx(reached.mean())
+    assert score.manipulability == pytest.approx(dexterity)
+    assert score.total_length == pytest.approx(1.8)
+    assert score.score == pytest.approx(reached.mean() + 0.5 * dexterity - 0.1 * 1.8)
+
+
+def test_empty_and_unreachable_targets_score_zero():
+    for targets in (np.empty((0, 2)), [[5.0, 5.0], [-4.0, 0.0]]):
+        score = evaluate_design(ARM, targets)
+        assert score.coverage == 0.0 and score.manipulability == 0.0 and score.score == 0.0
+
+
+def test_obstacles_remove_targets_whose_pose_collides():
+    obstacle = Circle(0.5, 0.5, 0.2)
+    field = SignedDistanceField.bake([obstacle], (-2.0, -2.0, 2.0, 2.0), 0.02)
+    targets = _targets(1, 400)
+    margin = 0.05
+    free = evaluate_design(ARM, targets)
+    blocked = evaluate_design(ARM, targets, sdf=field, margin=margin)
+
+    angles, status = calculate_ik_batch(targets, ARM)
+    positions, _ = calculate_fk_batch(ARM, angles[status == 0])
+    clear = field.clearance(positions).min(axis=1) >= margin
+    assert 0 < clear.sum() < (status == 0).sum()
+    assert blocked.coverage == pytest.approx(clear.sum() / len(targets))
+    assert blocked.coverage < free.coverage
+
+
+def test_state_save_and_load_round_trip(tmp_path):
+    rng = np.random.default_rng(2)
+    best = DesignScore([1.0, 0.8], 0.7, 0.2, 1.8, 0.72)
+    state = DesignState(3, [1.0, 0.8], [0.1, 0.1], best, [0.5, 0.6, 0.72], rng.bit_generator.state)
+    path = tmp_path / "state.json"
+    state.save(path)
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+    loaded = DesignState.load(path)
+    assert loaded == state
+    assert isinstance(loaded.best, DesignScore)
+    DesignState(0, [1.0], [0.1]).save(path)
+    assert DesignState.load(path).best is None
+
+
+def test_search_improves_and_stays_in_bounds():
+    targets = _targets(3, 200, radius=1.0)
+    bounds = [(0.1, 1.5), (0.1, 1.5)]
+    generations = []
+    state = optimize_design(
+        targets, bounds, DesignWeights(length=0.05), generations=6, population=24,
+        workers=1, progress=lambda state: generations.append(state.generation),
+    )
+    assert generations == [1, 2, 3, 4, 5, 6]
+    assert state.generation == 6 and len(state.history) == 6
+    best = state.best
+    assert all(low <= length <= high for length, (low, high) in zip(best.arm_lengths, bounds))
+    assert best.score == max(state.history)
+    assert best == evaluate_design(best.arm_lengths, targets, DesignWeights(length=0.05))
+    # Most targets lie within radius 1.4, which the best arm should reach
+    assert best.coverage > 0.9
+
+
+def test_interrupted_search_resumes_where_it_stopped(tmp_path):
+    targets = _targets(4, 100)
+    bounds = [(0.2, 1.5), (0.2, 1.5)]
+    options = dict(population=12, workers=1, seed=5)
+    full = optimize_design(targets, bounds, generations=4, **options)
+
+    path = tmp_path / "design.json"
+    optimize_design(targets, bounds, generations=2, state_path=path, **options)
+    assert DesignState.load(path).generation == 2
+    resumed = optimize_design(targets, bounds, generations=4, state_path=path, **options)
+    assert resumed.history == full.history
+    assert resumed.best == full.best
+    assert resumed.mean == full.mean and resumed.std == full.std
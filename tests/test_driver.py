@@ -0,0 +1,68 @@
+"""Tests for RASW.driver."""
+
+import numpy as np
+import pytest
+
+from RASW.driver import CommandStreamer, SimulatedServoController, Transport
+from RASW.driver.protocol import (
+    ACK_REJECTED,
+    decode_ack,
+    decode_command_header,
+    encode_ack,
+    encode_commands,
+)
+
+
+def test_transport_requires_read_and_write():
+    with pytest.raises(TypeError):
+        Transport()
+
+    class WriteOnly(Transport):
+        def write(self, data):
+            pass
+
+    with pytest.raises(TypeError):
+        WriteOnly()
+
+
+def test_protocol_round_trip():
+    commands = np.arange(12, dtype=float).reshape(4, 3)
+    frame = encode_commands(7, commands)
+    assert decode_command_header(frame[:11]) == (7, 4, 3)
+    assert np.array_equal(np.frombuffer(frame[11:], dtype="<f4").reshape(4, 3), commands)
+    assert decode_ack(encode_ack(9, ACK_REJECTED, 100)) == (9, ACK_REJECTED, 100)
+    with pytest.raises(ValueError):
+        decode_ack(b"XXXX" + encode_ack(0, 0, 0)[4:])
+
+
+def test_streamer_delivers_every_command_in_order():
+    commands = np.random.default_rng(0).uniform(-90, 90, size=(1000, 3))
+    with SimulatedServoController(3, buffer_size=64) as controller:
+        with CommandStreamer(controller.transport(), 3, batch_size=16, device_buffer=64) as streamer:
+            streamer.send_many(commands[:-1])
+            streamer.send(commands[-1])
+            streamer.drain(timeout=10.0)
+            assert streamer.stats.commands == 1000
+            assert streamer.stats.rejected_frames == 0
+        assert controller.executed == 1000
+        assert controller.rejected_frames == 0
+        assert np.allclose(controller.angles, commands[-1].astype(np.float32))
+
+
+def test_flow_control_waits_for_a_slow_controller():
+    commands = np.zeros((200, 2))
+    with SimulatedServoController(2, buffer_size=32, update_rate=2000.0) as controller:
+        with CommandStreamer(controller.transport(), 2, batch_size=8, device_buffer=32) as streamer:
+            streamer.send_many(commands)
+            streamer.drain(timeout=10.0)
+            assert streamer.stats.commands == 200
+        assert controller.rejected_frames == 0
+
+
+def test_joint_count_mismatch_is_rejected():
+    with SimulatedServoController(3) as controller:
+        with CommandStreamer(controller.transport(), 2, batch_size=4) as streamer:
+            streamer.send_many(np.zeros((4, 2)))
+            streamer.drain(timeout=10.0)
+            assert streamer.stats.rejected_frames == 1
+            assert streamer.stats.commands == 0
@@ -0,0 +1,80 @@
+"""Tests for RASW.dynamics."""
+
+import numpy as np
+import pytest
+
+from RASW.dynamics import STANDARD_GRAVITY as G, ArmDynamics
+from RASW.trajectory import SplineTrajectory
+
+
+def _two_link_lagrangian(model, q, qd, qdd):
+    """Closed-form 2-link torques, angles in radians."""
+    (l1, _), (m1, m2), (c1, c2), (i1, i2) = (
+        model.arm_lengths, model.masses, model.centers_of_mass, model.inertias
+    )
+    q1, q2 = q.T
+    qd1, qd2 = qd.T
+    qdd1, qdd2 = qdd.T
+    m11 = i1 + i2 + m1 * c1**2 + m2 * (l1**2 + c2**2 + 2 * l1 * c2 * np.cos(q2))
+    m12 = i2 + m2 * (c2**2 + l1 * c2 * np.cos(q2))
+    m22 = i2 + m2 * c2**2
+    h = -m2 * l1 * c2 * np.sin(q2)
+    g1 = (m1 * c1 + m2 * l1) * G * np.cos(q1) + m2 * c2 * G * np.cos(q1 + q2)
+    g2 = m2 * c2 * G * np.cos(q1 + q2)
+    tau1 = m11 * qdd1 + m12 * qdd2 + h * qd2**2 + 2 * h * qd1 * qd2 + g1
+    tau2 = m12 * qdd1 + m22 * qdd2 - h * qd1**2 + g2
+    return np.stack([tau1, tau2], axis=-1)
+
+
+def test_rejects_mismatched_parameters():
+    with pytest.raises(ValueError):
+        ArmDynamics([1.0, 1.0], [1.0])
+    with pytest.raises(ValueError):
+        ArmDynamics([1.0, 1.0], [1.0, 1.0], centers_of_mass=[0.5])
+
+
+def test_horizontal_link_with_payload():
+    model = ArmDynamics([2.0], [3.0], payload=1.5)
+    torque = model.gravity_torques([[0.0], [90.0]])
+    assert torque[:, 0] == pytest.approx([3.0 * G * 1.0 + 1.5 * G * 2.0, 0.0], abs=1e-9)
+
+
+def test_static_inverse_dynamics_is_gravity():
+    model = ArmDynamics([300.0, 200.0, 100.0], [2.0, 1.0, 0.5], payload=0.3, length_scale=1e-3)
+    angles = np.random.default_rng(0).uniform(-180, 180, size=(100, 3))
+    assert np.allclose(model.inverse_dynamics(angles), model.gravity_torques(angles))
+
+
+def test_two_link_matches_lagrangian():
+    model = ArmDynamics([0.4, 0.3], [2.0, 1.2], centers_of_mass=[0.15, 0.1], inertias=[0.03, 0.01])
+    rng = np.random.default_rng(1)
+    q = rng.uniform(-180, 180, size=(200, 2))
+    qd = rng.uniform(-200, 200, size=(200, 2))
+    qdd = rng.uniform(-500, 500, size=(200, 2))
+    torques = model.inverse_dynamics(q, qd, qdd)
+    expected = _two_link_lagrangian(model, np.radians(q), np.radians(qd), np.radians(qdd))
+    assert np.allclose(torques, expected, atol=1e-9)
+
+
+def test_spline_trajectory_feeds_inverse_dynamics():
+    model = ArmDynamics([0.4, 0.3], [2.0, 1.2])
+    samples = np.linspace(0.0, 3.0, 61)
+    waypoints = np.stack([40 * samples, 30 * np.sin(samples)], axis=-1)
+    trajectory = SplineTrajectory.fit(samples, waypoints)
+    t = np.linspace(0.0, 3.0, 301)
+    torques = model.inverse_dynamics(
+        trajectory.evaluate(t), trajectory.velocity(t), trajectory.acceleration(t)
+    )
+    expected = _two_link_lagrangian(
+        model,
+        np.radians(trajectory.evaluate(t)),
+        np.radians(trajectory.velocity(t)),
+        np.radians(trajectory.acceleration(t)),
+    )
+    assert torques.shape == (301, 2)
+    assert np.allclose(torques, expected, atol=1e-9)
+    # Between knots the spline acceleration is the derivative of its velocity
+    between = t[:-1] + 0.0025
+    step = 1e-6
+    numeric = (trajectory.velocity(between + step) - trajectory.velocity(between - step)) / (2 * step)
+    assert np.allclose(trajectory.acceleration(between), numeric, atol=1e-3)
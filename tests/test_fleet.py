@@ -0,0 +1,73 @@
+"""Tests for RASW.fleet."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk, calculate_fk_fleet, calculate_ik_fleet
+from RASW.IK.inverse_kinematics import IK_OK, IK_OUT_OF_REACH, IK_TOO_FEW_LINKS
+
+
+def _tip_error(arm_lengths, angles, targets):
+    positions, error = calculate_fk_fleet(arm_lengths, angles)
+    assert error is None
+    return np.hypot(*(positions[:, -1] - targets).T)
+
+
+def test_fk_fleet_matches_single_arm_fk():
+    arm_lengths = [[160, 160], [120, 100, 80], [200, 150, 100, 50]]
+    joint_angles = [[45, -30], [10, 20, 30], [5, -15, 25, 40]]
+    positions, error = calculate_fk_fleet(arm_lengths, joint_angles)
+    assert error is None
+    for row, (lengths, angles) in enumerate(zip(arm_lengths, joint_angles)):
+        expected, _ = calculate_fk(lengths, angles)
+        assert np.allclose(positions[row, : len(lengths) + 1], expected)
+        # Padding links repeat the end effector
+        assert np.allclose(positions[row, len(lengths) + 1 :], expected[-1])
+
+
+def test_fk_fleet_applies_base_poses():
+    bases = np.array([[100.0, 50.0, 90.0], [-20.0, 0.0, 0.0]])
+    positions, _ = calculate_fk_fleet([[100, 100], [50, 50]], [[0, 0], [0, 90]], bases=bases)
+    assert np.allclose(positions[0, -1], [100, 250])
+    assert np.allclose(positions[1, -1], [30, 50])
+
+
+def test_fk_fleet_rejects_row_mismatch():
+    positions, error = calculate_fk_fleet([[1, 1], [1, 1]], [[0, 0]])
+    assert error is not None
+
+
+def test_ik_fleet_round_trips_mixed_link_counts():
+    arm_lengths = [[160, 160], [160, 160, 160], [100, 100, 100, 100], [80, 60, 60, 40, 30]]
+    targets = np.array([[200.0, 50.0], [300.0, 100.0], [200.0, 50.0], [150.0, -100.0]])
+    angles, status = calculate_ik_fleet(targets, arm_lengths)
+    assert np.all(status == IK_OK)
+    assert _tip_error(arm_lengths, angles, targets).max() < 1e-5
+
+
+def test_ik_fleet_never_reports_unchecked_success():
+    rng = np.random.default_rng(0)
+    arm_lengths = rng.uniform(50, 150, (500, 5))
+    targets = rng.uniform(-300, 300, (500, 2))
+    angles, status = calculate_ik_fleet(targets, arm_lengths)
+    ok = status == IK_OK
+    assert ok.mean() > 0.9
+    assert _tip_error(arm_lengths[ok], angles[ok], targets[ok]).max() < 1e-5
+    assert np.isnan(angles[~ok]).all()
+
+
+def test_ik_fleet_statuses():
+    angles, status = calculate_ik_fleet([[900.0, 0.0], [1.0, 0.0]], [[100, 100, 100, 100], [1]])
+    assert list(status) == [IK_OUT_OF_REACH, IK_TOO_FEW_LINKS]
+    assert np.isnan(angles).all()
+
+
+def test_ik_fleet_rejects_target_count_mismatch():
+    with pytest.raises(ValueError):
+        calculate_ik_fleet([[1.0, 1.0]], [[1, 1], [1, 1]])
+
+
+def test_ik_fleet_empty():
+    angles, status = calculate_ik_fleet(np.empty((0, 2)), np.empty((0, 3)))
+    assert angles.shape == (0, 3)
+    assert status.shape == (0,)
@@ -0,0 +1,96 @@
+"""Tests for RASW.intercept."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch, calculate_ik_batch, intercept
+from RASW.intercept import plan_intercepts
+
+ARM = [1.0, 0.8]
+START = np.array([0.0, 90.0])
+SPEED = 90.0
+TOLERANCE = 1e-3
+
+
+def _feasible(positions, velocities, times):
+    """Exact feasibility of meeting each part at each time."""
+    targets = positions + velocities * times[:, None]
+    angles, status = calculate_ik_batch(targets, ARM)
+    travel = np.abs(angles - START).max(axis=-1) / SPEED
+    return (status == 0) & (travel <= times)
+
+
+def _plan(positions, velocities, **options):
+    return plan_intercepts(
+        positions, velocities, ARM, START, SPEED, horizon=4.0, tolerance=TOLERANCE, **options
+    )
+
+
+def _check_poses(result):
+    ok = result.feasible
+    tip, _ = calculate_fk_batch(ARM, result.joint_angles[ok])
+    assert np.allclose(tip[:, -1], result.position[ok], atol=1e-9)
+
+
+def test_stationary_parts():
+    reach, _ = calculate_fk_batch(ARM, START[None])
+    angles = np.array([[30.0, 60.0], [-45.0, 120.0], [90.0, 45.0]])
+    placed, _ = calculate_fk_batch(ARM, angles)
+    positions = np.vstack([reach[:, -1], placed[:, -1]])
+    result = _plan(positions, np.zeros((4, 2)))
+    assert result.feasible.all()
+    # A part under the tool is picked within the tolerance of now, the
+    # others once the slowest joint gets there
+    solved, _ = calculate_ik_batch(positions, ARM)
+    earliest = np.abs(solved - START).max(axis=-1) / SPEED
+    assert earliest[0] < 1e-9 and result.time[0] <= TOLERANCE
+    assert np.all(result.time >= earliest - 1e-12)
+    assert np.all(result.time <= earliest + TOLERANCE)
+    assert np.allclose(result.position, positions)
+    _check_poses(result)
+
+
+def test_moving_parts_are_met_at_the_earliest_time():
+    rng = np.random.default_rng(0)
+    positions = np.column_stack([rng.uniform(-3.0, -1.0, 40), rng.uniform(0.3, 1.2, 40)])
+    velocities = np.column_stack([rng.uniform(0.3, 0.8, 40), np.zeros(40)])
+    result = _plan(positions, velocities)
+    ok = result.feasible
+    assert ok.sum() > 20
+    assert np.allclose(result.position[ok], positions[ok] + velocities[ok] * result.time[ok, None])
+    assert _feasible(positions[ok], velocities[ok], result.time[ok]).all()
+    earlier = np.maximum(result.time[ok] - TOLERANCE, 0.0)
+    assert not _feasible(positions[ok], velocities[ok], earlier)[result.time[ok] > 0].any()
+    _check_poses(result)
+
+
+def test_unreachable_parts_are_not_feasible():
+    # Out of reach for good, and a part that leaves the workspace too soon
+    positions = [[5.0, 5.0], [1.7, 0.0]]
+    velocities = [[0.0, 0.0], [2.0, 0.0]]
+    result = _plan(positions, velocities)
+    assert not result.feasible.any()
+    assert np.isnan(result.time).all()
+    assert np.isnan(result.position).all() and np.isnan(result.joint_angles).all()
+
+
+def test_per_part_start_angles_and_chunking(monkeypatch):
+    rng = np.random.default_rng(1)
+    positions = np.column_stack([rng.uniform(-2.5, -1.0, 30), rng.uniform(0.3, 1.0, 30)])
+    velocities = np.tile([0.5, 0.0], (30, 1))
+    result = _plan(positions, velocities)
+    shared = plan_intercepts(
+        positions, velocities, ARM, np.tile(START, (30, 1)), [SPEED, SPEED], 4.0, tolerance=TOLERANCE
+    )
+    assert np.array_equal(result.time, shared.time, equal_nan=True)
+
+    monkeypatch.setattr(intercept, "MAX_BATCH_TARGETS", 100)
+    chunked = _plan(positions, velocities)
+    assert np.array_equal(result.time, chunked.time, equal_nan=True)
+    assert np.allclose(result.joint_angles, chunked.joint_angles, equal_nan=True)
+
+
+def test_no_parts():
+    result = _plan(np.empty((0, 2)), np.empty((0, 2)))
+    assert result.time.shape == (0,) and result.joint_angles.shape == (0, 2)
+    assert result.feasible.dtype == bool
@@ -0,0 +1,68 @@
+"""Tests for RASW.FK batch FK and the Jacobian helpers."""
+
+import numpy as np
+
+from RASW import (
+    calculate_fk,
+    calculate_fk_batch,
+    calculate_jacobian,
+    condition_number,
+    manipulability,
+)
+
+ARM = [160.0, 120.0, 80.0]
+
+
+def _random_angles(seed, count, joints=3):
+    return np.random.default_rng(seed).uniform(-180, 180, size=(count, joints))
+
+
+def test_fk_batch_matches_scalar_fk():
+    angles = _random_angles(0, 50)
+    positions, error = calculate_fk_batch(ARM, angles)
+    assert error is None
+    assert positions.shape == (50, 4, 2)
+    for row in range(50):
+        expected, _ = calculate_fk(ARM, angles[row].tolist())
+        assert np.allclose(positions[row], expected)
+
+
+def test_fk_batch_rejects_mismatched_lengths():
+    positions, error = calculate_fk_batch(ARM, np.zeros((4, 2)))
+    assert error is not None
+    assert positions.size == 0
+
+
+def test_fk_batch_empty_input():
+    positions, error = calculate_fk_batch(ARM, np.empty((0, 3)))
+    assert error is None
+    assert positions.shape == (0, 4, 2)
+
+
+def test_jacobian_matches_finite_differences():
+    angles = _random_angles(1, 20)
+    jacobian, error = calculate_jacobian(ARM, angles)
+    assert error is None
+    assert jacobian.shape == (20, 2, 3)
+    step = 1e-6
+    for joint in range(3):
+        offset = np.zeros(3)
+        offset[joint] = np.degrees(step)
+        ahead, _ = calculate_fk_batch(ARM, angles + offset)
+        behind, _ = calculate_fk_batch(ARM, angles - offset)
+        numeric = (ahead[:, -1] - behind[:, -1]) / (2 * step)
+        assert np.allclose(jacobian[:, :, joint], numeric, atol=1e-4)
+
+
+def test_two_link_manipulability_is_l1_l2_sin_elbow():
+    elbow = np.linspace(-180, 180, 37)
+    angles = np.stack([np.full_like(elbow, 30.0), elbow], axis=-1)
+    jacobian, _ = calculate_jacobian([2.0, 3.0], angles)
+    assert np.allclose(manipulability(jacobian), 6.0 * np.abs(np.sin(np.radians(elbow))))
+
+
+def test_condition_number_is_infinite_when_straight():
+    jacobian, _ = calculate_jacobian([1.0, 1.0], [[0.0, 0.0], [0.0, 90.0]])
+    conditions = condition_number(jacobian)
+    assert conditions[0] > 1e12
+    assert np.isfinite(conditions[1]) and conditions[1] >= 1.0
@@ -0,0 +1,71 @@
+"""Tests for RASW.IK.lookup."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch, calculate_ik_batch, solve_ik
+from RASW.IK import IKLookupTable
+
+ARM = [1.0, 0.8]
+
+
+@pytest.fixture(scope="module")
+def table():
+    return IKLookupTable.build(ARM, resolution=0.05)
+
+
+def _targets(seed, count):
+    return np.random.default_rng(seed).uniform(-2.0, 2.0, size=(count, 2))
+
+
+def test_served_solutions_meet_the_certified_bound(table):
+    # The reachable annulus covers pi (1.8^2 - 0.2^2) / 3.6^2 = 0.78 of the grid
+    assert 0.65 < table.coverage < 0.78
+    assert table.certified_error <= table.tolerance
+    targets = _targets(0, 20000)
+    angles, status = table.solve(targets)
+    exact_angles, exact_status = calculate_ik_batch(targets, ARM)
+    assert np.array_equal(status, exact_status)
+    ok = status == 0
+    positions, _ = calculate_fk_batch(ARM, angles[ok])
+    error = np.hypot(*(positions[:, -1] - targets[ok]).T)
+    assert error.max() <= table.certified_error + 1e-12
+    assert np.isnan(angles[~ok]).all()
+
+
+def test_targets_outside_the_grid_fall_back(table):
+    targets = np.array([[5.0, 0.0], [-1.8, -1.8 - 1e-9], [0.0, 0.0]])
+    angles, status = table.solve(targets)
+    exact_angles, exact_status = calculate_ik_batch(targets, ARM)
+    assert np.array_equal(status, exact_status)
+    assert np.allclose(angles, exact_angles, equal_nan=True)
+    angles, status = table.solve(np.empty((0, 2)))
+    assert angles.shape == (0, 2) and status.shape == (0,)
+
+
+def test_other_arm_uses_exact_solver(table):
+    targets = _targets(1, 100)
+    angles, status = table.solve(targets, [1.0, 0.5])
+    expected_angles, expected_status = calculate_ik_batch(targets, [1.0, 0.5])
+    assert np.array_equal(status, expected_status)
+    assert np.allclose(angles, expected_angles, equal_nan=True)
+
+
+def test_build_to_path_and_load(tmp_path, table):
+    path = tmp_path / "table.npy"
+    built = IKLookupTable.build(ARM, resolution=0.05, path=path)
+    assert path.with_suffix(".json").exists()
+    loaded = IKLookupTable.load(path)
+    assert isinstance(loaded.table, np.memmap)
+    assert loaded.matches(ARM) and loaded.tolerance == table.tolerance
+    assert np.array_equal(np.asarray(loaded.table), table.table, equal_nan=True)
+    targets = _targets(2, 500)
+    assert np.array_equal(loaded.solve(targets)[0], built.solve(targets)[0], equal_nan=True)
+
+
+def test_register_serves_solve_ik(table, clean_registry):
+    table.register()
+    targets = _targets(3, 50)
+    angles, status, name = solve_ik(targets, ARM)
+    assert name == "lookup-table"
+    assert np.array_equal(status, calculate_ik_batch(targets, ARM)[1])
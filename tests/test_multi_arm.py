@@ -0,0 +1,133 @@
+"""Tests for RASW.collision.multi_arm and FK base poses."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk, calculate_fk_batch
+from RASW.collision import ArmModel, check_arm_collisions, segment_distance
+from RASW.fleet import calculate_fk_fleet
+
+ARMS = [
+    ArmModel([100.0, 80.0], base=(0.0, 0.0, 0.0), radius=5.0),
+    ArmModel([90.0, 70.0, 40.0], base=(150.0, 0.0, 180.0), radius=8.0),
+    ArmModel([120.0], base=(75.0, 140.0, -90.0), radius=3.0),
+]
+
+
+def _dense_distance(a0, a1, b0, b1, samples=401):
+    s = np.linspace(0.0, 1.0, samples)[:, None]
+    a = a0 + s * (a1 - a0)
+    b = b0 + s * (b1 - b0)
+    return np.linalg.norm(a[:, None] - b[None], axis=-1).min()
+
+
+def test_segment_distance_matches_dense_sampling():
+    rng = np.random.default_rng(0)
+    segments = rng.uniform(-10, 10, size=(80, 4, 2))
+    # Crossing, touching, collinear, parallel and point segments
+    special = np.array([
+        [[-1, 0], [1, 0], [0, -1], [0, 1]],
+        [[0, 0], [2, 0], [2, 0], [3, 5]],
+        [[0, 0], [1, 0], [3, 0], [5, 0]],
+        [[0, 0], [4, 0], [1, 2], [3, 2]],
+        [[0, 0], [4, 0], [2, 3], [2, 3]],
+        [[1, 1], [1, 1], [4, 5], [4, 5]],
+    ], dtype=float)
+    segments = np.concatenate([segments, special])
+    distance = segment_distance(*segments.transpose(1, 0, 2))
+    dense = np.array([_dense_distance(*segment) for segment in segments])
+    assert np.all(distance <= dense + 1e-9)
+    assert np.allclose(distance, dense, atol=0.1)
+    assert distance[-6:] == pytest.approx([0.0, 0.0, 2.0, 2.0, 3.0, 5.0])
+    # Symmetric in the two segments and in each segment's direction
+    a0, a1, b0, b1 = segments.transpose(1, 0, 2)
+    assert np.allclose(segment_distance(b0, b1, a0, a1), distance)
+    assert np.allclose(segment_distance(a1, a0, b1, b0), distance)
+
+
+def test_base_pose_rotates_and_translates_fk():
+    rng = np.random.default_rng(1)
+    lengths = [100.0, 80.0, 60.0]
+    angles = rng.uniform(-180, 180, size=(50, 3))
+    bases = np.column_stack([rng.uniform(-500, 500, size=(50, 2)), rng.uniform(-180, 180, 50)])
+    local, _ = calculate_fk_batch(lengths, angles)
+    theta = np.radians(bases[:, 2])
+    rotation = np.stack([
+        np.stack([np.cos(theta), -np.sin(theta)], axis=-1),
+        np.stack([np.sin(theta), np.cos(theta)], axis=-1),
+    ], axis=-2)
+    expected = local @ np.swapaxes(rotation, -1, -2) + bases[:, None, :2]
+
+    placed, error = calculate_fk_batch(lengths, angles, base=bases)
+    assert error is None
+    assert np.allclose(placed, expected)
+    for row in range(5):
+        single, error = calculate_fk(lengths, angles[row].tolist(), base=tuple(bases[row]))
+        assert error is None and np.allclose(single, expected[row])
+    fleet, error = calculate_fk_fleet(np.tile(lengths, (50, 1)), angles, bases=bases)
+    assert error is None and np.allclose(fleet, expected)
+    # One shared base broadcasts over every pose
+    shared, _ = calculate_fk_batch(lengths, angles[:3], base=bases[0])
+    assert np.allclose(shared[0], expected[0])
+
+
+def _brute_force(arms, joint_angles, margin):
+    contacts = []
+    for step in range(joint_angles[0].shape[0]):
+        links = []
+        for arm, angles in zip(arms, joint_angles):
+            positions, _ = calculate_fk(list(arm.arm_lengths), angles[step].tolist(), base=arm.base)
+            links.append(np.asarray(positions))
+        for i, j in itertools.combinations(range(len(arms)), 2):
+            for a, b in itertools.product(range(len(links[i]) - 1), range(len(links[j]) - 1)):
+                distance = segment_distance(
+                    links[i][a], links[i][a + 1], links[j][b], links[j][b + 1]
+                ) - arms[i].radius - arms[j].radius
+                if distance < margin:
+                    contacts.append((step, i, a, j, b, float(distance)))
+    return contacts
+
+
+def _as_tuples(contacts):
+    return sorted(zip(*(column.tolist() for column in contacts)))
+
+
+@pytest.mark.parametrize("cell_size", [None, 1.0, 1000.0])
+def test_contacts_match_brute_force(cell_size):
+    rng = np.random.default_rng(2)
+    joint_angles = [
+        np.cumsum(rng.uniform(-15, 15, size=(40, len(arm.arm_lengths))), axis=0) for arm in ARMS
+    ]
+    margin = 10.0
+    contacts = check_arm_collisions(ARMS, joint_angles, margin=margin, cell_size=cell_size)
+    expected = _brute_force(ARMS, joint_angles, margin)
+    assert len(expected) > 0
+    found = _as_tuples(contacts)
+    assert [row[:5] for row in found] == [row[:5] for row in sorted(expected)]
+    assert np.allclose([row[5] for row in found], [row[5] for row in sorted(expected)])
+    assert np.all(np.diff(contacts.timestep) >= 0)
+    assert np.all(contacts.arm_a < contacts.arm_b)
+
+
+def test_single_timestep_and_no_contacts():
+    apart = [ArmModel([50.0, 50.0]), ArmModel([50.0, 50.0], base=(1000.0, 0.0, 0.0))]
+    contacts = check_arm_collisions(apart, [[0.0, 0.0], [180.0, 0.0]])
+    assert all(column.size == 0 for column in contacts)
+    # Facing each other the tips overlap at a single timestep
+    facing = [
+        ArmModel([50.0, 50.0], radius=2.0),
+        ArmModel([50.0, 50.0], base=(195.0, 0.0, 0.0), radius=2.0),
+    ]
+    contacts = check_arm_collisions(facing, [[0.0, 0.0], [180.0, 0.0]])
+    assert contacts.timestep.tolist() == [0]
+    assert (contacts.link_a[0], contacts.link_b[0]) == (1, 1)
+    assert contacts.distance[0] == pytest.approx(-4.0)
+
+
+def test_rejects_mismatched_arms_and_timesteps():
+    with pytest.raises(ValueError):
+        check_arm_collisions(ARMS, [np.zeros(2), np.zeros(3)])
+    with pytest.raises(ValueError):
+        check_arm_collisions(ARMS, [np.zeros((4, 2)), np.zeros((4, 3)), np.zeros((5, 1))])
@@ -0,0 +1,80 @@
+"""Tests for RASW.pool."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from RASW import SolverPool, calculate_fk_batch, calculate_ik_batch
+
+ARM = [160.0, 120.0, 80.0]
+
+
+def _targets(seed, count):
+    rng = np.random.default_rng(seed)
+    radius = rng.uniform(60, 340, count)
+    angle = rng.uniform(-np.pi, np.pi, count)
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=-1)
+
+
+def test_map_ik_matches_single_batch():
+    targets = _targets(0, 5000)
+    with SolverPool(max_workers=4) as pool:
+        angles, status = pool.map_ik(targets, ARM, chunk_size=700)
+    expected_angles, expected_status = calculate_ik_batch(targets, ARM)
+    assert np.array_equal(status, expected_status)
+    assert np.allclose(angles, expected_angles, equal_nan=True)
+
+
+def test_submit_fk_round_trips_ik():
+    targets = _targets(1, 1000)
+    with SolverPool(max_workers=2) as pool:
+        angles, status = pool.submit_ik(targets, ARM).result()
+        positions, error = pool.submit_fk(ARM, angles[status == 0]).result()
+    assert error is None
+    assert np.abs(positions[:, -1] - targets[status == 0]).max() < 1e-6
+
+
+def test_shared_pool_from_many_threads():
+    results = {}
+    errors = []
+
+    def client(seed):
+        try:
+            targets = _targets(seed, 500)
+            for _ in range(5):
+                angles, status = pool.submit_ik(targets, ARM).result()
+            results[seed] = (targets, angles, status)
+        except BaseException as exc:
+            errors.append(exc)
+
+    with SolverPool(max_workers=4, max_pending=3) as pool:
+        threads = [threading.Thread(target=client, args=(seed,)) for seed in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert not errors
+    for targets, angles, status in results.values():
+        positions, _ = calculate_fk_batch(ARM, angles[status == 0])
+        assert np.abs(positions[:, -1] - targets[status == 0]).max() < 1e-6
+    assert len(results) == 16
+
+
+def test_full_queue_times_out():
+    release = threading.Event()
+    with SolverPool(max_workers=1, max_pending=1) as pool:
+        blocker = pool._submit(release.wait)
+        with pytest.raises(TimeoutError):
+            pool.submit_ik(_targets(2, 10), ARM, timeout=0.05)
+        release.set()
+        blocker.result()
+
+
+def test_submit_after_shutdown_raises():
+    pool = SolverPool(max_workers=1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit_ik(_targets(3, 10), ARM)
+    # The rejected submission gave its slot back
+    assert all(pool._slots.acquire(blocking=False) for _ in range(pool.max_pending))
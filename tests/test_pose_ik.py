@@ -0,0 +1,74 @@
+"""Tests for RASW.IK.pose."""
+
+import numpy as np
+import pytest
+
+from RASW import (
+    calculate_fk_batch,
+    calculate_pose_ik,
+    calculate_pose_ik_batch,
+    find_feasible_orientation,
+)
+from RASW.IK.inverse_kinematics import IK_OK, IK_OUT_OF_REACH, IK_TOO_FEW_LINKS
+
+ARM = [160.0, 120.0, 80.0]
+
+
+def _wrap(angles):
+    return (np.asarray(angles) + 180.0) % 360.0 - 180.0
+
+
+@pytest.mark.parametrize("elbow_up", [True, False])
+def test_batch_reaches_position_and_orientation(elbow_up):
+    rng = np.random.default_rng(0)
+    targets = rng.uniform(-360, 360, size=(3000, 2))
+    phi = rng.uniform(-180, 180, 3000)
+    angles, status = calculate_pose_ik_batch(targets, phi, ARM, elbow_up)
+    ok = status == IK_OK
+    assert ok.sum() > 500
+    assert np.isnan(angles[~ok]).all()
+    positions, _ = calculate_fk_batch(ARM, angles[ok])
+    assert np.abs(positions[:, -1] - targets[ok]).max() < 1e-9
+    assert np.abs(_wrap(angles[ok].sum(axis=1) - phi[ok])).max() < 1e-9
+
+
+def test_scalar_matches_batch_across_the_seam():
+    for phi in (179.999, -179.999, 180.0):
+        angles, error = calculate_pose_ik(-250.0, 1e-9, phi, ARM)
+        batch, status = calculate_pose_ik_batch([[-250.0, 1e-9]], phi, ARM)
+        assert error is None and status[0] == IK_OK
+        assert np.allclose(angles, batch[0])
+        assert abs(_wrap(sum(angles) - phi)) < 1e-9
+
+
+def test_unreachable_pose_and_wrong_link_count():
+    angles, error = calculate_pose_ik(400.0, 0.0, 0.0, ARM)
+    assert angles is None and error is not None
+    _, status = calculate_pose_ik_batch([[400.0, 0.0]], 0.0, ARM)
+    assert status[0] == IK_OUT_OF_REACH
+    _, status = calculate_pose_ik_batch([[100.0, 0.0]], 0.0, [1.0, 1.0])
+    assert status[0] == IK_TOO_FEW_LINKS
+    assert calculate_pose_ik(100.0, 0.0, 0.0, [1.0, 1.0])[0] is None
+
+
+def test_feasible_orientation_prefers_closest_angle():
+    targets = np.array([[250.0, 0.0], [0.0, -200.0], [500.0, 0.0]])
+    angles, phi, status = find_feasible_orientation(targets, ARM, preferred=[0.0, -90.0, 0.0])
+    assert list(status[:2]) == [IK_OK, IK_OK]
+    assert phi[:2] == pytest.approx([0.0, -90.0])
+    assert status[2] == IK_OUT_OF_REACH and np.isnan(phi[2])
+    positions, _ = calculate_fk_batch(ARM, angles[:2])
+    assert np.abs(positions[:, -1] - targets[:2]).max() < 1e-9
+
+
+def test_feasible_orientation_falls_back_when_preferred_fails():
+    # Pointing the tool back at the base puts the wrist out of reach
+    targets = np.array([[355.0, 0.0]])
+    _, preferred_status = calculate_pose_ik_batch(targets, 180.0, ARM)
+    assert preferred_status[0] == IK_OUT_OF_REACH
+    angles, phi, status = find_feasible_orientation(targets, ARM, preferred=180.0)
+    assert status[0] == IK_OK
+    assert abs(_wrap(phi[0])) < 90.0
+    positions, _ = calculate_fk_batch(ARM, angles)
+    assert np.abs(positions[0, -1] - targets[0]).max() < 1e-9
+    assert abs(_wrap(angles[0].sum() - phi[0])) < 1e-9
@@ -0,0 +1,46 @@
+"""Tests for RASW.FK.quantized."""
+
+import numpy as np
+import pytest
+
+from RASW import QuantizedFK, calculate_fk_batch
+
+ARM = [160.0, 120.0, 80.0]
+
+
+@pytest.mark.parametrize("resolution", [0, -1.0, 0.7, float("nan")])
+def test_rejects_bad_resolution(resolution):
+    with pytest.raises(ValueError):
+        QuantizedFK(resolution)
+
+
+def test_on_grid_angles_match_exact_fk():
+    fk = QuantizedFK(0.5)
+    angles = np.random.default_rng(0).integers(-720, 720, size=(200, 3)) * 0.5
+    positions, error = fk.calculate_fk(ARM, angles)
+    expected, _ = calculate_fk_batch(ARM, angles)
+    assert error is None
+    assert np.allclose(positions, expected, atol=1e-9)
+
+
+def test_off_grid_error_within_bound():
+    fk = QuantizedFK(1.0)
+    angles = np.random.default_rng(1).uniform(-180, 180, size=(5000, 3))
+    positions, _ = fk.calculate_fk(ARM, angles)
+    expected, _ = calculate_fk_batch(ARM, angles)
+    error = np.hypot(*(positions[:, -1] - expected[:, -1]).T)
+    assert error.max() <= fk.error_bound(ARM)
+
+
+def test_negative_and_wrapped_steps():
+    fk = QuantizedFK(1.0)
+    wrapped, _ = fk.calculate_fk_steps(ARM, [[-90, 450, -720]])
+    plain, _ = fk.calculate_fk_steps(ARM, [[270, 90, 0]])
+    assert np.allclose(wrapped, plain)
+    assert np.allclose(fk.rotate_vector(np.array([1.0, 0.0]), -90), [0.0, -1.0])
+
+
+def test_mismatched_lengths_report_error():
+    positions, error = QuantizedFK().calculate_fk(ARM, [[0.0, 0.0]])
+    assert error is not None
+    assert positions.size == 0
@@ -0,0 +1,105 @@
+"""Tests for the IK solver registry."""
+
+import numpy as np
+import pytest
+
+from RASW import IK_NO_SOLVER, calculate_fk_batch, solve_ik
+from RASW.IK import SolverSpec, list_solvers, register_solver, select_solver
+from RASW.IK import registry
+from RASW.IK.inverse_kinematics import IK_OK, IK_TOO_FEW_LINKS
+
+
+@pytest.mark.parametrize(
+    "links, phi, limits, expected",
+    [
+        (2, None, False, "analytic-2link"),
+        (3, None, False, "heuristic-3link"),
+        (3, 30.0, False, "analytic-pose-3link"),
+        (4, None, False, "numeric-dls"),
+        (3, None, True, "numeric-dls"),
+    ],
+)
+def test_selection_by_topology(links, phi, limits, expected):
+    arm_lengths = [100.0] * links
+    joint_limits = np.tile([-170.0, 170.0], (links, 1)) if limits else None
+    targets = np.array([[150.0, 60.0], [120.0, -40.0]])
+    angles, status, name = solve_ik(targets, arm_lengths, phi=phi, joint_limits=joint_limits)
+    assert name == expected
+    assert np.all(status == IK_OK)
+    positions, _ = calculate_fk_batch(arm_lengths, np.nan_to_num(angles))
+    assert np.abs(positions[:, -1] - targets).max() < 1e-5
+
+
+def test_no_solver_for_pose_target_on_four_links():
+    angles, status, name = solve_ik([[150.0, 60.0]], [100.0] * 4, phi=0.0)
+    assert name is None
+    assert np.all(status == IK_NO_SOLVER) and np.isnan(angles).all()
+
+
+def test_too_few_links_keeps_its_status():
+    _, status, name = solve_ik([[1.0, 0.0]], [1.0])
+    assert name is None and np.all(status == IK_TOO_FEW_LINKS)
+
+
+@pytest.mark.parametrize(
+    "solver, arm_lengths, phi, limits",
+    [
+        ("no-such-solver", [100.0, 100.0], None, False),
+        ("analytic-2link", [100.0, 100.0, 100.0], None, False),
+        ("analytic-pose-3link", [100.0, 100.0, 100.0], None, False),
+        ("heuristic-3link", [100.0, 100.0, 100.0], None, True),
+    ],
+)
+def test_forced_solver_must_fit_the_arm(solver, arm_lengths, phi, limits):
+    joint_limits = np.tile([-170.0, 170.0], (len(arm_lengths), 1)) if limits else None
+    _, status, name = solve_ik(
+        [[150.0, 60.0]], arm_lengths, phi=phi, joint_limits=joint_limits, solver=solver
+    )
+    assert name is None and np.all(status == IK_NO_SOLVER)
+
+
+def test_forced_solver_that_fits_is_used():
+    _, status, name = solve_ik([[150.0, 60.0]], [100.0] * 3, solver="numeric-dls")
+    assert name == "numeric-dls" and np.all(status == IK_OK)
+
+
+def test_registered_solver_wins_by_priority(clean_registry):
+    calls = []
+
+    def solver(targets, arm_lengths):
+        calls.append(len(targets))
+        return np.zeros((len(targets), len(arm_lengths))), np.zeros(len(targets), dtype=np.int8)
+
+    register_solver(SolverSpec("fast-4link", lambda: solver, min_links=4, max_links=4, priority=1))
+    assert select_solver(4).name == "fast-4link"
+    assert select_solver(5).name == "numeric-dls"
+    _, _, name = solve_ik(np.zeros((3, 2)), [1.0] * 4)
+    assert name == "fast-4link" and calls == [3]
+    assert [spec.priority for spec in list_solvers()] == sorted(spec.priority for spec in list_solvers())
+
+
+def test_failing_plugin_is_skipped_with_a_warning(monkeypatch, clean_registry):
+    class EntryPoint:
+        def __init__(self, name, load):
+            self.name, self.load = name, load
+
+    def broken():
+        raise ImportError("missing dependency")
+
+    def working():
+        return SolverSpec("plugin-5link", "RASW.IK.numeric:calculate_ik_numeric_batch", 5, 5, priority=1)
+
+    class Found(list):
+        def select(self, group):
+            return self
+
+    import importlib.metadata
+
+    monkeypatch.setattr(
+        importlib.metadata, "entry_points", lambda: Found([EntryPoint("bad", broken), EntryPoint("good", working)])
+    )
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+    with pytest.warns(RuntimeWarning, match="bad"):
+        spec = select_solver(5)
+    assert spec.name == "plugin-5link"
+    assert registry._entry_points_loaded
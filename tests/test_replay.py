@@ -0,0 +1,80 @@
+"""Tests for RASW.replay."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch
+from RASW.replay import replay_logs
+
+ARM = [1.0, 0.5]
+WORKSPACE = (-2.0, 0.0, 2.0, 2.0)
+
+
+def _log(seed, samples):
+    t = np.arange(samples) * 0.01
+    angles = np.cumsum(np.random.default_rng(seed).normal(0, 3, size=(samples, 2)), axis=0)
+    return np.column_stack([t, angles])
+
+
+def _expected(rows):
+    positions, _ = calculate_fk_batch(ARM, rows[:, 1:])
+    tip = positions[:, -1]
+    step = np.hypot(*np.diff(tip, axis=0).T)
+    outside = tip[:, 1] < 0.0
+    entered = outside & ~np.concatenate([[False], outside[:-1]])
+    return tip, step.sum(), (step / 0.01).max(), int(outside.sum()), int(entered.sum())
+
+
+def test_sharded_npy_matches_direct_fk(tmp_path):
+    rows = _log(0, 1000)
+    np.save(tmp_path / "run.npy", rows)
+    report = replay_logs(
+        [tmp_path / "run.npy"], ARM, tmp_path / "out", WORKSPACE,
+        workers=2, shard_rows=137, chunk_size=50,
+    )
+    tip, length, speed, outside, excursions = _expected(rows)
+    (log, output, metrics), = report.logs
+    path = np.load(output)
+    assert np.allclose(path[:, 0], rows[:, 0])
+    assert np.allclose(path[:, 1:], tip)
+    assert metrics.samples == 1000 == report.samples
+    assert metrics.path_length == pytest.approx(length)
+    assert metrics.max_speed == pytest.approx(speed)
+    assert metrics.excursion_samples == outside
+    assert metrics.excursions == excursions
+    assert "Replayed 1000 samples" in report.format()
+
+
+def test_csv_log_with_header(tmp_path):
+    rows = _log(1, 300)
+    with open(tmp_path / "run.csv", "w") as handle:
+        handle.write("t,q1,q2\n")
+        np.savetxt(handle, rows, delimiter=",")
+    report = replay_logs([tmp_path / "run.csv"], ARM, tmp_path, WORKSPACE, workers=1, chunk_size=64)
+    tip, length, _, _, excursions = _expected(rows)
+    (_, output, metrics), = report.logs
+    path = np.loadtxt(output, delimiter=",", skiprows=1)
+    assert np.allclose(path[:, 1:], tip, atol=1e-8)
+    assert metrics.samples == 300
+    assert metrics.path_length == pytest.approx(length, rel=1e-6)
+    assert metrics.excursions == excursions
+
+
+def test_logs_with_the_same_name_get_separate_outputs(tmp_path):
+    for folder, seed in (("a", 2), ("b", 3)):
+        (tmp_path / folder).mkdir()
+        np.save(tmp_path / folder / "run.npy", _log(seed, 20))
+    report = replay_logs(
+        [tmp_path / "a" / "run.npy", tmp_path / "b" / "run.npy"], ARM, tmp_path / "out", workers=1
+    )
+    outputs = [output for _, output, _ in report.logs]
+    assert outputs[0].endswith("run.tip.npy") and outputs[1].endswith("run-2.tip.npy")
+    assert not np.allclose(np.load(outputs[0]), np.load(outputs[1]))
+
+
+def test_rejects_bad_logs(tmp_path):
+    np.save(tmp_path / "wide.npy", np.zeros((5, 4)))
+    with pytest.raises(ValueError):
+        replay_logs([tmp_path / "wide.npy"], ARM, tmp_path / "out", workers=1)
+    with pytest.raises(ValueError):
+        replay_logs([tmp_path / "log.txt"], ARM, tmp_path / "out", workers=1)
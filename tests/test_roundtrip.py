@@ -0,0 +1,60 @@
+"""Tests for RASW.roundtrip and the IK quadrant fixes it found."""
+
+import math
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk, calculate_ik
+from RASW.roundtrip import MISSED_TARGET, run_roundtrip, sample_workspace
+
+# Target bearings in degrees: every quadrant plus both sides of the seam
+BEARINGS = [30.0, 150.0, -150.0, -30.0, 90.0, -90.0, 180.0 - 1e-9, -180.0 + 1e-9]
+
+
+def _tip_error(arm, bearing, radius):
+    x = radius * math.cos(math.radians(bearing))
+    y = radius * math.sin(math.radians(bearing))
+    angles, error = calculate_ik(x, y, arm)
+    assert error is None
+    positions, _ = calculate_fk(arm, angles)
+    return math.hypot(positions[-1][0] - x, positions[-1][1] - y)
+
+
+@pytest.mark.parametrize("bearing", BEARINGS)
+def test_two_link_reaches_every_quadrant(bearing):
+    assert _tip_error([160.0, 120.0], bearing, 180.0) < 1e-9
+
+
+@pytest.mark.parametrize("bearing", BEARINGS)
+def test_three_link_reaches_every_quadrant(bearing):
+    assert _tip_error([160.0, 120.0, 80.0], bearing, 250.0) < 1e-9
+
+
+def test_two_link_elbow_is_zero_when_straight():
+    angles, error = calculate_ik(280.0, 0.0, [160.0, 120.0])
+    assert error is None
+    assert angles == pytest.approx([0.0, 0.0], abs=1e-6)
+
+
+def test_sample_workspace_stays_in_annulus():
+    targets = sample_workspace([100.0, 30.0], 10000, np.random.default_rng(0))
+    radius = np.hypot(targets[:, 0], targets[:, 1])
+    assert radius.min() >= 70.0 - 1e-9 and radius.max() <= 130.0 + 1e-9
+
+
+def test_two_link_roundtrip_reaches_everything():
+    report = run_roundtrip([160.0, 120.0], samples=20000, chunk_size=4096)
+    assert report.samples == 20000
+    assert report.reached == report.solved == 20000
+    assert not report.failures
+    assert report.error_max < 1e-9
+    assert report.error_percentile(99) <= report.error_max
+    assert "Reached within" in report.format()
+
+
+def test_roundtrip_reports_failures_by_reason():
+    report = run_roundtrip([160.0, 120.0, 80.0], samples=5000, chunk_size=1000)
+    assert report.reached + sum(report.failures.values()) == report.samples
+    assert MISSED_TARGET not in report.failures
+    assert report.error_max < 1e-6
@@ -0,0 +1,55 @@
+"""Tests for RASW.collision.sdf."""
+
+import numpy as np
+import pytest
+
+from RASW.collision import Box, Circle, SignedDistanceField
+
+OBSTACLES = [Circle(50.0, 50.0, 10.0), Box(-40.0, -40.0, -20.0, -10.0)]
+BOUNDS = (-100.0, -100.0, 100.0, 100.0)
+
+
+def _exact(points):
+    return np.minimum(*(obstacle.signed_distance(points) for obstacle in OBSTACLES))
+
+
+def test_lookup_within_interpolation_error():
+    field = SignedDistanceField.bake(OBSTACLES, BOUNDS, 2.0)
+    points = np.random.default_rng(0).uniform(-100, 100, size=(5000, 2))
+    error = np.abs(field.distance(points) - _exact(points))
+    assert error.max() <= field.max_interpolation_error + 1e-9
+
+
+def test_lookup_outside_grid_never_overestimates():
+    field = SignedDistanceField.bake(OBSTACLES, BOUNDS, 2.0)
+    points = np.array([[300.0, 0.0], [-250.0, 180.0], [0.0, -400.0]])
+    assert np.all(field.distance(points) <= _exact(points) + field.max_interpolation_error)
+
+
+def test_inside_obstacle_is_negative():
+    field = SignedDistanceField.bake(OBSTACLES, BOUNDS, 1.0)
+    assert field.distance(np.array([50.0, 50.0])) < -9.0
+
+
+def test_bake_rejects_empty_obstacle_list():
+    with pytest.raises(ValueError):
+        SignedDistanceField.bake([], BOUNDS, 2.0)
+
+
+def test_cached_round_trip_leaves_no_temporary_files(tmp_path):
+    baked = SignedDistanceField.cached(OBSTACLES, BOUNDS, 4.0, cache_dir=tmp_path)
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1 and files[0].suffix == ".npz"
+    loaded = SignedDistanceField.cached(OBSTACLES, BOUNDS, 4.0, cache_dir=tmp_path)
+    assert np.array_equal(loaded.values, baked.values)
+    assert loaded.origin == baked.origin and loaded.resolution == baked.resolution
+
+
+def test_cached_removes_temporary_file_on_failure(tmp_path, monkeypatch):
+    def fail(self, file):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(SignedDistanceField, "save", fail)
+    with pytest.raises(OSError):
+        SignedDistanceField.cached(OBSTACLES, BOUNDS, 4.0, cache_dir=tmp_path)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,69 @@
+"""Tests for RASW.sequencing."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from RASW.sequencing import MAX_DELTA, TIME, joint_travel_cost, plan_pick_sequence
+
+ARM = [160.0, 120.0]
+START = [0.0, 90.0]
+
+
+def _targets(seed, count):
+    rng = np.random.default_rng(seed)
+    radius = rng.uniform(80, 270, count)
+    angle = rng.uniform(-np.pi, np.pi, count)
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle)], axis=-1)
+
+
+def _path_cost(angles, cost=MAX_DELTA, joint_speeds=None):
+    poses = np.vstack([START, angles])
+    return sum(
+        joint_travel_cost(poses[i : i + 1], poses[i + 1 : i + 2], cost, joint_speeds)[0, 0]
+        for i in range(len(angles))
+    )
+
+
+def test_travel_cost_modes():
+    a = np.array([[0.0, 0.0]])
+    b = np.array([[30.0, -90.0]])
+    assert joint_travel_cost(a, b)[0, 0] == 90.0
+    assert joint_travel_cost(a, b, TIME, [10.0, 90.0])[0, 0] == 3.0
+    with pytest.raises(ValueError):
+        joint_travel_cost(a, b, TIME)
+    with pytest.raises(ValueError):
+        joint_travel_cost(a, b, "distance")
+
+
+def test_order_is_a_permutation_with_consistent_cost():
+    targets = _targets(0, 60)
+    plan = plan_pick_sequence(targets, ARM, START)
+    assert sorted(plan.order.tolist()) == list(range(60))
+    assert plan.unreachable.size == 0
+    assert plan.cost == pytest.approx(_path_cost(plan.joint_angles))
+    # Much better than visiting the targets in the given order
+    assert plan.cost < 0.5 * _path_cost(plan.joint_angles[np.argsort(plan.order)])
+
+
+def test_small_instance_matches_brute_force():
+    targets = _targets(1, 7)
+    plan = plan_pick_sequence(targets, ARM, START, cost=TIME, joint_speeds=[60.0, 120.0])
+    best = min(
+        _path_cost(plan.joint_angles[np.argsort(plan.order)][list(order)], TIME, [60.0, 120.0])
+        for order in itertools.permutations(range(7))
+    )
+    assert plan.cost == pytest.approx(best)
+
+
+def test_unreachable_targets_are_left_out():
+    targets = np.vstack([_targets(2, 5), [[1000.0, 0.0]], [[0.0, 0.0]]])
+    plan = plan_pick_sequence(targets, ARM, START)
+    assert sorted(plan.unreachable.tolist()) == [5, 6]
+    assert sorted(plan.order.tolist()) == list(range(5))
+
+
+def test_empty_input():
+    plan = plan_pick_sequence(np.empty((0, 2)), ARM, START)
+    assert plan.order.size == 0 and plan.cost == 0.0
@@ -0,0 +1,111 @@
+"""Tests for RASW.shm_bus."""
+
+import multiprocessing
+import os
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk
+from RASW.shm_bus import JointStateBus
+
+ARM = [160.0, 120.0, 80.0]
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _attach_and_read(name, results):
+    reader = JointStateBus.attach(name)
+    sequence, _, angles, _ = reader.read()
+    reader.close()
+    results.put((sequence, angles.tolist()))
+
+
+def _exists(name):
+    try:
+        shared_memory.SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def test_read_returns_published_state_and_fk():
+    with JointStateBus.create(ARM, slots=4) as bus:
+        reader = JointStateBus.attach(bus.name)
+        sequence, _, angles, positions = reader.read()
+        assert sequence == -1
+        for step in range(6):
+            bus.publish(np.array([10.0, -20.0, 30.0]) + step)
+        sequence, timestamp, angles, positions = reader.read()
+        reader.close()
+    expected, _ = calculate_fk(ARM, [15.0, -15.0, 35.0])
+    assert sequence == 5
+    assert np.allclose(angles, [15.0, -15.0, 35.0])
+    assert np.allclose(positions, expected)
+
+
+def test_overwritten_view_is_invalid():
+    with JointStateBus.create(ARM, slots=2) as bus:
+        bus.publish(np.zeros(3))
+        sequence = bus.view()[0]
+        assert bus.is_valid(sequence)
+        bus.publish(np.ones(3))
+        bus.publish(np.ones(3))
+        assert not bus.is_valid(sequence)
+
+
+def test_attach_rejects_foreign_segment():
+    memory = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            JointStateBus.attach(memory.name)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_owner_close_unlinks():
+    bus = JointStateBus.create(ARM)
+    name = bus.name
+    bus.close()
+    assert not _exists(name)
+
+
+def test_multiprocessing_reader_keeps_bus_alive():
+    with JointStateBus.create(ARM) as bus:
+        bus.publish(np.array([1.0, 2.0, 3.0]))
+        results = multiprocessing.get_context("spawn").Queue()
+        process = multiprocessing.get_context("spawn").Process(
+            target=_attach_and_read, args=(bus.name, results)
+        )
+        process.start()
+        sequence, angles = results.get(timeout=30)
+        process.join(timeout=30)
+        assert process.exitcode == 0
+        assert sequence == 0 and angles == [1.0, 2.0, 3.0]
+        assert _exists(bus.name)
+
+
+def test_unrelated_reader_exit_keeps_bus_alive():
+    with JointStateBus.create(ARM) as bus:
+        bus.publish(np.array([1.0, 2.0, 3.0]))
+        script = (
+            "import sys\n"
+            "from RASW.shm_bus import JointStateBus\n"
+            "reader = JointStateBus.attach(sys.argv[1])\n"
+            "assert reader.read()[0] == 0\n"
+            "reader.close()\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script, bus.name],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            env={**os.environ, "PYTHONPATH": str(SRC)},
+        )
+        assert completed.returncode == 0, completed.stderr
+        assert "leaked shared_memory" not in completed.stderr
+        assert _exists(bus.name)
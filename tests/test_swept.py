@@ -0,0 +1,110 @@
+"""Tests for RASW.collision.swept."""
+
+import numpy as np
+
+from RASW import calculate_fk_batch
+from RASW.collision import Box, Circle, SignedDistanceField, check_swept, swept_motion_bound
+from RASW.collision.sdf import link_sample_points
+
+ARM = [100.0, 50.0]
+BOUNDS = (-200.0, -200.0, 200.0, 200.0)
+# A post at 45 degrees that the stretched arm passes through when it swings
+# from 0 to 90 degrees, but which neither end pose touches
+POST = Circle(70.0 * np.cos(np.pi / 4), 70.0 * np.sin(np.pi / 4), 3.0)
+
+
+def _exact_clearance(obstacles, arm_lengths, angles):
+    """Dense exact clearance of every pose, shape (N,)."""
+    positions, _ = calculate_fk_batch(arm_lengths, np.atleast_2d(angles))
+    points = link_sample_points(positions, 400)
+    return np.min([obstacle.signed_distance(points).min(axis=(-2, -1)) for obstacle in obstacles], axis=0)
+
+
+def _dense_path(joint_angles, samples=2000):
+    t = np.linspace(0.0, 1.0, samples)[:, None, None]
+    return joint_angles[:-1] + t * (joint_angles[1:] - joint_angles[:-1])
+
+
+def test_motion_bound_covers_every_link_point():
+    rng = np.random.default_rng(0)
+    lengths = [100.0, 80.0, 60.0]
+    start = rng.uniform(-180, 180, size=(50, 3))
+    delta = rng.uniform(-30, 30, size=(50, 3))
+    bound = swept_motion_bound(lengths, delta)
+    # Explicit sum over k <= i of |dq_k| (L_k + ... + L_i)
+    turn = np.abs(np.radians(delta))
+    expected = np.stack([
+        sum(turn[:, k] * sum(lengths[k:i + 1]) for k in range(i + 1)) for i in range(3)
+    ], axis=-1)
+    assert np.allclose(bound, expected)
+
+    begin, _ = calculate_fk_batch(lengths, start)
+    t = np.linspace(0.0, 1.0, 200)
+    for s in t:
+        positions, _ = calculate_fk_batch(lengths, start + s * delta)
+        moved = np.linalg.norm(
+            link_sample_points(positions, 20) - link_sample_points(begin, 20), axis=-1
+        ).max(axis=-1)
+        assert np.all(moved <= bound * s + 1e-9)
+
+
+def test_catches_a_post_between_two_clear_poses():
+    field = SignedDistanceField.bake([POST], BOUNDS, 1.0)
+    joint_angles = np.array([[0.0, 0.0], [90.0, 0.0]])
+    assert np.all(_exact_clearance([POST], ARM, joint_angles) > 40.0)
+
+    result = check_swept(field, ARM, joint_angles, samples_per_link=32)
+    assert result.safe.tolist() == [False]
+    assert 0.0 < result.contact_time[0] < 0.5
+    assert result.link[0] == 0
+    # Everything before the contact time really is clear
+    before = joint_angles[0] + np.linspace(0, result.contact_time[0], 200)[:, None] * (
+        joint_angles[1] - joint_angles[0]
+    )
+    assert np.all(_exact_clearance([POST], ARM, before) > 0.0)
+
+
+def test_agrees_with_dense_sampling():
+    obstacles = [POST, Box(-120.0, -60.0, -90.0, 60.0)]
+    field = SignedDistanceField.bake(obstacles, BOUNDS, 1.0)
+    rng = np.random.default_rng(1)
+    joint_angles = np.cumsum(rng.uniform(-40, 40, size=(60, 2)), axis=0)
+    margin = 2.0
+    result = check_swept(field, ARM, joint_angles, margin=margin, samples_per_link=16)
+    exact = np.array([
+        _exact_clearance(obstacles, ARM, segment).min()
+        for segment in _dense_path(joint_angles, 400).transpose(1, 0, 2)
+    ])
+    # Certified segments are really clear, colliding ones are never certified
+    assert np.all(exact[result.safe] >= margin)
+    assert not result.safe[exact < margin].any()
+    assert result.safe.any() and not result.safe.all()
+    assert np.isnan(result.contact_time[result.safe]).all()
+    assert np.all(result.link[result.safe] == -1)
+    unsafe = ~result.safe
+    assert np.all((result.contact_time[unsafe] >= 0) & (result.contact_time[unsafe] <= 1))
+    assert np.all((result.link[unsafe] >= 0) & (result.link[unsafe] < 2))
+
+
+def test_margin_flags_near_misses():
+    field = SignedDistanceField.bake([POST], BOUNDS, 1.0)
+    # Swinging to 40 degrees passes close to the post without touching it
+    joint_angles = np.array([[0.0, 0.0], [40.0, 0.0]])
+    clearance = _exact_clearance([POST], ARM, _dense_path(joint_angles)[:, 0]).min()
+    assert 0.0 < clearance < 10.0
+    assert check_swept(field, ARM, joint_angles, samples_per_link=64).safe[0]
+    assert not check_swept(field, ARM, joint_angles, margin=10.0, samples_per_link=64).safe[0]
+
+
+def test_single_pose_and_iteration_limit():
+    field = SignedDistanceField.bake([POST], BOUNDS, 1.0)
+    result = check_swept(field, ARM, [[0.0, 0.0]])
+    assert result.safe.shape == (0,) and result.iterations == 0
+
+    joint_angles = np.array([[0.0, 0.0], [-60.0, 0.0]])
+    assert check_swept(field, ARM, joint_angles).safe[0]
+    limited = check_swept(field, ARM, joint_angles, max_iterations=1)
+    assert not limited.safe[0] and limited.iterations == 1
+    # One round only gets part of the way along the segment
+    assert 0.0 < limited.contact_time[0] < 1.0
+    assert limited.link[0] >= 0
@@ -0,0 +1,61 @@
+"""Tests for RASW.trajectory."""
+
+import numpy as np
+import pytest
+
+from RASW.trajectory import SplineTrajectory
+
+ARM = [160.0, 160.0, 160.0]
+
+
+def _arc(times, start_deg, end_deg, radius=300.0):
+    angle = np.radians(start_deg + (end_deg - start_deg) * times / times[-1])
+    return radius * np.stack([np.cos(angle), np.sin(angle)], axis=-1)
+
+
+def test_fit_reproduces_samples_within_tolerance():
+    times = np.linspace(0.0, 2.0, 401)
+    angles = np.stack([30 * np.sin(times), 10 * times**2, -20 * np.cos(3 * times)], axis=-1)
+    spline = SplineTrajectory.fit(times, angles, tolerance=0.01)
+    assert np.abs(spline.evaluate(times) - angles).max() <= 0.01
+    assert len(spline.coefficients) < len(times) - 1
+
+
+def test_fit_requires_two_samples():
+    with pytest.raises(ValueError):
+        SplineTrajectory.fit(np.array([0.0]), np.zeros((1, 3)))
+
+
+def test_fit_cartesian_follows_path():
+    times = np.linspace(0.0, 1.0, 101)
+    spline = SplineTrajectory.fit_cartesian(times, _arc(times, 10, 80), ARM)
+    dense = np.linspace(0.0, 1.0, 1001)
+    assert np.abs(spline.end_effector(dense, ARM) - _arc(dense, 10, 80)).max() < 0.5
+
+
+def test_fit_cartesian_crosses_the_180_degree_seam():
+    times = np.linspace(0.0, 1.0, 201)
+    spline = SplineTrajectory.fit_cartesian(times, _arc(times, 150, 210), ARM)
+    dense = np.linspace(0.0, 1.0, 2001)
+    assert np.abs(spline.end_effector(dense, ARM) - _arc(dense, 150, 210)).max() < 0.5
+    # The base joint sweeps 60 degrees in 1 s, never a full turn
+    assert np.abs(spline.velocity(dense)).max() < 120
+
+
+def test_fit_cartesian_reports_unreachable_samples():
+    times = np.linspace(0.0, 1.0, 5)
+    path = np.array([[100.0, 0.0]] * 4 + [[1000.0, 0.0]])
+    with pytest.raises(ValueError, match="sample 4"):
+        SplineTrajectory.fit_cartesian(times, path, ARM)
+
+
+def test_derivatives_match_finite_differences():
+    times = np.linspace(0.0, 1.0, 201)
+    angles = np.stack([np.sin(4 * times), times**3], axis=-1) * 50
+    spline = SplineTrajectory.fit(times, angles, tolerance=1e-4)
+    t = np.linspace(0.1, 0.9, 50)
+    h = 1e-5
+    velocity = (spline.evaluate(t + h) - spline.evaluate(t - h)) / (2 * h)
+    assert np.allclose(spline.velocity(t), velocity, atol=1e-3)
+    acceleration = (spline.velocity(t + h) - spline.velocity(t - h)) / (2 * h)
+    assert np.allclose(spline.acceleration(t), acceleration, atol=1.0)
@@ -0,0 +1,64 @@
+"""Tests for RASW.uncertainty."""
+
+import numpy as np
+import pytest
+
+from RASW import analytic_uncertainty, calculate_fk_batch, monte_carlo_uncertainty
+from RASW.uncertainty import covariance_ellipses
+
+ARM = [160.0, 120.0, 80.0]
+
+
+def test_ellipse_of_axis_aligned_covariance():
+    semi_axes, orientation = covariance_ellipses(np.diag([4.0, 1.0]), confidence=0.95)
+    scale = np.sqrt(-2 * np.log(0.05))
+    assert semi_axes == pytest.approx([2 * scale, scale])
+    assert orientation == pytest.approx(0.0)
+    _, orientation = covariance_ellipses(np.diag([1.0, 4.0]))
+    assert abs(orientation) == pytest.approx(90.0)
+
+
+def test_analytic_mean_is_fk_and_covariance_is_symmetric():
+    angles = np.random.default_rng(0).uniform(-180, 180, size=(100, 3))
+    result, error = analytic_uncertainty(ARM, angles, joint_std=0.5, length_std=[0.1, 0.1, 0.2])
+    assert error is None
+    positions, _ = calculate_fk_batch(ARM, angles)
+    assert np.allclose(result.mean, positions[:, -1])
+    assert np.allclose(result.covariance, np.swapaxes(result.covariance, -1, -2))
+    assert np.all(result.semi_axes[:, 0] >= result.semi_axes[:, 1])
+    assert np.all(result.semi_axes >= 0)
+
+
+def test_length_only_error_is_exact():
+    # A straight arm along x moves its tip only along x, by the summed errors
+    result, _ = analytic_uncertainty(ARM, [[0.0, 0.0, 0.0]], joint_std=0.0, length_std=[1, 2, 2])
+    assert np.allclose(result.covariance[0], [[9.0, 0.0], [0.0, 0.0]])
+
+
+def test_monte_carlo_agrees_with_analytic_for_small_noise():
+    angles = np.random.default_rng(1).uniform(-180, 180, size=(5, 3))
+    analytic, _ = analytic_uncertainty(ARM, angles, joint_std=0.2, length_std=0.05)
+    sampled, error = monte_carlo_uncertainty(
+        ARM, angles, joint_std=0.2, length_std=0.05, samples=40000, seed=0
+    )
+    assert error is None
+    assert np.allclose(sampled.mean, analytic.mean, atol=0.05)
+    assert np.allclose(sampled.semi_axes, analytic.semi_axes, rtol=0.05)
+
+
+def test_monte_carlo_splits_large_batches(monkeypatch):
+    monkeypatch.setattr("RASW.uncertainty.MAX_BATCH_ELEMENTS", 300)
+    angles = np.zeros((7, 3))
+    result, error = monte_carlo_uncertainty(ARM, angles, joint_std=1.0, samples=50, seed=2)
+    assert error is None
+    assert result.covariance.shape == (7, 2, 2)
+    assert np.all(np.isfinite(result.covariance))
+    # Rows were sampled independently, so they differ
+    assert not np.allclose(result.covariance[0], result.covariance[-1])
+
+
+def test_errors():
+    _, error = analytic_uncertainty(ARM, [[0.0, 0.0]], joint_std=1.0)
+    assert error is not None
+    result, error = monte_carlo_uncertainty(ARM, [[0.0, 0.0, 0.0]], joint_std=1.0, samples=1)
+    assert error is not None and result.mean.shape == (0, 2)
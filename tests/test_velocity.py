@@ -0,0 +1,96 @@
+"""Tests for RASW.IK.velocity."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch, calculate_jacobian
+from RASW.IK import ResolvedRateController
+
+ARM = [160.0, 120.0, 80.0]
+START = [30.0, 45.0, -30.0]
+
+
+def test_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        ResolvedRateController(ARM, [0.0, 0.0])
+
+
+def test_state_matches_fk_and_jacobian():
+    controller = ResolvedRateController(ARM, START)
+    positions, _ = calculate_fk_batch(ARM, [START])
+    jacobian, _ = calculate_jacobian(ARM, [START])
+    assert np.allclose(controller.end_effector, positions[0, -1])
+    assert np.allclose(controller.jacobian, jacobian[0])
+
+
+def test_tracks_a_straight_line():
+    controller = ResolvedRateController(ARM, START, damping=1e-4)
+    start = controller.end_effector.copy()
+    velocity = np.array([-50.0, 20.0])
+    dt = 1e-3
+    for tick in range(1, 1001):
+        controller.step(velocity, dt)
+        if tick % 100 == 0:
+            assert np.allclose(controller.end_effector, start + velocity * tick * dt, atol=0.05)
+    positions, _ = calculate_fk_batch(ARM, controller.joint_angles[None])
+    assert np.allclose(positions[0, -1], controller.end_effector)
+
+
+def test_batched_matches_single_arms():
+    starts = np.array([START, [10.0, -60.0, 90.0]])
+    velocities = np.array([[30.0, 0.0], [0.0, -40.0]])
+    batched = ResolvedRateController(ARM, starts)
+    singles = [ResolvedRateController(ARM, start) for start in starts]
+    for _ in range(200):
+        batched.step(velocities, 1e-3)
+        for controller, velocity in zip(singles, velocities):
+            controller.step(velocity, 1e-3)
+    assert np.allclose(batched.joint_angles, [c.joint_angles for c in singles])
+
+
+def _hold_still(damping, duration=2.0, dt=1e-3):
+    rest = np.array([0.0, 60.0, 60.0])
+    controller = ResolvedRateController(
+        ARM, START, damping=damping, rest_angles=rest, null_space_gain=5.0
+    )
+    start = controller.end_effector.copy()
+    distances = []
+    for _ in range(int(round(duration / dt))):
+        controller.step([0.0, 0.0], dt)
+        distances.append(np.linalg.norm(controller.joint_angles - rest))
+    return np.array(distances), np.linalg.norm(controller.end_effector - start)
+
+
+def test_null_space_goal_keeps_the_tool_still():
+    # With the tool held still the single redundant joint can only move the
+    # arm along its self-motion, so the rest pose is approached, not reached
+    distances, drift = _hold_still(1e-4)
+    assert np.all(np.diff(distances) <= 1e-9)
+    assert distances[-1] < distances[0] - 10.0
+    assert drift < 0.5
+    # The damped projection leaks into the tool motion in proportion to lambda^2
+    _, damped_drift = _hold_still(1e-2)
+    assert drift < damped_drift / 10
+
+    still = ResolvedRateController(ARM, START)
+    still.step([0.0, 0.0], 1e-3)
+    assert np.allclose(still.joint_angles, START)
+
+
+def test_speed_and_position_limits():
+    limits = np.array([[-180.0, 180.0], [0.0, 50.0], [-90.0, 90.0]])
+    controller = ResolvedRateController(ARM, START, joint_limits=limits, max_joint_speed=90.0)
+    previous = controller.joint_angles.copy()
+    for _ in range(500):
+        angles = controller.step([-300.0, 300.0], 1e-3)
+        assert np.abs(angles - previous).max() <= 90.0 * 1e-3 + 1e-9
+        previous = angles.copy()
+    assert np.all(controller.joint_angles >= limits[:, 0])
+    assert np.all(controller.joint_angles <= limits[:, 1])
+
+
+def test_damping_bounds_speed_at_a_singularity():
+    controller = ResolvedRateController(ARM, [0.0, 0.0, 0.0])
+    angles = controller.step([100.0, 0.0], 1e-3)
+    assert np.all(np.isfinite(angles))
+    assert np.abs(angles).max() < 1.0
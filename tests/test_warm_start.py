@@ -0,0 +1,86 @@
+"""Tests for RASW.IK.warm_start."""
+
+import numpy as np
+import pytest
+
+from RASW import calculate_fk_batch
+from RASW.IK import WarmStartIndex
+from RASW.IK.inverse_kinematics import IK_OK
+from RASW.IK.numeric import calculate_ik_numeric_batch
+
+ARM = [100.0, 80.0, 60.0, 40.0]
+
+
+def _targets(seed, count):
+    return np.random.default_rng(seed).uniform(-200, 200, size=(count, 2))
+
+
+def test_rejects_capacity_below_one():
+    with pytest.raises(ValueError):
+        WarmStartIndex(ARM, capacity=0)
+
+
+def test_query_finds_nearest_within_one_cell():
+    index = WarmStartIndex(ARM, cell_size=10.0)
+    stored = _targets(0, 2000)
+    index.insert(stored, np.arange(8000.0).reshape(2000, 4))
+    queries = _targets(1, 500)
+    angles, distance = index.query(queries)
+
+    all_distances = np.hypot(*(queries[:, None] - stored[None]).transpose(2, 0, 1))
+    nearest = all_distances.argmin(axis=1)
+    within = all_distances.min(axis=1) <= 10.0
+    assert np.allclose(distance[within], all_distances.min(axis=1)[within])
+    assert np.array_equal(angles[within], np.arange(8000.0).reshape(2000, 4)[nearest[within]])
+
+
+def test_query_empty_index_and_max_distance():
+    index = WarmStartIndex(ARM, cell_size=10.0)
+    angles, distance = index.query([[0.0, 0.0]])
+    assert np.isnan(angles).all() and np.isinf(distance).all()
+    index.insert([[-5.0, -5.0]], [[1.0, 2.0, 3.0, 4.0]])
+    _, distance = index.query([[-4.0, -5.0]])
+    assert distance[0] == pytest.approx(1.0)
+    angles, distance = index.query([[-4.0, -5.0]], max_distance=0.5)
+    assert np.isnan(angles).all() and np.isinf(distance).all()
+
+
+def test_skips_failed_solves_and_evicts_least_recently_used():
+    index = WarmStartIndex(ARM, capacity=3, cell_size=1.0)
+    index.insert([[0.0, 0.0], [10.0, 0.0], [20.0, 0.0], [30.0, 0.0]],
+                 [[1.0] * 4, [np.nan] * 4, [2.0] * 4, [3.0] * 4])
+    assert len(index) == 3
+    index.query([[0.0, 0.0]])  # Touch the first entry
+    index.insert([[40.0, 0.0]], [[4.0] * 4])
+    angles, _ = index.query([[0.0, 0.0], [20.0, 0.0], [30.0, 0.0], [40.0, 0.0]])
+    assert angles[0, 0] == 1.0
+    assert np.isnan(angles[1, 0])
+    assert angles[2:, 0].tolist() == [3.0, 4.0]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = WarmStartIndex(ARM, capacity=100)
+    stored = _targets(2, 50)
+    index.insert(stored, np.tile(np.arange(4.0), (50, 1)))
+    index.save(tmp_path / "index.npz")
+    loaded = WarmStartIndex.load(tmp_path / "index.npz")
+    assert len(loaded) == 50 and loaded.matches(ARM)
+    queries = _targets(3, 20)
+    assert np.array_equal(loaded.query(queries)[1], index.query(queries)[1])
+
+
+def test_numeric_solver_seeds_from_and_records_into_index():
+    index = WarmStartIndex(ARM)
+    targets = _targets(4, 300) * 0.8
+    first, status = calculate_ik_numeric_batch(targets, ARM, warm_start=index)
+    assert len(index) == int((status == IK_OK).sum())
+    again, status_again = calculate_ik_numeric_batch(targets + 0.01, ARM, warm_start=index)
+    ok = status_again == IK_OK
+    positions, _ = calculate_fk_batch(ARM, again[ok])
+    assert np.abs(positions[:, -1] - (targets + 0.01)[ok]).max() < 1e-5
+    # Seeded from nearby solutions, the new ones stay on the same branch
+    both = ok & (status == IK_OK)
+    assert np.abs(again[both] - first[both]).max() < 1.0
+
+    with pytest.raises(ValueError):
+        calculate_ik_numeric_batch(targets, [1.0, 1.0, 1.0, 1.0], warm_start=index)